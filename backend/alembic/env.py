@@ -0,0 +1,63 @@
+from logging.config import fileConfig
+
+from alembic import context
+from app import models  # noqa: F401  모든 테이블을 메타데이터에 등록
+from app.core.config import get_settings
+from app.db.database import to_sync_url
+from sqlalchemy import engine_from_config, pool
+from sqlmodel import SQLModel
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# alembic.ini 대신 앱 설정의 DATABASE_URL 사용 (-x url=... 로 덮어쓸 수 있음)
+url = context.get_x_argument(as_dictionary=True).get("url") or to_sync_url(
+    get_settings().DATABASE_URL
+)
+config.set_main_option("sqlalchemy.url", url.replace("%", "%%"))
+
+target_metadata = SQLModel.metadata
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL 스크립트만 출력"""
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=url.startswith("sqlite"),
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """DB에 연결해 마이그레이션 실행"""
+    connectable = config.attributes.get("connection")
+    if connectable is None:
+        connectable = engine_from_config(
+            config.get_section(config.config_ini_section, {}),
+            prefix="sqlalchemy.",
+            poolclass=pool.NullPool,
+        )
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite는 ALTER TABLE 지원이 제한적이라 batch 모드 사용
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
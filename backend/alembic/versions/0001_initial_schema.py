@@ -0,0 +1,185 @@
+"""initial schema
+
+마이그레이션 도입 전 create_all로 만들던 스키마 그대로. 그 시절 만든 DB는
+`alembic stamp 0001` 후 `alembic upgrade head`로 이어서 적용한다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 19:43:46.225310
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("email", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("timezone", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column(
+            "hashed_password", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column("settings", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
+
+    op.create_table(
+        "ai_feedbacks",
+        sa.Column("id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("feedback_text", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column(
+            "feedback_type",
+            sa.Enum(
+                "DAILY_SUMMARY",
+                "WEEKLY_REPORT",
+                "EMOTION_ANALYSIS",
+                "PRODUCTIVITY_INSIGHT",
+                "CUSTOM",
+                name="feedbacktype",
+            ),
+            nullable=False,
+        ),
+        sa.Column("sentiment_score", sa.Float(), nullable=True),
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("ai_metadata", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_ai_feedbacks_id"), "ai_feedbacks", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_ai_feedbacks_user_id"), "ai_feedbacks", ["user_id"], unique=False
+    )
+
+    op.create_table(
+        "emotion_records",
+        sa.Column("id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("emotion_level", sa.Integer(), nullable=False),
+        sa.Column(
+            "emotion_type",
+            sa.Enum(
+                "HAPPY",
+                "SAD",
+                "ANXIOUS",
+                "CALM",
+                "EXCITED",
+                "ANGRY",
+                "NEUTRAL",
+                name="emotiontype",
+            ),
+            nullable=False,
+        ),
+        sa.Column("note", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("recorded_at", sa.DateTime(), nullable=False),
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("ai_analysis", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_emotion_records_id"), "emotion_records", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_emotion_records_user_id"), "emotion_records", ["user_id"], unique=False
+    )
+
+    op.create_table(
+        "focus_sessions",
+        sa.Column("id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("start_time", sa.DateTime(), nullable=False),
+        sa.Column("end_time", sa.DateTime(), nullable=True),
+        sa.Column("duration_minutes", sa.Integer(), nullable=False),
+        sa.Column(
+            "session_type",
+            sa.Enum("POMODORO", "DEEP_WORK", "BREAK", "CUSTOM", name="sessiontype"),
+            nullable=False,
+        ),
+        sa.Column("productivity_rating", sa.Integer(), nullable=True),
+        sa.Column("notes", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_focus_sessions_id"), "focus_sessions", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_focus_sessions_user_id"), "focus_sessions", ["user_id"], unique=False
+    )
+
+    op.create_table(
+        "todo_items",
+        sa.Column("id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("title", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("description", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("completed", sa.Boolean(), nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("due_date", sa.DateTime(), nullable=True),
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_todo_items_id"), "todo_items", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_todo_items_user_id"), "todo_items", ["user_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_todo_items_user_id"), table_name="todo_items")
+    op.drop_index(op.f("ix_todo_items_id"), table_name="todo_items")
+
+    op.drop_table("todo_items")
+    op.drop_index(op.f("ix_focus_sessions_user_id"), table_name="focus_sessions")
+    op.drop_index(op.f("ix_focus_sessions_id"), table_name="focus_sessions")
+
+    op.drop_table("focus_sessions")
+    op.drop_index(op.f("ix_emotion_records_user_id"), table_name="emotion_records")
+    op.drop_index(op.f("ix_emotion_records_id"), table_name="emotion_records")
+
+    op.drop_table("emotion_records")
+    op.drop_index(op.f("ix_ai_feedbacks_user_id"), table_name="ai_feedbacks")
+    op.drop_index(op.f("ix_ai_feedbacks_id"), table_name="ai_feedbacks")
+
+    op.drop_table("ai_feedbacks")
+    op.drop_index(op.f("ix_users_id"), table_name="users")
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+
+    op.drop_table("users")
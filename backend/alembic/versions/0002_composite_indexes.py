@@ -0,0 +1,65 @@
+"""composite indexes for hot queries
+
+목록(키셋 페이지네이션)/기간 조회가 user_id로 거른 뒤 시간순으로 정렬하므로
+(user_id, 시간 DESC, id DESC) 형태의 복합 인덱스를 추가한다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 19:52:10.118402
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_emotion_records_user_recorded_at",
+        "emotion_records",
+        ["user_id", sa.text("recorded_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_focus_sessions_user_start_time",
+        "focus_sessions",
+        ["user_id", sa.text("start_time DESC"), sa.text("id DESC")],
+    )
+    # 진행 중인 세션만 담는 부분 인덱스
+    op.create_index(
+        "ix_focus_sessions_user_open",
+        "focus_sessions",
+        ["user_id", sa.text("start_time DESC")],
+        sqlite_where=sa.text("end_time IS NULL"),
+        postgresql_where=sa.text("end_time IS NULL"),
+    )
+    op.create_index(
+        "ix_todo_items_user_list_order",
+        "todo_items",
+        [
+            "user_id",
+            "completed",
+            sa.text("priority DESC"),
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+    )
+    op.create_index(
+        "ix_ai_feedbacks_user_created_at",
+        "ai_feedbacks",
+        ["user_id", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ai_feedbacks_user_created_at", table_name="ai_feedbacks")
+    op.drop_index("ix_todo_items_user_list_order", table_name="todo_items")
+    op.drop_index("ix_focus_sessions_user_open", table_name="focus_sessions")
+    op.drop_index("ix_focus_sessions_user_start_time", table_name="focus_sessions")
+    op.drop_index("ix_emotion_records_user_recorded_at", table_name="emotion_records")
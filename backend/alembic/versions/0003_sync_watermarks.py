@@ -0,0 +1,70 @@
+"""sync watermarks and tombstones
+
+동기화 델타 조회를 위해 (user_id, updated_at) 인덱스를 추가하고, 비어 있던
+기존 행의 updated_at은 created_at으로 채운다. 새 행은 모델 기본값으로 채워진다.
+NOT NULL 변경은 SQLite에서 테이블 재생성(DESC 인덱스 방향 유실)이 필요하므로
+하지 않는다. 삭제는 tombstones 테이블에 남긴다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 21:05:37.402118
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# updated_at을 가진 테이블 (BaseModel 상속)
+BASE_TABLES = (
+    "users",
+    "emotion_records",
+    "focus_sessions",
+    "todo_items",
+    "ai_feedbacks",
+)
+# 동기화 대상 테이블
+SYNC_TABLES = ("emotion_records", "focus_sessions", "todo_items", "ai_feedbacks")
+
+
+def upgrade() -> None:
+    for table in BASE_TABLES:
+        op.execute(
+            f"UPDATE {table} SET updated_at = created_at WHERE updated_at IS NULL"
+        )
+
+    for table in SYNC_TABLES:
+        op.create_index(f"ix_{table}_user_updated_at", table, ["user_id", "updated_at"])
+
+    op.create_table(
+        "tombstones",
+        sa.Column("record_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column(
+            "entity",
+            sa.Enum("EMOTION", "FOCUS_SESSION", "TODO", "FEEDBACK", name="syncentity"),
+            nullable=False,
+        ),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("record_id"),
+    )
+    op.create_index(
+        "ix_tombstones_user_deleted_at", "tombstones", ["user_id", "deleted_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tombstones_user_deleted_at", table_name="tombstones")
+    op.drop_table("tombstones")
+    sa.Enum(name="syncentity").drop(op.get_bind(), checkfirst=True)
+
+    for table in reversed(SYNC_TABLES):
+        op.drop_index(f"ix_{table}_user_updated_at", table_name=table)
@@ -0,0 +1,57 @@
+"""daily feedback jobs
+
+시간대별 일일 피드백 스케줄러의 사용자별 작업 상태 테이블.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 22:10:12.583901
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "feedback_jobs",
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("local_date", sa.Date(), nullable=False),
+        sa.Column("due_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "PENDING",
+                "RUNNING",
+                "DONE",
+                "SKIPPED",
+                "FAILED",
+                name="feedbackjobstatus",
+            ),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("claimed_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("feedback_id", sqlmodel.sql.sqltypes.GUID(), nullable=True),
+        sa.Column("error", sqlmodel.sql.sqltypes.AutoString(length=500), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id", "local_date"),
+    )
+    op.create_index(
+        "ix_feedback_jobs_status_due_at", "feedback_jobs", ["status", "due_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_feedback_jobs_status_due_at", table_name="feedback_jobs")
+    op.drop_table("feedback_jobs")
+    sa.Enum(name="feedbackjobstatus").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,42 @@
+"""feedback input fingerprint
+
+같은 입력으로 만든 피드백을 재사용하기 위한 입력 지문 컬럼과 조회 인덱스.
+기존 행은 지문이 없으므로 재사용 대상이 아니다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 22:48:51.207614
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "ai_feedbacks",
+        sa.Column(
+            "input_fingerprint",
+            sqlmodel.sql.sqltypes.AutoString(length=64),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_ai_feedbacks_user_fingerprint",
+        "ai_feedbacks",
+        ["user_id", "input_fingerprint", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ai_feedbacks_user_fingerprint", table_name="ai_feedbacks")
+    op.drop_column("ai_feedbacks", "input_fingerprint")
@@ -0,0 +1,60 @@
+"""daily stats rollup
+
+일간 통계 롤업 테이블과 할 일 통계 집계용 (user_id, completed, due_date) 인덱스.
+기존 기록은 적용 후 `python -m app.cli rebuild-stats`로 백필한다.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 23:41:02.513870
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_user_stats",
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("happy_count", sa.Integer(), nullable=False),
+        sa.Column("sad_count", sa.Integer(), nullable=False),
+        sa.Column("anxious_count", sa.Integer(), nullable=False),
+        sa.Column("calm_count", sa.Integer(), nullable=False),
+        sa.Column("excited_count", sa.Integer(), nullable=False),
+        sa.Column("angry_count", sa.Integer(), nullable=False),
+        sa.Column("neutral_count", sa.Integer(), nullable=False),
+        sa.Column("emotion_level_sum", sa.Integer(), nullable=False),
+        sa.Column("focus_sessions", sa.Integer(), nullable=False),
+        sa.Column("focus_minutes", sa.Integer(), nullable=False),
+        sa.Column("focus_rated_sessions", sa.Integer(), nullable=False),
+        sa.Column("focus_rating_sum", sa.Integer(), nullable=False),
+        sa.Column("pomodoro_minutes", sa.Integer(), nullable=False),
+        sa.Column("deep_work_minutes", sa.Integer(), nullable=False),
+        sa.Column("break_minutes", sa.Integer(), nullable=False),
+        sa.Column("custom_minutes", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "day"),
+    )
+    op.create_index(
+        "ix_todo_items_user_completed_due",
+        "todo_items",
+        ["user_id", "completed", "due_date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_todo_items_user_completed_due", table_name="todo_items")
+    op.drop_table("daily_user_stats")
@@ -0,0 +1,64 @@
+from typing import Any, List, Sequence, Tuple, Type
+
+from app.db.database import DBSession
+from app.schemas.bulk import BulkCreatedItem, BulkCreateResponse, BulkItemError
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import insert
+
+
+def validate_bulk_items(
+    schema: Type[Any], items: Sequence[Any], atomic: bool
+) -> Tuple[List[Tuple[int, Any]], List[BulkItemError]]:
+    """항목별 검증 (atomic이면 하나라도 실패 시 전체를 422로 거부)"""
+    valid, errors = [], []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema.model_validate(item)))
+        except ValidationError as e:
+            errors.append(
+                BulkItemError(
+                    index=index,
+                    errors=[
+                        {
+                            "loc": error["loc"],
+                            "msg": error["msg"],
+                            "type": error["type"],
+                        }
+                        for error in e.errors(include_url=False)
+                    ],
+                )
+            )
+
+    if atomic and errors:
+        raise HTTPException(
+            status_code=422,
+            detail=[error.model_dump() for error in errors],
+        )
+    return valid, errors
+
+
+async def insert_records(db: DBSession, records: Sequence[Any]):
+    """ORM 객체들을 INSERT 한 번으로 저장 (refresh 없이 id는 미리 생성된 값 사용)"""
+    if not records:
+        return
+    table = type(records[0]).__table__
+    rows = [
+        {column.key: getattr(record, column.key) for column in table.columns}
+        for record in records
+    ]
+    await db.execute(insert(table).values(rows))
+
+
+def bulk_create_response(
+    valid: Sequence[Tuple[int, Any]],
+    records: Sequence[Any],
+    errors: List[BulkItemError],
+) -> BulkCreateResponse:
+    return BulkCreateResponse(
+        created=[
+            BulkCreatedItem(index=index, id=record.id)
+            for (index, _), record in zip(valid, records)
+        ],
+        errors=errors,
+    )
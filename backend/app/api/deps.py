@@ -1,31 +1,54 @@
-from typing import Generator
+from typing import AsyncGenerator
 
 from app.core.config import get_settings
+from app.core.executors import run_io_bound
 from app.core.security import decode_token
-from app.db.database import get_session  # engine으로 변경
-from app.models.user import User
+from app.db.database import (
+    USE_ASYNC_ENGINE,
+    DBSession,
+    OffloadedSession,
+    get_async_session,
+    get_session,
+)
+from app.models.user import CurrentUser, User
+from app.services.user_cache import (
+    from_cache_entry,
+    get_user_cache,
+    to_cache_entry,
+    user_cache_key,
+)
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 settings = get_settings()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-def get_db() -> Generator:
-    """데이터베이스 세션 의존성"""
-    db = next(get_session())
-    try:
-        yield db
-    finally:
-        db.close()
+async def get_offloaded_db(
+    session: Session = Depends(get_session),
+) -> AsyncGenerator[OffloadedSession, None]:
+    """동기 엔진 세션 의존성 (DB I/O는 I/O 풀에서 실행)"""
+    yield OffloadedSession(session)
+
+
+async def get_async_db(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncGenerator[AsyncSession, None]:
+    """비동기 엔진 세션 의존성"""
+    yield session
+
+
+# 데이터베이스 세션 의존성 (DATABASE_URL 스킴으로 모드 선택)
+get_db = get_async_db if USE_ASYNC_ENGINE else get_offloaded_db
 
 
 async def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
-    """현재 인증된 사용자 가져오기"""
+    db: DBSession = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> CurrentUser:
+    """현재 인증된 사용자 가져오기 (캐시에 있으면 DB 조회 생략)"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -36,19 +59,50 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    user = db.exec(select(User).where(User.id == user_id)).first()
+    cache = get_user_cache()
+    key = user_cache_key(user_id)
+    entry = cache.get_local(key)
+    if entry is None:
+        # Redis 조회는 네트워크 I/O이므로 이벤트 루프 밖에서 실행
+        entry = await run_io_bound(cache.get, key) if cache.remote else cache.get(key)
+    if entry is not None:
+        return from_cache_entry(entry)
+
+    result = await db.exec(select(User).where(User.id == user_id))
+    user = result.first()
     if user is None:
         raise credentials_exception
 
-    return user
+    entry = to_cache_entry(user)
+    if cache.remote is not None:
+        await run_io_bound(cache.set, key, entry)
+    else:
+        cache.set(key, entry)
+    return from_cache_entry(entry)
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user),
+) -> CurrentUser:
     """활성 사용자만 허용"""
     if not current_user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
         )
     return current_user
+
+
+async def get_current_user_record(
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
+) -> User:
+    """설정 조회/수정처럼 전체 사용자 행이 필요한 엔드포인트용"""
+    result = await db.exec(select(User).where(User.id == current_user.id))
+    user = result.first()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
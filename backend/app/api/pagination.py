@@ -0,0 +1,100 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+
+from fastapi import HTTPException, Response
+from sqlalchemy import and_, literal, or_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class SortKey(NamedTuple):
+    """키셋 페이지네이션 정렬 키 (마지막 키는 id 같은 유일한 값이어야 함)"""
+
+    column: Any
+    descending: bool = False
+    parse: Callable[[Any], Any] = lambda value: value
+
+
+def parse_bool(value: Any) -> bool:
+    """불리언 정렬 키 값 (bool("false")처럼 문자열이 참이 되지 않도록 JSON 불리언만 허용)"""
+    if not isinstance(value, bool):
+        raise ValueError("cursor value must be a boolean")
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값을 불투명한 커서 문자열로 변환"""
+    payload = json.dumps([_to_json(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[SortKey]) -> List[Any]:
+    """커서를 정렬 키 값으로 복원 (형식이 맞지 않으면 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor length mismatch")
+        if not all(isinstance(value, (bool, int, float, str)) for value in values):
+            raise ValueError("cursor values must be scalars")
+        return [key.parse(value) for key, value in zip(keys, values)]
+    except (binascii.Error, UnicodeDecodeError, AttributeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def order_by_keys(keys: Sequence[SortKey]) -> List[Any]:
+    return [key.column.desc() if key.descending else key.column for key in keys]
+
+
+def after_cursor(keys: Sequence[SortKey], values: Sequence[Any]):
+    """정렬 순서상 커서 다음에 오는 행 조건
+
+    정렬 방향이 섞여 있어도 쓸 수 있도록 튜플 비교 대신
+    (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ... 형태로 만든다.
+    """
+    # True/False는 그대로 비교 연산에 쓸 수 없어 컬럼 타입의 바인드 값으로 감쌈
+    bound = [literal(value, key.column.type) for key, value in zip(keys, values)]
+    clauses = []
+    for i, key in enumerate(keys):
+        equal = [keys[j].column == bound[j] for j in range(i)]
+        beyond = key.column < bound[i] if key.descending else key.column > bound[i]
+        clauses.append(and_(*equal, beyond))
+
+    # 첫 키의 범위 조건을 함께 걸어 인덱스 범위 탐색이 가능하도록 함
+    first = keys[0]
+    start = first.column <= bound[0] if first.descending else first.column >= bound[0]
+    return and_(start, or_(*clauses))
+
+
+def paginate(
+    query, keys: Sequence[SortKey], cursor: Optional[str], skip: int, limit: int
+):
+    """커서가 있으면 키셋, 없으면 기존 offset 방식으로 페이지 조회"""
+    query = query.order_by(*order_by_keys(keys))
+    if cursor:
+        query = query.where(after_cursor(keys, decode_cursor(cursor, keys)))
+    else:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def set_next_cursor(
+    response: Response, rows: Sequence[Any], keys: Sequence[SortKey], limit: int
+):
+    """페이지가 가득 찼으면 다음 페이지 커서를 응답 헤더에 추가"""
+    if len(rows) < limit:
+        return
+    last = rows[-1]
+    response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+        [getattr(last, key.column.key) for key in keys]
+    )
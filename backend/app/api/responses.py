@@ -0,0 +1,26 @@
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Type
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[Any]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def model_list_response(
+    model: Type[Any], rows: Sequence[Any], response: Optional[Response] = None
+) -> ORJSONResponse:
+    """ORM 행 목록을 읽기 모델로 한 번만 검증해 바로 직렬화
+
+    응답 객체를 직접 반환하므로 FastAPI의 response_model 재검증을 건너뛴다.
+    response_model은 문서(OpenAPI)용으로 그대로 둔다. 의존성으로 받은
+    Response에 설정한 헤더(다음 페이지 커서 등)는 함께 옮긴다.
+    """
+    adapter = _list_adapter(model)
+    items = adapter.validate_python(rows, from_attributes=True)
+    headers = dict(response.headers) if response is not None else None
+    return ORJSONResponse(adapter.dump_python(items), headers=headers)
@@ -1,4 +1,4 @@
-from app.api.v1.endpoints import ai, auth, emotions, focus, todos
+from app.api.v1.endpoints import ai, auth, emotions, focus, sync, todos
 from fastapi import APIRouter
 
 api_router = APIRouter()
@@ -9,3 +9,4 @@ api_router.include_router(emotions.router, prefix="/emotions", tags=["emotions"]
 api_router.include_router(focus.router, prefix="/focus", tags=["focus"])
 api_router.include_router(todos.router, prefix="/todos", tags=["todos"])
 api_router.include_router(ai.router, prefix="/ai", tags=["ai"])
+api_router.include_router(sync.router, prefix="/sync", tags=["sync"])
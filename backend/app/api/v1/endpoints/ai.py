@@ -1,13 +1,20 @@
 import json
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import AsyncIterator, Optional, Tuple
 
-from app.api.deps import get_current_active_user, get_db
-from app.models.feedback import AIFeedback, AIFeedbackRead
-from app.models.user import User, UserSettings
-from app.services.ai_service import AIBackgroundService, AIService
+from app.api.deps import get_current_active_user, get_current_user_record, get_db
+from app.api.responses import model_list_response
+from app.core.config import get_settings
+from app.db.database import DBSession
+from app.models.feedback import AIFeedback, AIFeedbackRead, FeedbackType
+from app.models.user import CurrentUser, User, UserSettings
+from app.services.ai_providers import AIDependencyError, openai_dependency
+from app.services.ai_service import AIBackgroundService, AIService, feedback_fingerprint
+from app.services.emotion_batcher import get_emotion_batcher
+from app.services.openai_pool import get_openai_pool
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from sqlmodel import Session, select
+from fastapi.responses import StreamingResponse
+from sqlmodel import select
 
 router = APIRouter()
 
@@ -15,19 +22,19 @@ router = APIRouter()
 @router.post("/settings")
 async def update_ai_settings(
     settings: UserSettings,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_record),
 ):
     """AI 설정 업데이트 (API 키 등)"""
     current_user.update_settings(settings.dict(exclude_none=True))
     db.add(current_user)
-    db.commit()
+    await db.commit()
 
     return {"message": "AI  설정이 업데이트되었습니다"}
 
 
 @router.get("/settings", response_model=UserSettings)
-async def get_ai_settings(current_user: User = Depends(get_current_active_user)):
+async def get_ai_settings(current_user: User = Depends(get_current_user_record)):
     """현재 AI 설정 조회"""
     settings = current_user.get_settings()
     return UserSettings(
@@ -41,130 +48,299 @@ async def get_ai_settings(current_user: User = Depends(get_current_active_user))
 async def analyze_emotion(
     text: str,
     background_tasks: BackgroundTasks,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
     """텍스트 감정 분석 (HuggingFace)"""
-    ai_service = AIService()
-
     try:
-        result = ai_service.analyze_emotion_text(text)
+        result = await get_emotion_batcher().analyze(text)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/generate-feedback")
-async def generate_feedback(
-    feedback_type: Optional[str] = "daily_summary",
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
-):
-    """AI 피드백 생성 (OpenAI GPT)"""
-    settings = current_user.get_settings()
-    api_key = settings.get("openai_api_key")
-
+def _feedback_api_key(current_user: User) -> str:
+    api_key = current_user.get_settings().get("openai_api_key")
     if not api_key:
         raise HTTPException(
             status_code=400,
             detail="OpenAI API  키가 설정되지 않았습니다. 설정에서 API 키를 입력해주세요.",
         )
+    return api_key
 
-    # 데이터 수집 (최근 7일)
+
+def _feedback_type(value: Optional[str]) -> FeedbackType:
+    try:
+        return FeedbackType(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="지원하지 않는 피드백 유형입니다")
+
+
+async def _feedback_inputs(
+    db: DBSession, current_user: User
+) -> Tuple[list, list, list]:
+    """피드백 입력 데이터 수집 (최근 7일)
+
+    요약이 행 순서에 따라 달라지지 않도록 정렬해서 가져온다.
+    """
     week_ago = datetime.utcnow() - timedelta(days=7)
 
     from app.models.emotion import EmotionRecord
     from app.models.focus import FocusSession
     from app.models.todo import TodoItem
 
-    emotions = db.exec(
-        select(EmotionRecord).where(
-            EmotionRecord.user_id == current_user.id,
-            EmotionRecord.recorded_at >= week_ago,
+    emotions = (
+        await db.exec(
+            select(EmotionRecord)
+            .where(
+                EmotionRecord.user_id == current_user.id,
+                EmotionRecord.recorded_at >= week_ago,
+            )
+            .order_by(EmotionRecord.recorded_at, EmotionRecord.id)
         )
     ).all()
 
-    sessions = db.exec(
-        select(FocusSession).where(
-            FocusSession.user_id == current_user.id, FocusSession.start_time >= week_ago
+    sessions = (
+        await db.exec(
+            select(FocusSession)
+            .where(
+                FocusSession.user_id == current_user.id,
+                FocusSession.start_time >= week_ago,
+            )
+            .order_by(FocusSession.start_time, FocusSession.id)
         )
     ).all()
 
-    todos = db.exec(select(TodoItem).where(TodoItem.user_id == current_user.id)).all()
+    todos = (
+        await db.exec(
+            select(TodoItem)
+            .where(TodoItem.user_id == current_user.id)
+            .order_by(TodoItem.created_at, TodoItem.id)
+        )
+    ).all()
+
+    return emotions, sessions, todos
+
+
+async def _reusable_feedback(
+    db: DBSession, current_user: User, fingerprint: str
+) -> Optional[AIFeedback]:
+    """FEEDBACK_REUSE_WINDOW_SECONDS 이내에 같은 입력으로 만든 피드백"""
+    reuse_window = get_settings().FEEDBACK_REUSE_WINDOW_SECONDS
+    if reuse_window <= 0:
+        return None
+    return (
+        await db.exec(
+            select(AIFeedback)
+            .where(
+                AIFeedback.user_id == current_user.id,
+                AIFeedback.input_fingerprint == fingerprint,
+                AIFeedback.created_at
+                >= datetime.utcnow() - timedelta(seconds=reuse_window),
+            )
+            .order_by(AIFeedback.created_at.desc())
+            .limit(1)
+        )
+    ).first()
 
+
+def _user_feedback(
+    current_user: User, text: str, feedback_type: FeedbackType, fingerprint: str
+) -> AIFeedback:
+    return AIFeedback(
+        user_id=current_user.id,
+        feedback_text=text,
+        feedback_type=feedback_type,
+        input_fingerprint=fingerprint,
+        ai_metadata=json.dumps(
+            {
+                "generated_at": datetime.utcnow().isoformat(),
+                "requested_by": "user",
+                "input_fingerprint": fingerprint,
+            }
+        ),
+    )
+
+
+@router.post("/generate-feedback")
+async def generate_feedback(
+    feedback_type: Optional[str] = "daily_summary",
+    force: bool = False,
+    db: DBSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_record),
+):
+    """AI 피드백 생성 (OpenAI GPT)
+
+    입력 요약과 유형이 최근 피드백과 같으면 GPT를 다시 호출하지 않고 그
+    피드백을 돌려준다 (FEEDBACK_REUSE_WINDOW_SECONDS 이내, force=true면 항상 생성).
+    """
+    api_key = _feedback_api_key(current_user)
+    feedback_type = _feedback_type(feedback_type)
+
+    emotions, sessions, todos = await _feedback_inputs(db, current_user)
     ai_service = AIService()
+    summaries = ai_service.summarize_inputs(emotions, sessions, todos)
+    fingerprint = feedback_fingerprint(summaries, feedback_type)
+
+    if not force:
+        cached = await _reusable_feedback(db, current_user, fingerprint)
+        if cached:
+            return {
+                "feedback": cached.feedback_text,
+                "generated_at": cached.created_at.isoformat(),
+                "cached": True,
+            }
 
     try:
-        feedback_text = ai_service.generate_feedback_with_gpt(
-            api_key, current_user.name, emotions, sessions, todos, feedback_type
+        feedback_text = await ai_service.generate_feedback_with_gpt(
+            api_key,
+            current_user.name,
+            emotions,
+            sessions,
+            todos,
+            feedback_type,
+            summaries=summaries,
         )
 
         if feedback_text:
             # 피드백 저장
-            feedback = AIFeedback(
-                user_id=current_user.id,
-                feedback_text=feedback_text,
-                feedback_type=feedback_type,
-                ai_metadata=json.dumps(
-                    {
-                        "generated_at": datetime.utcnow().isoformat(),
-                        "requested_by": "user",
-                    }
-                ),
+            db.add(
+                _user_feedback(current_user, feedback_text, feedback_type, fingerprint)
             )
-            db.add(feedback)
-            db.commit()
+            await db.commit()
 
             return {
                 "feedback": feedback_text,
                 "generated_at": datetime.utcnow().isoformat(),
+                "cached": False,
             }
         else:
             raise HTTPException(status_code=500, detail="피드백 생성에 실패했습니다")
 
+    except AIDependencyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"피드백 생성 중 오류: {str(e)}")
 
 
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.get("/generate-feedback/stream")
+async def stream_feedback(
+    feedback_type: Optional[str] = "daily_summary",
+    force: bool = False,
+    db: DBSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_record),
+):
+    """AI 피드백 스트리밍 생성 (Server-Sent Events)
+
+    생성되는 텍스트를 `delta` 이벤트로 바로 보내고, 끝나면 피드백을 저장한 뒤
+    `done` 이벤트를 보낸다. 실패하면 `error` 이벤트로 끝난다. 클라이언트가
+    연결을 끊으면 OpenAI 요청도 중단되고 아무것도 저장하지 않는다.
+    """
+    api_key = _feedback_api_key(current_user)
+    feedback_type = _feedback_type(feedback_type)
+    try:
+        openai_dependency.load()
+    except AIDependencyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    emotions, sessions, todos = await _feedback_inputs(db, current_user)
+    ai_service = AIService()
+    summaries = ai_service.summarize_inputs(emotions, sessions, todos)
+    fingerprint = feedback_fingerprint(summaries, feedback_type)
+    cached = None if force else await _reusable_feedback(db, current_user, fingerprint)
+    user_name = current_user.name
+    # 스트리밍 동안 DB 커넥션을 잡고 있지 않도록 반납 (저장할 때 다시 사용)
+    await db.close()
+
+    async def events() -> AsyncIterator[str]:
+        if cached:
+            yield _sse("delta", {"text": cached.feedback_text})
+            yield _sse(
+                "done",
+                {
+                    "feedback_id": str(cached.id),
+                    "generated_at": cached.created_at.isoformat(),
+                    "cached": True,
+                },
+            )
+            return
+
+        parts = []
+        chunks = ai_service.stream_feedback_with_gpt(
+            api_key, user_name, summaries, feedback_type
+        )
+        try:
+            async for text in chunks:
+                parts.append(text)
+                yield _sse("delta", {"text": text})
+        except ValueError as e:
+            yield _sse("error", {"detail": str(e)})
+            return
+        finally:
+            await chunks.aclose()
+
+        feedback_text = "".join(parts)
+        if not feedback_text:
+            yield _sse("error", {"detail": "피드백 생성에 실패했습니다"})
+            return
+        feedback = _user_feedback(
+            current_user, feedback_text, feedback_type, fingerprint
+        )
+        db.add(feedback)
+        await db.commit()
+        yield _sse(
+            "done",
+            {
+                "feedback_id": str(feedback.id),
+                "generated_at": datetime.utcnow().isoformat(),
+                "cached": False,
+            },
+        )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # 프록시(nginx 등)가 응답을 모았다 보내지 않도록
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/feedbacks", response_model=list[AIFeedbackRead])
 async def get_feedbacks(
     limit: int = 10,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
     """AI 피드백 목록 조회"""
-    feedbacks = db.exec(
+    result = await db.exec(
         select(AIFeedback)
         .where(AIFeedback.user_id == current_user.id)
         .order_by(AIFeedback.created_at.desc())
         .limit(limit)
-    ).all()
+    )
+    feedbacks = result.all()
 
-    return [
-        AIFeedbackRead(
-            id=str(f.id),
-            user_id=str(f.user_id),
-            feedback_text=f.feedback_text,
-            feedback_type=f.feedback_type,
-            sentiment_score=f.sentiment_score,
-            ai_metadata=f.ai_metadata,
-            created_at=f.created_at,
-        )
-        for f in feedbacks
-    ]
+    return model_list_response(AIFeedbackRead, feedbacks)
 
 
 @router.post("/test-api-key")
 async def test_api_key(
-    api_key: str, current_user: User = Depends(get_current_active_user)
+    api_key: str, current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """OpenAI API 키 테스트"""
-    import openai
+    try:
+        openai = openai_dependency.load()
+    except AIDependencyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
     try:
-        client = openai.OpenAI(api_key=api_key)
-        response = client.chat.completions.create(
+        response = await get_openai_pool().chat_completion(
+            api_key,
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": "Hello"}],
             max_tokens=5,
@@ -2,24 +2,34 @@ from datetime import timedelta
 
 from app.api.deps import get_current_user, get_db
 from app.core.config import get_settings
+from app.core.executors import PoolSaturatedError
 from app.core.security import create_access_token, create_refresh_token, decode_token
-from app.models.user import User, UserCreate, UserRead
+from app.db.database import DBSession
+from app.models.user import CurrentUser, UserCreate, UserRead
 from app.schemas.auth import LoginRequest, RefreshTokenRequest, RegisterRequest, Token
 from app.services.user_service import UserService
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
 
 settings = get_settings()
 router = APIRouter()
 
 
+def password_pool_busy(error: PoolSaturatedError) -> HTTPException:
+    """비밀번호 해싱 풀이 포화되면 재시도 시점과 함께 503 응답"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry shortly",
+        headers={"Retry-After": str(error.retry_after)},
+    )
+
+
 @router.post("/register", response_model=UserRead)
-async def register(request: RegisterRequest, db: Session = Depends(get_db)):
+async def register(request: RegisterRequest, db: DBSession = Depends(get_db)):
     """회원가입"""
     user_service = UserService(db)
 
     # 이메일 중복 확인
-    existing_user = user_service.get_user_by_email(request.email)
+    existing_user = await user_service.get_user_by_email(request.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
@@ -33,25 +43,24 @@ async def register(request: RegisterRequest, db: Session = Depends(get_db)):
         timezone=request.timezone,
     )
 
-    new_user = user_service.create_user(user_create)
+    try:
+        new_user = await user_service.create_user(user_create)
+    except PoolSaturatedError as e:
+        raise password_pool_busy(e)
 
-    return UserRead(
-        id=str(new_user.id),
-        email=new_user.email,
-        name=new_user.name,
-        timezone=new_user.timezone,
-        is_active=new_user.is_active,
-        created_at=new_user.created_at,
-    )
+    return UserRead.model_validate(new_user)
 
 
 @router.post("/login", response_model=Token)
-async def login(request: LoginRequest, db: Session = Depends(get_db)):
+async def login(request: LoginRequest, db: DBSession = Depends(get_db)):
     """로그인"""
     user_service = UserService(db)
 
     # 사용자 인증
-    user = user_service.authenticate_user(request.email, request.password)
+    try:
+        user = await user_service.authenticate_user(request.email, request.password)
+    except PoolSaturatedError as e:
+        raise password_pool_busy(e)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -72,7 +81,7 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(request: RefreshTokenRequest, db: Session = Depends(get_db)):
+async def refresh_token(request: RefreshTokenRequest, db: DBSession = Depends(get_db)):
     """토큰 갱신"""
     # 리프레시 토큰 검증
     user_id = decode_token(request.refresh_token)
@@ -82,7 +91,7 @@ async def refresh_token(request: RefreshTokenRequest, db: Session = Depends(get_
         )
 
     user_service = UserService(db)
-    user = user_service.get_user_by_id(user_id)
+    user = await user_service.get_user_by_id(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
@@ -98,13 +107,6 @@ async def refresh_token(request: RefreshTokenRequest, db: Session = Depends(get_
 
 
 @router.get("/me", response_model=UserRead)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: CurrentUser = Depends(get_current_user)):
     """현재 사용자 정보 조회"""
-    return UserRead(
-        id=str(current_user.id),
-        email=current_user.email,
-        name=current_user.name,
-        timezone=current_user.timezone,
-        is_active=current_user.is_active,
-        created_at=current_user.created_at,
-    )
+    return UserRead.model_validate(current_user)
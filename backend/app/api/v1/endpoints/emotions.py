@@ -1,54 +1,92 @@
+import uuid
 from datetime import datetime, timedelta
 from typing import List, Optional
 
+from app.api.bulk import bulk_create_response, insert_records, validate_bulk_items
 from app.api.deps import get_current_active_user, get_db
+from app.api.pagination import SortKey, paginate, set_next_cursor
+from app.api.responses import model_list_response
+from app.db.database import DBSession
 from app.models.emotion import (
     EmotionRecord,
     EmotionRecordCreate,
     EmotionRecordRead,
     EmotionRecordUpdate,
 )
-from app.models.user import User
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
+from app.models.stats import EMOTION_COUNT_COLUMNS, DailyUserStats
+from app.models.sync import SyncEntity, Tombstone
+from app.models.user import CurrentUser
+from app.schemas.bulk import BulkCreateRequest, BulkCreateResponse
+from app.services.stats_service import (
+    add_daily_stats,
+    emotion_contribution,
+    update_daily_stats,
+)
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlmodel import select
 
 router = APIRouter()
 
+# 목록 정렬 순서 (키셋 커서도 같은 순서를 따름)
+EMOTION_SORT_KEYS = (
+    SortKey(EmotionRecord.recorded_at, descending=True, parse=datetime.fromisoformat),
+    SortKey(EmotionRecord.id, descending=True, parse=uuid.UUID),
+)
+
 
 @router.post("/", response_model=EmotionRecordRead)
 async def create_emotion_record(
     emotion: EmotionRecordCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
     """감정 기록 생성"""
     db_emotion = EmotionRecord(**emotion.dict(), user_id=current_user.id)
     db.add(db_emotion)
-    db.commit()
-    db.refresh(db_emotion)
-
-    return EmotionRecordRead(
-        id=str(db_emotion.id),
-        user_id=str(db_emotion.user_id),
-        emotion_level=db_emotion.emotion_level,
-        emotion_type=db_emotion.emotion_type,
-        note=db_emotion.note,
-        recorded_at=db_emotion.recorded_at,
-        ai_analysis=db_emotion.ai_analysis,
-        created_at=db_emotion.created_at,
+    await update_daily_stats(
+        db, current_user.id, None, emotion_contribution(db_emotion)
     )
+    await db.commit()
+    await db.refresh(db_emotion)
+
+    return EmotionRecordRead.model_validate(db_emotion)
+
+
+@router.post("/bulk", response_model=BulkCreateResponse)
+async def create_emotion_records_bulk(
+    request: BulkCreateRequest,
+    atomic: bool = False,
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
+):
+    """감정 기록 일괄 생성
+
+    잘못된 항목은 errors로 돌려주고 나머지만 저장한다.
+    atomic=true이면 하나라도 잘못된 경우 아무것도 저장하지 않고 422를 반환한다.
+    """
+    valid, errors = validate_bulk_items(EmotionRecordCreate, request.items, atomic)
+    records = [
+        EmotionRecord(**item.dict(), user_id=current_user.id) for _, item in valid
+    ]
+    await insert_records(db, records)
+    await add_daily_stats(db, current_user.id, map(emotion_contribution, records))
+    await db.commit()
+
+    return bulk_create_response(valid, records, errors)
 
 
 @router.get("/", response_model=List[EmotionRecordRead])
 async def get_emotion_records(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
-    """감정 기록 목록 조회"""
+    """감정 기록 목록 조회 (cursor가 있으면 skip 대신 키셋 페이지네이션)"""
     query = select(EmotionRecord).where(EmotionRecord.user_id == current_user.id)
 
     if start_date:
@@ -56,108 +94,91 @@ async def get_emotion_records(
     if end_date:
         query = query.where(EmotionRecord.recorded_at <= end_date)
 
-    query = query.offset(skip).limit(limit).order_by(EmotionRecord.recorded_at.desc())
-    emotions = db.exec(query).all()
-
-    return [
-        EmotionRecordRead(
-            id=str(e.id),
-            user_id=str(e.user_id),
-            emotion_level=e.emotion_level,
-            emotion_type=e.emotion_type,
-            note=e.note,
-            recorded_at=e.recorded_at,
-            ai_analysis=e.ai_analysis,
-            created_at=e.created_at,
-        )
-        for e in emotions
-    ]
+    query = paginate(query, EMOTION_SORT_KEYS, cursor, skip, limit)
+    emotions = (await db.exec(query)).all()
+    set_next_cursor(response, emotions, EMOTION_SORT_KEYS, limit)
+
+    return model_list_response(EmotionRecordRead, emotions, response)
 
 
 @router.get("/{emotion_id}", response_model=EmotionRecordRead)
 async def get_emotion_record(
     emotion_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
     """특정 감정 기록 조회"""
-    emotion = db.exec(
+    result = await db.exec(
         select(EmotionRecord).where(
             EmotionRecord.id == emotion_id, EmotionRecord.user_id == current_user.id
         )
-    ).first()
+    )
+    emotion = result.first()
 
     if not emotion:
         raise HTTPException(status_code=404, detail="Emotion record not found")
 
-    return EmotionRecordRead(
-        id=str(emotion.id),
-        user_id=str(emotion.user_id),
-        emotion_level=emotion.emotion_level,
-        emotion_type=emotion.emotion_type,
-        note=emotion.note,
-        recorded_at=emotion.recorded_at,
-        ai_analysis=emotion.ai_analysis,
-        created_at=emotion.created_at,
-    )
+    return EmotionRecordRead.model_validate(emotion)
 
 
 @router.put("/{emotion_id}", response_model=EmotionRecordRead)
 async def update_emotion_record(
     emotion_id: str,
     emotion_update: EmotionRecordUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
     """감정 기록 수정"""
-    emotion = db.exec(
+    result = await db.exec(
         select(EmotionRecord).where(
             EmotionRecord.id == emotion_id, EmotionRecord.user_id == current_user.id
         )
-    ).first()
+    )
+    emotion = result.first()
 
     if not emotion:
         raise HTTPException(status_code=404, detail="Emotion record not found")
 
+    before = emotion_contribution(emotion)
     update_data = emotion_update.dict(exclude_unset=True)
     for key, value in update_data.items():
         setattr(emotion, key, value)
 
     emotion.updated_at = datetime.utcnow()
     db.add(emotion)
-    db.commit()
-    db.refresh(emotion)
-
-    return EmotionRecordRead(
-        id=str(emotion.id),
-        user_id=str(emotion.user_id),
-        emotion_level=emotion.emotion_level,
-        emotion_type=emotion.emotion_type,
-        note=emotion.note,
-        recorded_at=emotion.recorded_at,
-        ai_analysis=emotion.ai_analysis,
-        created_at=emotion.created_at,
-    )
+    await update_daily_stats(db, current_user.id, before, emotion_contribution(emotion))
+    await db.commit()
+    await db.refresh(emotion)
+
+    return EmotionRecordRead.model_validate(emotion)
 
 
 @router.delete("/{emotion_id}")
 async def delete_emotion_record(
     emotion_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
     """감정 기록 삭제"""
-    emotion = db.exec(
+    result = await db.exec(
         select(EmotionRecord).where(
             EmotionRecord.id == emotion_id, EmotionRecord.user_id == current_user.id
         )
-    ).first()
+    )
+    emotion = result.first()
 
     if not emotion:
         raise HTTPException(status_code=404, detail="Emotion record not found")
 
-    db.delete(emotion)
-    db.commit()
+    await update_daily_stats(db, current_user.id, emotion_contribution(emotion), None)
+    await db.delete(emotion)
+    # 동기화 클라이언트에 삭제를 전달하기 위한 기록
+    db.add(
+        Tombstone(
+            record_id=emotion.id, user_id=current_user.id, entity=SyncEntity.EMOTION
+        )
+    )
+    await db.commit()
 
     return {"message": "Emotion record deleted Successfully"}
 
@@ -165,20 +186,48 @@ async def delete_emotion_record(
 @router.get("/stats/summary")
 async def get_emotion_stats(
     days: int = Query(7, ge=1, le=90),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    include_daily: bool = False,
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
-    """감정 통계 조회"""
-    start_date = datetime.utcnow() - timedelta(days=days)
+    """감정 통계 조회 (일간 롤업에서 집계)"""
+    # 롤업은 일 단위이므로 시작일 0시부터 집계
+    start_day = (datetime.utcnow() - timedelta(days=days)).date()
+    result = await db.exec(
+        select(
+            DailyUserStats.day,
+            DailyUserStats.emotion_level_sum,
+            *(getattr(DailyUserStats, c) for c in EMOTION_COUNT_COLUMNS.values()),
+        )
+        .where(
+            DailyUserStats.user_id == current_user.id,
+            DailyUserStats.day >= start_day,
+        )
+        .order_by(DailyUserStats.day)
+    )
 
-    emotions = db.exec(
-        select(EmotionRecord).where(
-            EmotionRecord.user_id == current_user.id,
-            EmotionRecord.recorded_at >= start_date,
+    emotion_counts = {}
+    level_sum = 0
+    daily = []
+    for day, day_level_sum, *counts in result.all():
+        day_total = sum(counts)
+        if not day_total:
+            continue
+        level_sum += day_level_sum
+        for emotion_type, count in zip(EMOTION_COUNT_COLUMNS, counts):
+            if count:
+                emotion_counts[emotion_type] = (
+                    emotion_counts.get(emotion_type, 0) + count
+                )
+        daily.append(
+            {
+                "date": day.isoformat(),
+                "count": day_total,
+                "average_level": round(day_level_sum / day_total, 2),
+            }
         )
-    ).all()
 
-    if not emotions:
+    if not emotion_counts:
         return {
             "total_records": 0,
             "average_level": 0,
@@ -187,22 +236,18 @@ async def get_emotion_stats(
         }
 
     # 통계 계산
-    total = len(emotions)
-    avg_level = sum(e.emotion_level for e in emotions) / total
-
-    # 감정 분포
-    emotion_counts = {}
-    for e in emotions:
-        emotion_counts[e.emotion_type] = emotion_counts.get(e.emotion_type, 0) + 1
+    total = sum(emotion_counts.values())
+    most_common = max(emotion_counts, key=emotion_counts.get)
 
-    most_common = (
-        max(emotion_counts, key=emotion_counts.get) if emotion_counts else None
-    )
-
-    return {
+    stats = {
         "total_records": total,
-        "average_level": round(avg_level, 2),
+        "average_level": round(level_sum / total, 2),
         "most_common_emotion": most_common,
         "emotion_distribution": emotion_counts,
         "period_days": days,
     }
+
+    if include_daily:
+        stats["daily"] = daily
+
+    return stats
@@ -1,85 +1,112 @@
-from datetime import datetime, timedelta
+import uuid
+from datetime import date, datetime, time, timedelta
 from typing import List, Optional
 
+from app.api.bulk import bulk_create_response, insert_records, validate_bulk_items
 from app.api.deps import get_current_active_user, get_db
+from app.api.pagination import SortKey, paginate, set_next_cursor
+from app.api.responses import model_list_response
+from app.db.database import DBSession
 from app.models.focus import (
     FocusSession,
     FocusSessionCreate,
     FocusSessionRead,
     FocusSessionUpdate,
+    FocusStatsGroupBy,
+    SessionType,
 )
-from app.models.user import User
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
+from app.models.stats import FOCUS_MINUTES_COLUMNS, DailyUserStats
+from app.models.user import CurrentUser
+from app.schemas.bulk import BulkCreateRequest, BulkCreateResponse
+from app.services.stats_service import (
+    add_daily_stats,
+    focus_contribution,
+    update_daily_stats,
+)
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlmodel import func, select
 
 router = APIRouter()
 
+# 목록 정렬 순서 (키셋 커서도 같은 순서를 따름)
+FOCUS_SORT_KEYS = (
+    SortKey(FocusSession.start_time, descending=True, parse=datetime.fromisoformat),
+    SortKey(FocusSession.id, descending=True, parse=uuid.UUID),
+)
+
 
 @router.post("/", response_model=FocusSessionRead)
 async def create_focus_session(
     session: FocusSessionCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
     """집중 세션 시작"""
     db_session = FocusSession(**session.dict(), user_id=current_user.id)
     db.add(db_session)
-    db.commit()
-    db.refresh(db_session)
-
-    return FocusSessionRead(
-        id=str(db_session.id),
-        user_id=str(db_session.user_id),
-        start_time=db_session.start_time,
-        end_time=db_session.end_time,
-        duration_minutes=db_session.duration_minutes,
-        session_type=db_session.session_type,
-        productivity_rating=db_session.productivity_rating,
-        notes=db_session.notes,
-        created_at=db_session.created_at,
-    )
+    await update_daily_stats(db, current_user.id, None, focus_contribution(db_session))
+    await db.commit()
+    await db.refresh(db_session)
+
+    return FocusSessionRead.model_validate(db_session)
+
+
+@router.post("/bulk", response_model=BulkCreateResponse)
+async def create_focus_sessions_bulk(
+    request: BulkCreateRequest,
+    atomic: bool = False,
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
+):
+    """집중 세션 일괄 생성 (오프라인에서 기록한 종료된 세션 업로드용)
+
+    잘못된 항목은 errors로 돌려주고 나머지만 저장한다.
+    atomic=true이면 하나라도 잘못된 경우 아무것도 저장하지 않고 422를 반환한다.
+    """
+    valid, errors = validate_bulk_items(FocusSessionCreate, request.items, atomic)
+    sessions = [
+        FocusSession(**item.dict(), user_id=current_user.id) for _, item in valid
+    ]
+    await insert_records(db, sessions)
+    await add_daily_stats(db, current_user.id, map(focus_contribution, sessions))
+    await db.commit()
+
+    return bulk_create_response(valid, sessions, errors)
 
 
 @router.get("/current", response_model=Optional[FocusSessionRead])
 async def get_current_session(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
     """현재 진행 중인 세션 조회"""
-    session = db.exec(
+    result = await db.exec(
         select(FocusSession)
         .where(FocusSession.user_id == current_user.id, FocusSession.end_time == None)
         .order_by(FocusSession.start_time.desc())
-    ).first()
+    )
+    session = result.first()
 
     if not session:
         return None
 
-    return FocusSessionRead(
-        id=str(session.id),
-        user_id=str(session.user_id),
-        start_time=session.start_time,
-        end_time=session.end_time,
-        duration_minutes=session.duration_minutes,
-        session_type=session.session_type,
-        productivity_rating=session.productivity_rating,
-        notes=session.notes,
-        created_at=session.created_at,
-    )
+    return FocusSessionRead.model_validate(session)
 
 
 @router.put("/{session_id}/end", response_model=FocusSessionRead)
 async def end_focus_session(
     session_id: str,
     session_update: FocusSessionUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
     """집중 세션 종료"""
-    session = db.exec(
+    result = await db.exec(
         select(FocusSession).where(
             FocusSession.id == session_id, FocusSession.user_id == current_user.id
         )
-    ).first()
+    )
+    session = result.first()
 
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -93,32 +120,25 @@ async def end_focus_session(
     session.updated_at = datetime.utcnow()
 
     db.add(session)
-    db.commit()
-    db.refresh(session)
-
-    return FocusSessionRead(
-        id=str(session.id),
-        user_id=str(session.user_id),
-        start_time=session.start_time,
-        end_time=session.end_time,
-        duration_minutes=session.duration_minutes,
-        session_type=session.session_type,
-        productivity_rating=session.productivity_rating,
-        notes=session.notes,
-        created_at=session.created_at,
-    )
+    await update_daily_stats(db, current_user.id, None, focus_contribution(session))
+    await db.commit()
+    await db.refresh(session)
+
+    return FocusSessionRead.model_validate(session)
 
 
 @router.get("/", response_model=List[FocusSessionRead])
 async def get_focus_sessions(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
-    """집중 세션 목록 조회"""
+    """집중 세션 목록 조회 (cursor가 있으면 skip 대신 키셋 페이지네이션)"""
     query = select(FocusSession).where(FocusSession.user_id == current_user.id)
 
     if start_date:
@@ -126,65 +146,150 @@ async def get_focus_sessions(
     if end_date:
         query = query.where(FocusSession.start_time <= end_date)
 
-    query = query.offset(skip).limit(limit).order_by(FocusSession.start_time.desc())
-    sessions = db.exec(query).all()
+    query = paginate(query, FOCUS_SORT_KEYS, cursor, skip, limit)
+    sessions = (await db.exec(query)).all()
+    set_next_cursor(response, sessions, FOCUS_SORT_KEYS, limit)
 
-    return [
-        FocusSessionRead(
-            id=str(s.id),
-            user_id=str(s.user_id),
-            start_time=s.start_time,
-            end_time=s.end_time,
-            duration_minutes=s.duration_minutes,
-            session_type=s.session_type,
-            productivity_rating=s.productivity_rating,
-            notes=s.notes,
-            created_at=s.created_at,
-        )
-        for s in sessions
-    ]
+    return model_list_response(FocusSessionRead, sessions, response)
 
 
 @router.get("/stats/summary")
 async def get_focus_stats(
     days: int = Query(7, ge=1, le=90),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    group_by: Optional[FocusStatsGroupBy] = None,
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
-    """집중 세션 통계 조회"""
-    start_date = datetime.utcnow() - timedelta(days=days)
-
-    sessions = db.exec(
-        select(FocusSession).where(
-            FocusSession.user_id == current_user.id,
-            FocusSession.start_time >= start_date,
-            FocusSession.end_time != None,
+    """집중 세션 통계 조회 (일간 롤업에서 집계)"""
+    # 롤업은 일 단위이므로 시작일 0시부터 집계
+    start_day = (datetime.utcnow() - timedelta(days=days)).date()
+    result = await db.exec(
+        select(
+            DailyUserStats.day,
+            DailyUserStats.focus_sessions,
+            DailyUserStats.focus_minutes,
+            DailyUserStats.focus_rated_sessions,
+            DailyUserStats.focus_rating_sum,
+            *(getattr(DailyUserStats, c) for c in FOCUS_MINUTES_COLUMNS.values()),
+        )
+        .where(
+            DailyUserStats.user_id == current_user.id,
+            DailyUserStats.day >= start_day,
+            DailyUserStats.focus_sessions > 0,
         )
-    ).all()
+        .order_by(DailyUserStats.day)
+    )
+    rows = result.all()
+
+    total_sessions = sum(row[1] for row in rows)
+    total_minutes = sum(row[2] for row in rows)
+    rated_sessions = sum(row[3] for row in rows)
+    rating_sum = sum(row[4] for row in rows)
 
-    if not sessions:
-        return {
+    if not total_sessions:
+        stats = {
             "total_sessions": 0,
             "total_minutes": 0,
             "average_duration": 0,
             "average_productivity": 0,
         }
+    else:
+        stats = {
+            "total_sessions": total_sessions,
+            "total_minutes": total_minutes,
+            "average_duration": round(total_minutes / total_sessions, 1),
+            "average_productivity": (
+                round(rating_sum / rated_sessions, 2) if rated_sessions else 0
+            ),
+            "period_days": days,
+        }
+
+    if group_by is not None:
+        stats["group_by"] = group_by.value
+        if not total_sessions:
+            stats["buckets"] = []
+        elif group_by == FocusStatsGroupBy.SESSION_TYPE:
+            stats["buckets"] = await _get_session_type_buckets(
+                db, current_user.id, start_day
+            )
+        else:
+            stats["buckets"] = _get_date_buckets(rows, group_by)
+
+    return stats
+
+
+def _get_date_buckets(rows: List[tuple], group_by: FocusStatsGroupBy) -> List[dict]:
+    """일/주 단위 집중 시간 집계 (주 단위는 월요일 기준으로 합침)"""
+    buckets = {}
+    for day, sessions, minutes, rated, rating_sum, *type_minutes in rows:
+        if group_by == FocusStatsGroupBy.WEEK:
+            day -= timedelta(days=day.weekday())
+
+        bucket = buckets.setdefault(
+            day,
+            {
+                "bucket": day.isoformat(),
+                "total_sessions": 0,
+                "total_minutes": 0,
+                "rated_sessions": 0,
+                "rating_sum": 0,
+                "minutes_by_type": {},
+            },
+        )
+        bucket["total_sessions"] += sessions
+        bucket["total_minutes"] += minutes
+        bucket["rated_sessions"] += rated
+        bucket["rating_sum"] += rating_sum
+        by_type = bucket["minutes_by_type"]
+        for session_type, value in zip(FOCUS_MINUTES_COLUMNS, type_minutes):
+            if value:
+                by_type[session_type.value] = by_type.get(session_type.value, 0) + value
+
+    return [
+        {
+            "bucket": bucket["bucket"],
+            "total_sessions": bucket["total_sessions"],
+            "total_minutes": bucket["total_minutes"],
+            "average_productivity": (
+                round(bucket["rating_sum"] / bucket["rated_sessions"], 2)
+                if bucket["rated_sessions"]
+                else 0
+            ),
+            "minutes_by_type": bucket["minutes_by_type"],
+        }
+        for _, bucket in sorted(buckets.items())
+    ]
 
-    total_sessions = len(sessions)
-    total_minutes = sum(s.duration_minutes for s in sessions)
-    avg_duration = total_minutes / total_sessions
 
-    rated_sessions = [s for s in sessions if s.productivity_rating]
-    avg_productivity = (
-        sum(s.productivity_rating for s in rated_sessions) / len(rated_sessions)
-        if rated_sessions
-        else 0
+async def _get_session_type_buckets(
+    db: DBSession, user_id, start_day: date
+) -> List[dict]:
+    """세션 타입별 집계 (롤업에 타입별 평점이 없으므로 원본 세션에서 계산)"""
+    result = await db.exec(
+        select(
+            FocusSession.session_type,
+            func.count(),
+            func.sum(FocusSession.duration_minutes),
+            func.avg(FocusSession.productivity_rating),
+        )
+        .where(
+            FocusSession.user_id == user_id,
+            FocusSession.start_time >= datetime.combine(start_day, time.min),
+            FocusSession.end_time != None,
+        )
+        .group_by(FocusSession.session_type)
     )
 
-    return {
-        "total_sessions": total_sessions,
-        "total_minutes": total_minutes,
-        "average_duration": round(avg_duration, 1),
-        "average_productivity": round(avg_productivity, 2),
-        "period_days": days,
-    }
+    buckets = []
+    for session_type, sessions, minutes, avg_productivity in result.all():
+        session_type = SessionType(session_type)
+        buckets.append(
+            {
+                "bucket": session_type.value,
+                "total_sessions": sessions,
+                "total_minutes": minutes or 0,
+                "average_productivity": round(float(avg_productivity or 0), 2),
+                "minutes_by_type": {session_type.value: minutes or 0},
+            }
+        )
+    return sorted(buckets, key=lambda b: b["bucket"])
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.api.deps import get_current_active_user, get_db
+from app.core.config import get_settings
+from app.db.database import DBSession
+from app.models.emotion import EmotionRecord
+from app.models.feedback import AIFeedback
+from app.models.focus import FocusSession
+from app.models.sync import Tombstone
+from app.models.todo import TodoItem
+from app.models.user import CurrentUser
+from app.schemas.sync import SyncResponse
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
+from sqlmodel import select
+
+settings = get_settings()
+router = APIRouter()
+
+
+@router.get("/", response_model=SyncResponse)
+async def sync_changes(
+    since: Optional[datetime] = None,
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
+):
+    """워터마크 이후 생성/수정/삭제된 기록 조회 (since가 없으면 전체)
+
+    조회 직전에 커밋되지 않은 변경을 놓치지 않도록 새 워터마크는 조회 시작
+    시각보다 SYNC_WATERMARK_LAG_SECONDS만큼 이르게 잡는다. 그래서 같은 기록이
+    다음 동기화에 다시 포함될 수 있으며, 클라이언트는 id 기준으로 덮어쓴다.
+    """
+    watermark = datetime.utcnow() - timedelta(
+        seconds=settings.SYNC_WATERMARK_LAG_SECONDS
+    )
+    if since is not None and since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+
+    async def changed(model):
+        query = select(model).where(model.user_id == current_user.id)
+        if since is not None:
+            query = query.where(model.updated_at > since)
+        return (await db.exec(query.order_by(model.updated_at))).all()
+
+    deleted = []
+    if since is not None:
+        deleted = (
+            await db.exec(
+                select(Tombstone)
+                .where(
+                    Tombstone.user_id == current_user.id,
+                    Tombstone.deleted_at > since,
+                )
+                .order_by(Tombstone.deleted_at)
+            )
+        ).all()
+
+    payload = SyncResponse.model_validate(
+        {
+            "watermark": watermark,
+            "emotions": await changed(EmotionRecord),
+            "focus_sessions": await changed(FocusSession),
+            "todos": await changed(TodoItem),
+            "feedbacks": await changed(AIFeedback),
+            "deleted": deleted,
+        },
+        from_attributes=True,
+    )
+    return ORJSONResponse(payload.model_dump())
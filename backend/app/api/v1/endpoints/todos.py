@@ -1,92 +1,102 @@
+import uuid
 from datetime import datetime
 from typing import List, Optional
 
+from app.api.bulk import bulk_create_response, insert_records, validate_bulk_items
 from app.api.deps import get_current_active_user, get_db
+from app.api.pagination import SortKey, paginate, parse_bool, set_next_cursor
+from app.api.responses import model_list_response
+from app.db.database import DBSession
+from app.models.sync import SyncEntity, Tombstone
 from app.models.todo import TodoItem, TodoItemCreate, TodoItemRead, TodoItemUpdate
-from app.models.user import User
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
+from app.models.user import CurrentUser
+from app.schemas.bulk import BulkCreateRequest, BulkCreateResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlmodel import case, func, select
 
 router = APIRouter()
 
+# 목록 정렬 순서: 미완료 → 우선순위 높은 순 → 최신순 (키셋 커서도 같은 순서)
+TODO_SORT_KEYS = (
+    SortKey(TodoItem.completed, parse=parse_bool),
+    SortKey(TodoItem.priority, descending=True, parse=int),
+    SortKey(TodoItem.created_at, descending=True, parse=datetime.fromisoformat),
+    SortKey(TodoItem.id, descending=True, parse=uuid.UUID),
+)
+
 
 @router.post("/", response_model=TodoItemRead)
 async def create_todo(
     todo: TodoItemCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
     """할 일 생성"""
     db_todo = TodoItem(**todo.dict(), user_id=current_user.id)
     db.add(db_todo)
-    db.commit()
-    db.refresh(db_todo)
-
-    return TodoItemRead(
-        id=str(db_todo.id),
-        user_id=str(db_todo.user_id),
-        title=db_todo.title,
-        description=db_todo.description,
-        completed=db_todo.completed,
-        priority=db_todo.priority,
-        due_date=db_todo.due_date,
-        completed_at=db_todo.completed_at,
-        created_at=db_todo.created_at,
-    )
+    await db.commit()
+    await db.refresh(db_todo)
+
+    return TodoItemRead.model_validate(db_todo)
+
+
+@router.post("/bulk", response_model=BulkCreateResponse)
+async def create_todos_bulk(
+    request: BulkCreateRequest,
+    atomic: bool = False,
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
+):
+    """할 일 일괄 생성
+
+    잘못된 항목은 errors로 돌려주고 나머지만 저장한다.
+    atomic=true이면 하나라도 잘못된 경우 아무것도 저장하지 않고 422를 반환한다.
+    """
+    valid, errors = validate_bulk_items(TodoItemCreate, request.items, atomic)
+    todos = [TodoItem(**item.dict(), user_id=current_user.id) for _, item in valid]
+    await insert_records(db, todos)
+    await db.commit()
+
+    return bulk_create_response(valid, todos, errors)
 
 
 @router.get("/", response_model=List[TodoItemRead])
 async def get_todos(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = None,
     completed: Optional[bool] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
-    """할 일 목록 조회"""
+    """할 일 목록 조회 (cursor가 있으면 skip 대신 키셋 페이지네이션)"""
     query = select(TodoItem).where(TodoItem.user_id == current_user.id)
 
     if completed is not None:
         query = query.where(TodoItem.completed == completed)
 
-    query = (
-        query.offset(skip)
-        .limit(limit)
-        .order_by(
-            TodoItem.completed, TodoItem.priority.desc(), TodoItem.created_at.desc()
-        )
-    )
-    todos = db.exec(query).all()
-
-    return [
-        TodoItemRead(
-            id=str(t.id),
-            user_id=str(t.user_id),
-            title=t.title,
-            description=t.description,
-            completed=t.completed,
-            priority=t.priority,
-            due_date=t.due_date,
-            completed_at=t.completed_at,
-            created_at=t.created_at,
-        )
-        for t in todos
-    ]
+    query = paginate(query, TODO_SORT_KEYS, cursor, skip, limit)
+    todos = (await db.exec(query)).all()
+    set_next_cursor(response, todos, TODO_SORT_KEYS, limit)
+
+    return model_list_response(TodoItemRead, todos, response)
 
 
 @router.put("/{todo_id}", response_model=TodoItemRead)
 async def update_todo(
     todo_id: str,
     todo_update: TodoItemUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
     """할 일 수정"""
-    todo = db.exec(
+    result = await db.exec(
         select(TodoItem).where(
             TodoItem.id == todo_id, TodoItem.user_id == current_user.id
         )
-    ).first()
+    )
+    todo = result.first()
 
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
@@ -105,66 +115,63 @@ async def update_todo(
 
     todo.updated_at = datetime.utcnow()
     db.add(todo)
-    db.commit()
-    db.refresh(todo)
-
-    return TodoItemRead(
-        id=str(todo.id),
-        user_id=str(todo.user_id),
-        title=todo.title,
-        description=todo.description,
-        completed=todo.completed,
-        priority=todo.priority,
-        due_date=todo.due_date,
-        completed_at=todo.completed_at,
-        created_at=todo.created_at,
-    )
+    await db.commit()
+    await db.refresh(todo)
+
+    return TodoItemRead.model_validate(todo)
 
 
 @router.delete("/{todo_id}")
 async def delete_todo(
     todo_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
     """할 일 삭제"""
-    todo = db.exec(
+    result = await db.exec(
         select(TodoItem).where(
             TodoItem.id == todo_id, TodoItem.user_id == current_user.id
         )
-    ).first()
+    )
+    todo = result.first()
 
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
 
-    db.delete(todo)
-    db.commit()
+    await db.delete(todo)
+    # 동기화 클라이언트에 삭제를 전달하기 위한 기록
+    db.add(
+        Tombstone(record_id=todo.id, user_id=current_user.id, entity=SyncEntity.TODO)
+    )
+    await db.commit()
 
     return {"message": "Todo deleted successfully"}
 
 
 @router.get("/stats/summary")
 async def get_todo_stats(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)
+    db: DBSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user),
 ):
-    """할 일 통계 조회"""
-    todos = db.exec(select(TodoItem).where(TodoItem.user_id == current_user.id)).all()
-
-    total = len(todos)
-    completed = len([t for t in todos if t.completed])
-    pending = total - completed
-    overdue = len(
-        [
-            t
-            for t in todos
-            if not t.completed and t.due_date and t.due_date < datetime.utcnow()
-        ]
+    """할 일 통계 조회 (user_id, completed, due_date 인덱스만으로 집계)"""
+    now = datetime.utcnow()
+    result = await db.exec(
+        select(
+            func.count(),
+            func.sum(case((TodoItem.completed, 1), else_=0)),
+            # 완료된 항목은 마감일이 지나도 연체로 치지 않음
+            func.sum(
+                case((TodoItem.completed, 0), (TodoItem.due_date < now, 1), else_=0)
+            ),
+        ).where(TodoItem.user_id == current_user.id)
     )
+    total, completed, overdue = result.one()
+    completed = completed or 0
 
     return {
         "total": total,
         "completed": completed,
-        "pending": pending,
-        "overdue": overdue,
+        "pending": total - completed,
+        "overdue": overdue or 0,
         "completion_rate": round(completed / total * 100, 1) if total > 0 else 0,
     }
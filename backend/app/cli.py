@@ -0,0 +1,108 @@
+"""관리용 명령줄 도구
+
+사용 예:
+    python -m app.cli migrate
+    python -m app.cli rebuild-stats
+    python -m app.cli rebuild-stats --user-id <UUID>
+    python -m app.cli daily-feedback
+    python -m app.cli daily-feedback --loop
+    python -m app.cli export-onnx --output models/emotion-onnx-int8
+"""
+
+import argparse
+import asyncio
+import json
+import uuid
+from typing import List, Optional
+
+from app.core.config import get_settings
+from app.db.database import engine, prepare_database
+from app.db.migrations import current_revision, upgrade_schema
+from app.services.feedback_scheduler import get_feedback_scheduler
+from app.services.stats_service import rebuild_daily_stats
+from sqlmodel import Session
+
+
+def migrate(args: argparse.Namespace) -> int:
+    """Alembic 마이그레이션 적용 (배포 시 워커 시작 전에 한 번 실행)"""
+    upgrade_schema(engine, args.revision)
+    print(f"database revision: {current_revision(engine)}")
+    return 0
+
+
+def rebuild_stats(args: argparse.Namespace) -> int:
+    """원본 기록에서 일간 통계 롤업 재계산"""
+    prepare_database(get_settings().DB_STARTUP_MODE)
+    with Session(engine) as session:
+        rows = rebuild_daily_stats(session, args.user_id)
+    print(f"daily_user_stats: {rows} rows rebuilt")
+    return 0
+
+
+def daily_feedback(args: argparse.Namespace) -> int:
+    """시간대별 일일 피드백 생성 (API 서버와 별도 프로세스로 실행할 때)"""
+    prepare_database(get_settings().DB_STARTUP_MODE)
+    scheduler = get_feedback_scheduler()
+    if args.loop:
+        asyncio.run(scheduler.run_forever())
+        return 0
+    summary = asyncio.run(scheduler.run_once())
+    print(json.dumps(summary, ensure_ascii=False))
+    return 0 if summary["failed"] == 0 else 1
+
+
+def export_onnx(args: argparse.Namespace) -> int:
+    """감정 분석 모델을 int8 양자화 ONNX로 내보내기 (EMOTION_MODEL_BACKEND=onnx용)"""
+    from app.services.ai_providers import AIDependencyError
+    from app.services.onnx_sentiment import export_quantized_model
+
+    settings = get_settings()
+    try:
+        model_path = export_quantized_model(
+            args.model or settings.EMOTION_MODEL_NAME,
+            args.output or settings.EMOTION_ONNX_MODEL_DIR,
+            opset=args.opset,
+        )
+    except AIDependencyError as e:
+        print(e)
+        return 1
+    print(f"exported: {model_path} ({model_path.stat().st_size / 1e6:.1f} MB)")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser("migrate", help="DB 마이그레이션 적용")
+    migrate_parser.add_argument("--revision", default="head", help="목표 리비전")
+    migrate_parser.set_defaults(handler=migrate)
+
+    rebuild = commands.add_parser(
+        "rebuild-stats", help="일간 통계 롤업(daily_user_stats) 백필/재계산"
+    )
+    rebuild.add_argument("--user-id", type=uuid.UUID, default=None, help="특정 사용자만 재계산")
+    rebuild.set_defaults(handler=rebuild_stats)
+
+    feedback = commands.add_parser("daily-feedback", help="마감 시각이 지난 사용자의 일일 피드백 생성")
+    feedback.add_argument(
+        "--loop", action="store_true", help="FEEDBACK_SCHEDULER_INTERVAL_SECONDS마다 반복"
+    )
+    feedback.set_defaults(handler=daily_feedback)
+
+    onnx = commands.add_parser("export-onnx", help="감정 분석 모델을 int8 양자화 ONNX로 내보내기")
+    onnx.add_argument("--model", default=None, help="기본값: EMOTION_MODEL_NAME")
+    onnx.add_argument("--output", default=None, help="기본값: EMOTION_ONNX_MODEL_DIR")
+    onnx.add_argument("--opset", type=int, default=14, help="ONNX opset 버전")
+    onnx.set_defaults(handler=export_onnx)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
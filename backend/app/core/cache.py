@@ -0,0 +1,165 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LRUCache:
+    """스레드 안전한 크기 제한 LRU 캐시 (선택적 TTL)"""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCacheTier:
+    """JSON 직렬화 Redis 캐시 계층 (장애 시 캐시 미스로 처리)"""
+
+    def __init__(self, client: Any, prefix: str, ttl: Optional[int] = None):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Any:
+        try:
+            raw = self.client.get(self._key(key))
+        except Exception as e:
+            logger.warning(f"Redis cache get failed: {e}")
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        try:
+            self.client.set(self._key(key), json.dumps(value), ex=ttl or self.ttl)
+        except Exception as e:
+            logger.warning(f"Redis cache set failed: {e}")
+
+    def delete(self, key: str):
+        try:
+            self.client.delete(self._key(key))
+        except Exception as e:
+            logger.warning(f"Redis cache delete failed: {e}")
+
+
+class TwoTierCache:
+    """프로세스 내 LRU + 선택적 Redis 2단계 캐시"""
+
+    def __init__(
+        self,
+        local: Optional[LRUCache] = None,
+        remote: Optional[RedisCacheTier] = None,
+    ):
+        self.local = local
+        self.remote = remote
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.remote_hits = 0
+        self.misses = 0
+
+    def get_local(self, key: str) -> Any:
+        """로컬 계층만 조회 (네트워크 I/O 없음)"""
+        if self.local is None:
+            return None
+        value = self.local.get(key)
+        if value is not None:
+            self._count("local_hits")
+        return value
+
+    def get(self, key: str) -> Any:
+        value = self.get_local(key)
+        if value is not None:
+            return value
+
+        if self.remote is not None:
+            value = self.remote.get(key)
+            if value is not None:
+                self._count("remote_hits")
+                if self.local is not None:
+                    self.local.set(key, value)
+                return value
+
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Any):
+        if self.local is not None:
+            self.local.set(key, value)
+        if self.remote is not None:
+            self.remote.set(key, value)
+
+    def delete(self, key: str):
+        if self.local is not None:
+            self.local.delete(key)
+        if self.remote is not None:
+            self.remote.delete(key)
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """히트/미스 카운터"""
+        hits = self.local_hits + self.remote_hits
+        lookups = hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "remote_hits": self.remote_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0,
+            "local_size": len(self.local) if self.local is not None else 0,
+            "remote_enabled": self.remote is not None,
+        }
+
+
+def create_redis_client(url: str) -> Any:
+    """REDIS_URL로 Redis 클라이언트 생성 (URL이 비어 있으면 None)"""
+    if not url:
+        return None
+    return redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
@@ -1,6 +1,6 @@
 import os
 from functools import lru_cache
-from typing import List
+from typing import List, Literal
 
 from pydantic_settings import BaseSettings
 
@@ -17,23 +17,90 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./adhd_helper.db"
+    DB_ECHO: bool = False  # SQL 로그 출력 (DEBUG와 별도)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    SQLITE_WAL: bool = True
+    # create_all: 시작 시 테이블 생성 (개발용), verify: Alembic 리비전만 확인 (운영용)
+    DB_STARTUP_MODE: Literal["create_all", "verify"] = "create_all"
 
     # Security
     SECRET_KEY: str = "development-secret-key-2025-adhd-helper"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    TOKEN_CACHE_SIZE: int = 10000  # 서명 검증을 마친 토큰 캐시 항목 수
+    BCRYPT_ROUNDS: int = 12  # 변경 시 다음 로그인에서 기존 해시를 다시 만듦
+
+    # 비밀번호 해싱 프로세스 풀 (0이면 min(2, CPU 코어 수))
+    PASSWORD_HASH_WORKERS: int = 0
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:5173"]
 
+    # Worker pools (0이면 CPU 코어 수)
+    CPU_POOL_WORKERS: int = 0
+    IO_POOL_WORKERS: int = 32
+
+    # 일괄 생성 엔드포인트 요청당 최대 항목 수
+    BULK_MAX_ITEMS: int = 500
+
+    # 동기화 워터마크를 조회 시각보다 이르게 잡는 폭 (커밋 지연 대비)
+    SYNC_WATERMARK_LAG_SECONDS: int = 5
+
     # Redis (Optional)
     REDIS_URL: str = ""
 
+    # 인증 사용자 캐시 (Redis가 있으면 로컬 캐시는 짧게 유지해 워커 간 불일치 최소화)
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_LOCAL_TTL_SECONDS: int = 5
+
     # AI API Keys (Optional)
     OPENAI_API_KEY: str = ""
     HUGGINGFACE_API_KEY: str = ""
 
+    # OpenAI 클라이언트 풀 (사용자 API 키별 클라이언트 재사용, 연결 풀은 공유)
+    OPENAI_BASE_URL: str = ""  # 비어 있으면 SDK 기본값 (프록시/테스트 서버용)
+    OPENAI_CLIENT_POOL_SIZE: int = 256
+    OPENAI_MAX_CONCURRENCY_PER_KEY: int = 4
+    OPENAI_MAX_CONNECTIONS: int = 100
+    OPENAI_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    OPENAI_READ_TIMEOUT_SECONDS: float = 60.0
+    OPENAI_MAX_RETRIES: int = 3
+    OPENAI_BACKOFF_BASE_SECONDS: float = 0.5
+    OPENAI_BACKOFF_MAX_SECONDS: float = 8.0
+
+    # 일일 피드백 스케줄러 (사용자 시간대 기준 FEEDBACK_LOCAL_HOUR 이후 생성)
+    FEEDBACK_SCHEDULER_ENABLED: bool = False  # True면 API 프로세스 안에서 실행
+    FEEDBACK_SCHEDULER_INTERVAL_SECONDS: int = 300
+    FEEDBACK_LOCAL_HOUR: int = 21
+    FEEDBACK_MAX_CONCURRENCY: int = 16
+    FEEDBACK_KEY_RATE_PER_MINUTE: int = 20  # 같은 OpenAI 키로 보내는 분당 요청 수
+    FEEDBACK_MAX_ATTEMPTS: int = 3
+    FEEDBACK_JOB_LEASE_SECONDS: int = 600  # 실행 중 작업을 다른 프로세스가 넘겨받기까지
+    FEEDBACK_BATCH_SIZE: int = 500
+    # 입력 지문이 같은 피드백을 다시 생성하지 않고 돌려주는 기간 (0이면 항상 생성)
+    FEEDBACK_REUSE_WINDOW_SECONDS: int = 3600
+
+    # AI Models
+    EMOTION_MODEL_NAME: str = "nlptown/bert-base-multilingual-uncased-sentiment"
+    EMOTION_MODEL_DEVICE: int = -1  # CPU 사용 (GPU 사용 시 0)
+    # 감정 분석 실행 방식: pytorch (transformers 파이프라인) | onnx (int8 양자화 모델)
+    EMOTION_MODEL_BACKEND: Literal["pytorch", "onnx"] = "pytorch"
+    EMOTION_ONNX_MODEL_DIR: str = "models/emotion-onnx-int8"  # export-onnx 출력 위치
+    EMOTION_ONNX_THREADS: int = 0  # 0이면 onnxruntime 기본값
+    AI_WARMUP_ON_STARTUP: bool = False
+    EMOTION_BATCH_MAX_SIZE: int = 16
+    EMOTION_BATCH_MAX_WAIT_MS: float = 5.0
+    SENTIMENT_CACHE_SIZE: int = 10000
+    SENTIMENT_CACHE_REDIS_TTL_SECONDS: int = 60 * 60 * 24 * 7
+
     class Config:
         env_file = ".env"
         case_sensitive = True
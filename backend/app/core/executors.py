@@ -0,0 +1,178 @@
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.core.config import get_settings
+from app.core.metrics import register_metrics_source
+
+T = TypeVar("T")
+
+
+class WorkerPool:
+    """이벤트 루프 밖에서 블로킹 작업을 실행하는 크기 제한 스레드 풀"""
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=f"{self.name}-pool",
+                    )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """풀에서 함수를 실행하고 결과를 기다림"""
+        loop = asyncio.get_running_loop()
+        self._in_flight += 1
+        try:
+            return await loop.run_in_executor(
+                self.executor, functools.partial(func, *args, **kwargs)
+            )
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+        }
+
+
+class PoolSaturatedError(RuntimeError):
+    """대기 중인 작업이 한도에 도달해 새 작업을 받지 않음"""
+
+    def __init__(self, name: str, retry_after: int):
+        super().__init__(f"{name} pool is saturated")
+        self.retry_after = retry_after
+
+
+class ProcessWorkerPool:
+    """GIL을 피해야 하는 CPU 작업용 프로세스 풀 (대기열 크기 제한)
+
+    실행 중 + 대기 중 작업이 max_pending에 도달하면 PoolSaturatedError를
+    발생시켜, 요청이 몰려도 대기열이 무한정 늘어나지 않도록 한다.
+    워커는 spawn으로 시작하므로 함수와 인자는 pickle 가능해야 한다.
+    """
+
+    def __init__(
+        self, name: str, max_workers: int, max_pending: int, retry_after: int = 1
+    ):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """풀에서 함수를 실행하고 결과를 기다림 (포화 시 즉시 거부)"""
+        if self._in_flight >= self.max_pending:
+            self._rejected += 1
+            raise PoolSaturatedError(self.name, self.retry_after)
+
+        loop = asyncio.get_running_loop()
+        self._in_flight += 1
+        try:
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+
+settings = get_settings()
+
+# CPU 바운드 작업 (bcrypt, BERT 추론)과 I/O 바운드 작업 (DB, 외부 API)을 분리해
+# 한쪽이 포화되어도 다른 쪽 작업이 밀리지 않도록 함
+cpu_pool = WorkerPool("cpu", settings.CPU_POOL_WORKERS or os.cpu_count() or 4)
+io_pool = WorkerPool("io", settings.IO_POOL_WORKERS)
+# bcrypt는 요청당 수백 ms를 쓰므로 별도 프로세스 풀에서 실행하고 대기열을 제한해
+# 로그인 폭주가 다른 엔드포인트의 CPU 풀까지 잠식하지 않도록 함
+password_pool = ProcessWorkerPool(
+    "password",
+    settings.PASSWORD_HASH_WORKERS or min(2, os.cpu_count() or 1),
+    settings.PASSWORD_HASH_MAX_PENDING,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER_SECONDS,
+)
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """CPU 바운드 작업을 CPU 풀에서 실행"""
+    return await cpu_pool.run(func, *args, **kwargs)
+
+
+async def run_password_hashing(func: Callable[..., T], *args: Any) -> T:
+    """비밀번호 해싱/검증을 전용 프로세스 풀에서 실행 (포화 시 PoolSaturatedError)"""
+    return await password_pool.run(func, *args)
+
+
+async def run_io_bound(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """블로킹 I/O 작업을 I/O 풀에서 실행"""
+    return await io_pool.run(func, *args, **kwargs)
+
+
+def shutdown_executors():
+    """lifespan 종료 시 풀 정리 (다음 사용 시 다시 생성됨)"""
+    cpu_pool.shutdown()
+    io_pool.shutdown()
+    password_pool.shutdown()
+
+
+register_metrics_source(
+    "executors",
+    lambda: {
+        "cpu": cpu_pool.metrics(),
+        "io": io_pool.metrics(),
+        "password": password_pool.metrics(),
+    },
+)
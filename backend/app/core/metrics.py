@@ -0,0 +1,14 @@
+from typing import Any, Callable, Dict
+
+# 내부 지표 제공자 (이름 → 현재 지표를 반환하는 함수)
+_metrics_sources: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+
+def register_metrics_source(name: str, provider: Callable[[], Dict[str, Any]]):
+    """내부 지표 제공자 등록"""
+    _metrics_sources[name] = provider
+
+
+def collect_metrics() -> Dict[str, Any]:
+    """등록된 모든 지표 수집"""
+    return {name: provider() for name, provider in _metrics_sources.items()}
@@ -1,15 +1,19 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional, Tuple
 
+from app.core.cache import LRUCache
 from app.core.config import get_settings
+from app.core.metrics import register_metrics_source
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 settings = get_settings()
 
-# 비밀번호 해싱 - bcrypt 설정 수정
+# 비밀번호 해싱 - rounds가 설정값과 다른 해시는 needs_update로 판정됨
 pwd_context = CryptContext(
-    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12  # rounds 명시적 설정
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
 )
 
 
@@ -49,6 +53,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """비밀번호 검증 + 해시 설정(rounds)이 바뀌었으면 새 해시 반환"""
+    # 비밀번호 길이 제한 (bcrypt는 72바이트까지만 지원)
+    if len(plain_password.encode("utf-8")) > 72:
+        plain_password = plain_password[:72]
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """비밀번호 해싱"""
     # 비밀번호 길이 제한 (bcrypt는 72바이트까지만 지원)
@@ -57,12 +71,69 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def decode_token(token: str) -> Optional[str]:
-    """토큰 디코딩"""
+class TokenClaims(NamedTuple):
+    """검증된 토큰에서 인증에 쓰는 클레임"""
+
+    sub: Optional[str]
+    type: Optional[str]
+    exp: Optional[float]
+
+
+# 서명 검증을 통과한 토큰의 클레임 캐시 (토큰 원문 대신 SHA-256 다이제스트를 키로 사용)
+# 항목 TTL은 토큰의 남은 유효 시간이므로 토큰보다 오래 남지 않는다.
+_verified_tokens = LRUCache(maxsize=settings.TOKEN_CACHE_SIZE)
+_token_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def decode_token_claims(token: str) -> Optional[TokenClaims]:
+    """토큰 검증 후 클레임 반환 (검증 실패/만료 시 None)"""
+    key = _token_digest(token)
+    claims = _verified_tokens.get(key)
+    if claims is not None:
+        # LRU TTL은 monotonic 기준이므로 exp도 다시 확인
+        if claims.exp > time.time():
+            _token_cache_stats["hits"] += 1
+            return claims
+        _verified_tokens.delete(key)
+
+    _token_cache_stats["misses"] += 1
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        return payload.get("sub")
     except JWTError:
         return None
+
+    exp = payload.get("exp")
+    claims = TokenClaims(
+        sub=payload.get("sub"),
+        type=payload.get("type"),
+        exp=float(exp) if exp is not None else None,
+    )
+    # 만료 시간이 없는 토큰은 캐시하지 않음
+    if claims.exp is not None:
+        remaining = claims.exp - time.time()
+        if remaining > 0:
+            _verified_tokens.set(key, claims, ttl=remaining)
+    return claims
+
+
+def decode_token(token: str) -> Optional[str]:
+    """토큰 디코딩"""
+    claims = decode_token_claims(token)
+    return claims.sub if claims is not None else None
+
+
+def clear_token_cache():
+    """검증 토큰 캐시 비우기 (SECRET_KEY 교체, 테스트용)"""
+    _verified_tokens.clear()
+
+
+register_metrics_source(
+    "token_cache",
+    lambda: {**_token_cache_stats, "size": len(_verified_tokens)},
+)
@@ -1,23 +1,191 @@
+from typing import Any, AsyncGenerator, Iterator, List, Optional, Union
+
 from app.core.config import get_settings
+from app.core.executors import run_io_bound
+from app.core.metrics import register_metrics_source
+from app.db.pool import (
+    enable_sqlite_wal,
+    engine_options,
+    is_sqlite_memory,
+    pool_metrics,
+)
+from sqlalchemy import inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 settings = get_settings()
 
-# 개발/프로덕션에 따라 다른 설정
-if settings.DATABASE_URL.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
-else:
-    connect_args = {}
+# DATABASE_URL 스킴이 비동기 드라이버면 비동기 엔진 모드로 동작
+# (sqlite+aiosqlite: 개발/테스트, postgresql+asyncpg: 운영)
+ASYNC_DRIVERS = {
+    "sqlite+aiosqlite": "sqlite",
+    "postgresql+asyncpg": "postgresql",
+}
+
+
+def is_async_url(url: str) -> bool:
+    return make_url(url).drivername in ASYNC_DRIVERS
+
+
+def to_sync_url(url: str) -> str:
+    """비동기 드라이버 URL을 같은 DB의 동기 드라이버 URL로 변환"""
+    parsed = make_url(url)
+    if parsed.drivername not in ASYNC_DRIVERS:
+        return url
+    return parsed.set(drivername=ASYNC_DRIVERS[parsed.drivername]).render_as_string(
+        hide_password=False
+    )
 
-engine = create_engine(
-    settings.DATABASE_URL, echo=settings.DEBUG, connect_args=connect_args
+
+USE_ASYNC_ENGINE = is_async_url(settings.DATABASE_URL)
+
+SYNC_DATABASE_URL = to_sync_url(settings.DATABASE_URL)
+
+# 동기 엔진: 동기 모드의 요청 처리 및 테이블 생성 같은 관리 작업용
+engine = create_engine(SYNC_DATABASE_URL, **engine_options(SYNC_DATABASE_URL, settings))
+
+# 비동기 엔진: 비동기 모드에서 요청 처리용
+async_engine = (
+    create_async_engine(
+        settings.DATABASE_URL,
+        **engine_options(settings.DATABASE_URL, settings, is_async=True),
+    )
+    if USE_ASYNC_ENGINE
+    else None
 )
 
+if settings.SQLITE_WAL and not is_sqlite_memory(SYNC_DATABASE_URL):
+    if engine.dialect.name == "sqlite":
+        enable_sqlite_wal(engine)
+    if async_engine is not None and async_engine.dialect.name == "sqlite":
+        enable_sqlite_wal(async_engine.sync_engine)
+
 
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
 
 
+def prepare_database(mode: str):
+    """시작 시 DB 준비
+
+    create_all은 테이블을 직접 만들고, verify는 alembic_version 조회 한 번으로
+    스키마가 최신인지만 확인한다 (워커마다 테이블 리플렉션을 하지 않음).
+    빈 DB에 create_all로 만든 스키마는 head와 같으므로 head로 stamp해
+    이후 migrate/verify가 그대로 이어지게 한다.
+    """
+    if mode == "verify":
+        from app.db.migrations import verify_schema
+
+        verify_schema(engine)
+    else:
+        from app.db.migrations import stamp_schema
+
+        empty = not inspect(engine).get_table_names()
+        create_db_and_tables()
+        if empty:
+            stamp_schema(engine)
+
+
 def get_session():
     with Session(engine) as session:
         yield session
+
+
+register_metrics_source(
+    "db_pool",
+    lambda: {
+        "sync": pool_metrics(engine),
+        "async": pool_metrics(async_engine.sync_engine if async_engine else None),
+    },
+)
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    # 커밋 후 속성 만료 시 지연 로딩이 일어나지 않도록 expire_on_commit=False
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+class BufferedResult:
+    """I/O 풀에서 미리 가져온 쿼리 결과"""
+
+    def __init__(self, rows: List[Any]):
+        self._rows = rows
+
+    def all(self) -> List[Any]:
+        return self._rows
+
+    def first(self) -> Optional[Any]:
+        return self._rows[0] if self._rows else None
+
+    def one(self) -> Any:
+        if len(self._rows) != 1:
+            raise ValueError(f"Expected exactly one row, got {len(self._rows)}")
+        return self._rows[0]
+
+    def one_or_none(self) -> Optional[Any]:
+        if len(self._rows) > 1:
+            raise ValueError(f"Expected at most one row, got {len(self._rows)}")
+        return self.first()
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._rows)
+
+
+class OffloadedSession:
+    """동기 Session을 감싸 DB I/O를 I/O 풀에서 실행하는 세션
+
+    핸들러는 `await db.exec(...)`, `await db.commit()` 형태로 사용하며,
+    이벤트 루프 스레드에서는 DB 호출이 일어나지 않는다.
+    """
+
+    def __init__(self, session: Session):
+        # 커밋 후 속성을 읽을 때 이벤트 루프에서 SELECT가 나가지 않도록
+        # AsyncSession과 같이 expire_on_commit=False (최신 값은 refresh로)
+        session.expire_on_commit = False
+        self.session = session
+
+    async def exec(self, statement: Any) -> BufferedResult:
+        return BufferedResult(
+            await run_io_bound(lambda: self.session.exec(statement).all())
+        )
+
+    async def execute(self, statement: Any) -> Any:
+        """행을 돌려받지 않는 문장(INSERT/UPDATE/DELETE) 실행"""
+        return await run_io_bound(self.session.execute, statement)
+
+    def get_bind(self) -> Any:
+        return self.session.get_bind()
+
+    async def get(self, model: Any, ident: Any) -> Optional[Any]:
+        return await run_io_bound(self.session.get, model, ident)
+
+    def add(self, instance: Any):
+        self.session.add(instance)
+
+    def add_all(self, instances: List[Any]):
+        self.session.add_all(instances)
+
+    async def delete(self, instance: Any):
+        await run_io_bound(self.session.delete, instance)
+
+    async def flush(self):
+        await run_io_bound(self.session.flush)
+
+    async def commit(self):
+        await run_io_bound(self.session.commit)
+
+    async def rollback(self):
+        await run_io_bound(self.session.rollback)
+
+    async def refresh(self, instance: Any):
+        await run_io_bound(self.session.refresh, instance)
+
+    async def close(self):
+        await run_io_bound(self.session.close)
+
+
+# 핸들러가 사용하는 세션 타입 (두 모드 모두 await db.exec(...) 형태로 사용)
+DBSession = Union[AsyncSession, OffloadedSession]
@@ -0,0 +1,68 @@
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+class SchemaVersionError(RuntimeError):
+    """DB 스키마 리비전이 코드의 Alembic head와 다름"""
+
+
+def alembic_config(engine: Optional[Engine] = None) -> Config:
+    """작업 디렉터리와 관계없이 쓸 수 있는 Alembic 설정"""
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    if engine is not None:
+        config.attributes["connection"] = engine
+    return config
+
+
+def head_revision() -> Optional[str]:
+    """코드에 포함된 마이그레이션의 head 리비전 (파일만 읽음)"""
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(engine: Engine) -> Optional[str]:
+    """DB에 적용된 리비전 (alembic_version 테이블이 없으면 None)"""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(
+                text("SELECT version_num FROM alembic_version")
+            ).scalar()
+    except DBAPIError:
+        return None
+
+
+def verify_schema(engine: Engine) -> str:
+    """DB가 head 리비전인지 쿼리 한 번으로 확인 (다르면 SchemaVersionError)"""
+    expected = head_revision()
+    current = current_revision(engine)
+    if current is None and inspect(engine).get_table_names():
+        raise SchemaVersionError(
+            "Database has tables but no Alembic revision (created by create_all). "
+            "Run 'alembic stamp <revision>' for the schema it matches "
+            "('0001' if it predates migrations), then 'python -m app.cli migrate'."
+        )
+    if current != expected:
+        raise SchemaVersionError(
+            f"Database schema is at revision {current!r}, expected {expected!r}. "
+            "Run 'python -m app.cli migrate' before starting the app."
+        )
+    return current
+
+
+def upgrade_schema(engine: Engine, revision: str = "head"):
+    """마이그레이션 적용"""
+    command.upgrade(alembic_config(engine), revision)
+
+
+def stamp_schema(engine: Engine, revision: str = "head"):
+    """마이그레이션 실행 없이 리비전만 기록"""
+    command.stamp(alembic_config(engine), revision)
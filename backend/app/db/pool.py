@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional, Type
+
+from app.core.config import Settings
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool, StaticPool
+
+
+class PoolMetrics:
+    """커넥션 풀 체크아웃 지연 및 포화도 지표"""
+
+    def __init__(self, capacity: int, window: int = 1000):
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=window)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.peak_checked_out = 0
+
+    def record_checkout(self, wait: float, checked_out: int):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            self._waits.append(wait)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def _percentile(self, waits, q: float) -> float:
+        if not waits:
+            return 0.0
+        return waits[min(len(waits) - 1, int(len(waits) * q))]
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._waits)
+        checked_out = pool.checkedout() if isinstance(pool, QueuePool) else 0
+        return {
+            "pool": type(pool).__name__,
+            "capacity": self.capacity,
+            "checked_out": checked_out,
+            "peak_checked_out": self.peak_checked_out,
+            "saturation": round(checked_out / self.capacity, 3),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "checkout_wait_ms": {
+                "avg": round(self.total_wait / self.checkouts * 1000, 3)
+                if self.checkouts
+                else 0,
+                "p95": round(self._percentile(waits, 0.95) * 1000, 3),
+                "p99": round(self._percentile(waits, 0.99) * 1000, 3),
+                "max": round(self.max_wait * 1000, 3),
+            },
+        }
+
+
+class InstrumentedPoolMixin:
+    """체크아웃 대기 시간을 기록하는 풀 (QueuePool 계열과 함께 사용)"""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start, self.checkedout())
+        return connection
+
+
+def instrumented_pool_class(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    # 엔진 dispose 시 풀은 self.__class__로 재생성되므로 지표는 클래스에 보관
+    return type(
+        f"Instrumented{base.__name__}",
+        (InstrumentedPoolMixin, base),
+        {"metrics": metrics},
+    )
+
+
+def is_sqlite_memory(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def engine_options(
+    url: str, settings: Settings, is_async: bool = False
+) -> Dict[str, Any]:
+    """DATABASE_URL과 설정에 맞는 create_engine 인자"""
+    options: Dict[str, Any] = {"echo": settings.DB_ECHO}
+
+    if make_url(url).get_backend_name() == "sqlite" and not is_async:
+        options["connect_args"] = {"check_same_thread": False}
+
+    # 인메모리 SQLite는 커넥션이 하나뿐이어야 데이터가 유지됨
+    if is_sqlite_memory(url):
+        options["poolclass"] = StaticPool
+        return options
+
+    metrics = PoolMetrics(capacity=settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+    base = AsyncAdaptedQueuePool if is_async else QueuePool
+    options.update(
+        poolclass=instrumented_pool_class(base, metrics),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    return options
+
+
+def enable_sqlite_wal(engine: Engine):
+    """파일 SQLite에서 WAL 모드 사용 (읽기와 쓰기가 서로를 막지 않음)"""
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
+def pool_metrics(engine: Optional[Engine]) -> Optional[Dict[str, Any]]:
+    """엔진 풀 지표 (계측되지 않은 풀이면 None)"""
+    if engine is None:
+        return None
+    metrics = getattr(type(engine.pool), "metrics", None)
+    if metrics is None:
+        return {"pool": type(engine.pool).__name__}
+    return metrics.snapshot(engine.pool)
@@ -1,24 +1,62 @@
+import asyncio
+import time
 from contextlib import asynccontextmanager
 
+from app.api.pagination import NEXT_CURSOR_HEADER
 from app.api.v1.api import api_router  # 추가
 from app.core.config import get_settings
-from app.db.database import create_db_and_tables
+from app.core.executors import run_cpu_bound, run_io_bound, shutdown_executors
+from app.core.metrics import collect_metrics
+from app.db.database import prepare_database
+from app.services.ai_providers import dependency_status
+from app.services.feedback_scheduler import get_feedback_scheduler
+from app.services.model_registry import model_registry
+from app.services.openai_pool import close_openai_pool
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 settings = get_settings()
 
+# 마지막 시작 과정 소요 시간 (/health로 노출)
+startup_stats = {}
+
 
 # 라이프사이클 이벤트
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작 시
     print("Starting up ADHD Helper API...")
-    create_db_and_tables()
-    print("Database tables created")
+    started = time.perf_counter()
+    await run_io_bound(prepare_database, settings.DB_STARTUP_MODE)
+    startup_stats.update(
+        db_startup_mode=settings.DB_STARTUP_MODE,
+        duration_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
+    print(f"Database ready ({settings.DB_STARTUP_MODE})")
+    warmup_task = None
+    if settings.AI_WARMUP_ON_STARTUP:
+        # 모델 로드는 CPU 풀에서 백그라운드로 진행하고, 준비 상태는 /health로 노출
+        warmup_task = asyncio.create_task(run_cpu_bound(model_registry.warm_up))
+        print("Emotion analyzer warm-up started")
+    scheduler_task = None
+    if settings.FEEDBACK_SCHEDULER_ENABLED:
+        # 워커가 여러 개여도 작업 선점은 DB 조건부 UPDATE로 하므로 중복 생성 없음
+        scheduler_task = asyncio.create_task(get_feedback_scheduler().run_forever())
+        print("Daily feedback scheduler started")
     yield
     # 종료 시
     print("Shutting down ADHD Helper API...")
+    if scheduler_task is not None:
+        scheduler_task.cancel()
+        try:
+            await scheduler_task
+        except asyncio.CancelledError:
+            pass
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    await close_openai_pool()
+    shutdown_executors()
 
 
 # FastAPI 앱 생성
@@ -27,6 +65,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="ADHD 도우미 백엔드 API",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS 설정
@@ -36,6 +75,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "Retry-After"],
 )
 
 # API 라우터 추가
@@ -55,4 +95,18 @@ def read_root():
 # 헬스 체크
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "startup": startup_stats,
+        "models": {
+            **model_registry.status(),
+            "emotion_backend": settings.EMOTION_MODEL_BACKEND,
+        },
+        "ai_dependencies": dependency_status(),
+    }
+
+
+# 내부 지표 (운영 환경에서는 프록시에서 외부 접근 차단)
+@app.get("/internal/metrics", include_in_schema=False)
+def internal_metrics():
+    return collect_metrics()
@@ -10,6 +10,8 @@ from app.models.feedback import (
     AIFeedback,
     AIFeedbackCreate,
     AIFeedbackRead,
+    FeedbackJob,
+    FeedbackJobStatus,
     FeedbackType,
 )
 from app.models.focus import (
@@ -17,10 +19,13 @@ from app.models.focus import (
     FocusSessionCreate,
     FocusSessionRead,
     FocusSessionUpdate,
+    FocusStatsGroupBy,
     SessionType,
 )
+from app.models.stats import DailyUserStats
+from app.models.sync import SyncEntity, Tombstone
 from app.models.todo import TodoItem, TodoItemCreate, TodoItemRead, TodoItemUpdate
-from app.models.user import User, UserCreate, UserRead, UserUpdate
+from app.models.user import CurrentUser, User, UserCreate, UserRead, UserUpdate
 
 __all__ = [
     "BaseModel",
@@ -28,6 +33,7 @@ __all__ = [
     "UserCreate",
     "UserRead",
     "UserUpdate",
+    "CurrentUser",
     "EmotionRecord",
     "EmotionRecordCreate",
     "EmotionRecordRead",
@@ -37,6 +43,7 @@ __all__ = [
     "FocusSessionCreate",
     "FocusSessionRead",
     "FocusSessionUpdate",
+    "FocusStatsGroupBy",
     "SessionType",
     "TodoItem",
     "TodoItemCreate",
@@ -46,4 +53,9 @@ __all__ = [
     "AIFeedbackCreate",
     "AIFeedbackRead",
     "FeedbackType",
+    "FeedbackJob",
+    "FeedbackJobStatus",
+    "DailyUserStats",
+    "SyncEntity",
+    "Tombstone",
 ]
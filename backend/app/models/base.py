@@ -12,4 +12,9 @@ class BaseModel(SQLModel):
         default_factory=uuid_lib.uuid4, primary_key=True, index=True, nullable=False
     )
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default=None, nullable=True)
+    # 동기화(델타 조회) 기준 시각 - 생성 시 채우고 ORM UPDATE마다 갱신
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        nullable=True,
+        sa_column_kwargs={"onupdate": datetime.utcnow},
+    )
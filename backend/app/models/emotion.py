@@ -4,6 +4,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
 from app.models.base import BaseModel
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -41,6 +42,22 @@ class EmotionRecord(EmotionRecordBase, BaseModel, table=True):
     user: Optional["User"] = Relationship(back_populates="emotion_records")
 
 
+# 목록(키셋 페이지네이션)과 기간 조회용 인덱스
+Index(
+    "ix_emotion_records_user_recorded_at",
+    EmotionRecord.user_id,
+    EmotionRecord.recorded_at.desc(),
+    EmotionRecord.id.desc(),
+)
+
+# 동기화 델타 조회용 인덱스 (updated_at > 워터마크)
+Index(
+    "ix_emotion_records_user_updated_at",
+    EmotionRecord.user_id,
+    EmotionRecord.updated_at,
+)
+
+
 class EmotionRecordCreate(EmotionRecordBase):
     """EmotionRecord 생성 스키마"""
 
@@ -50,8 +67,8 @@ class EmotionRecordCreate(EmotionRecordBase):
 class EmotionRecordRead(EmotionRecordBase):
     """EmotionRecord 읽기 스키마"""
 
-    id: str
-    user_id: str
+    id: uuid_lib.UUID
+    user_id: uuid_lib.UUID
     ai_analysis: Optional[str]
     created_at: datetime
 
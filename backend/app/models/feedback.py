@@ -1,9 +1,10 @@
 import uuid as uuid_lib
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
 from app.models.base import BaseModel
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -35,11 +36,32 @@ class AIFeedback(AIFeedbackBase, BaseModel, table=True):
     ai_metadata: Optional[str] = Field(
         default=None, max_length=1000
     )  # metadata → ai_metadata로 변경
+    # 생성 입력(요약 + 유형) 지문 — 입력이 같으면 기존 피드백 재사용
+    input_fingerprint: Optional[str] = Field(default=None, max_length=64)
 
     # Relationship
     user: Optional["User"] = Relationship(back_populates="ai_feedbacks")
 
 
+# 최근 피드백 목록 조회용 인덱스
+Index(
+    "ix_ai_feedbacks_user_created_at",
+    AIFeedback.user_id,
+    AIFeedback.created_at.desc(),
+)
+
+# 동기화 델타 조회용 인덱스 (updated_at > 워터마크)
+Index("ix_ai_feedbacks_user_updated_at", AIFeedback.user_id, AIFeedback.updated_at)
+
+# 같은 입력으로 최근 생성된 피드백 조회용 인덱스
+Index(
+    "ix_ai_feedbacks_user_fingerprint",
+    AIFeedback.user_id,
+    AIFeedback.input_fingerprint,
+    AIFeedback.created_at,
+)
+
+
 class AIFeedbackCreate(AIFeedbackBase):
     """AIFeedback 생성 스키마"""
 
@@ -49,7 +71,35 @@ class AIFeedbackCreate(AIFeedbackBase):
 class AIFeedbackRead(AIFeedbackBase):
     """AIFeedback 읽기 스키마"""
 
-    id: str
-    user_id: str
+    id: uuid_lib.UUID
+    user_id: uuid_lib.UUID
     ai_metadata: Optional[str]  # metadata → ai_metadata로 변경
     created_at: datetime
+
+
+class FeedbackJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+class FeedbackJob(SQLModel, table=True):
+    """사용자별 일일 피드백 생성 작업 (스케줄러 진행 상태, 재시작 시 이어서 처리)"""
+
+    __tablename__ = "feedback_jobs"
+
+    user_id: uuid_lib.UUID = Field(foreign_key="users.id", primary_key=True)
+    local_date: date = Field(primary_key=True)  # 사용자 시간대 기준 날짜
+    due_at: datetime  # UTC
+    status: FeedbackJobStatus = Field(default=FeedbackJobStatus.PENDING)
+    attempts: int = Field(default=0)
+    claimed_at: Optional[datetime] = Field(default=None)
+    finished_at: Optional[datetime] = Field(default=None)
+    feedback_id: Optional[uuid_lib.UUID] = Field(default=None)
+    error: Optional[str] = Field(default=None, max_length=500)
+
+
+# 처리할 작업 조회용 인덱스 (상태별 due_at 순)
+Index("ix_feedback_jobs_status_due_at", FeedbackJob.status, FeedbackJob.due_at)
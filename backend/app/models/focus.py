@@ -4,6 +4,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
 from app.models.base import BaseModel
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -17,6 +18,12 @@ class SessionType(str, Enum):
     CUSTOM = "custom"
 
 
+class FocusStatsGroupBy(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    SESSION_TYPE = "session_type"
+
+
 class FocusSessionBase(SQLModel):
     """FocusSession 기본 스키마"""
 
@@ -39,6 +46,29 @@ class FocusSession(FocusSessionBase, BaseModel, table=True):
     user: Optional["User"] = Relationship(back_populates="focus_sessions")
 
 
+# 목록(키셋 페이지네이션)과 기간 조회용 인덱스
+Index(
+    "ix_focus_sessions_user_start_time",
+    FocusSession.user_id,
+    FocusSession.start_time.desc(),
+    FocusSession.id.desc(),
+)
+
+# 진행 중인 세션 조회용 부분 인덱스 (종료되지 않은 세션만 포함)
+Index(
+    "ix_focus_sessions_user_open",
+    FocusSession.user_id,
+    FocusSession.start_time.desc(),
+    sqlite_where=text("end_time IS NULL"),
+    postgresql_where=text("end_time IS NULL"),
+)
+
+# 동기화 델타 조회용 인덱스 (updated_at > 워터마크)
+Index(
+    "ix_focus_sessions_user_updated_at", FocusSession.user_id, FocusSession.updated_at
+)
+
+
 class FocusSessionCreate(FocusSessionBase):
     """FocusSession 생성 스키마"""
 
@@ -48,8 +78,8 @@ class FocusSessionCreate(FocusSessionBase):
 class FocusSessionRead(FocusSessionBase):
     """FocusSession 읽기 스키마"""
 
-    id: str
-    user_id: str
+    id: uuid_lib.UUID
+    user_id: uuid_lib.UUID
     created_at: datetime
 
 
@@ -0,0 +1,44 @@
+import uuid as uuid_lib
+from datetime import date
+
+from app.models.emotion import EmotionType
+from app.models.focus import SessionType
+from sqlmodel import Field, SQLModel
+
+
+class DailyUserStats(SQLModel, table=True):
+    """사용자별 일간 통계 롤업
+
+    감정/집중 기록이 바뀔 때마다 증분 갱신되며, 통계 조회는
+    원본 기록 대신 이 테이블의 일 단위 행을 읽는다. 날짜는 UTC 기준.
+    """
+
+    __tablename__ = "daily_user_stats"
+
+    user_id: uuid_lib.UUID = Field(foreign_key="users.id", primary_key=True)
+    day: date = Field(primary_key=True)
+
+    # 감정 기록 (recorded_at 기준)
+    happy_count: int = Field(default=0)
+    sad_count: int = Field(default=0)
+    anxious_count: int = Field(default=0)
+    calm_count: int = Field(default=0)
+    excited_count: int = Field(default=0)
+    angry_count: int = Field(default=0)
+    neutral_count: int = Field(default=0)
+    emotion_level_sum: int = Field(default=0)
+
+    # 종료된 집중 세션 (start_time 기준)
+    focus_sessions: int = Field(default=0)
+    focus_minutes: int = Field(default=0)
+    focus_rated_sessions: int = Field(default=0)
+    focus_rating_sum: int = Field(default=0)
+    pomodoro_minutes: int = Field(default=0)
+    deep_work_minutes: int = Field(default=0)
+    break_minutes: int = Field(default=0)
+    custom_minutes: int = Field(default=0)
+
+
+# 감정 타입 / 세션 타입별 롤업 컬럼 이름
+EMOTION_COUNT_COLUMNS = {t: f"{t.value}_count" for t in EmotionType}
+FOCUS_MINUTES_COLUMNS = {t: f"{t.value}_minutes" for t in SessionType}
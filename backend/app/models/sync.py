@@ -0,0 +1,28 @@
+import uuid as uuid_lib
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+
+class SyncEntity(str, Enum):
+    EMOTION = "emotion"
+    FOCUS_SESSION = "focus_session"
+    TODO = "todo"
+    FEEDBACK = "feedback"
+
+
+class Tombstone(SQLModel, table=True):
+    """삭제된 기록 (동기화 클라이언트에 삭제를 전달하기 위해 보관)"""
+
+    __tablename__ = "tombstones"
+
+    record_id: uuid_lib.UUID = Field(primary_key=True)
+    user_id: uuid_lib.UUID = Field(foreign_key="users.id")
+    entity: SyncEntity
+    deleted_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+
+
+# 워터마크 이후 삭제 조회용 인덱스
+Index("ix_tombstones_user_deleted_at", Tombstone.user_id, Tombstone.deleted_at)
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
 from app.models.base import BaseModel
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -31,6 +32,28 @@ class TodoItem(TodoItemBase, BaseModel, table=True):
     user: Optional["User"] = Relationship(back_populates="todo_items")
 
 
+# 목록 정렬 순서(미완료 → 우선순위 → 최신순)와 같은 인덱스
+Index(
+    "ix_todo_items_user_list_order",
+    TodoItem.user_id,
+    TodoItem.completed,
+    TodoItem.priority.desc(),
+    TodoItem.created_at.desc(),
+    TodoItem.id.desc(),
+)
+
+# 통계 집계용 커버링 인덱스
+Index(
+    "ix_todo_items_user_completed_due",
+    TodoItem.user_id,
+    TodoItem.completed,
+    TodoItem.due_date,
+)
+
+# 동기화 델타 조회용 인덱스 (updated_at > 워터마크)
+Index("ix_todo_items_user_updated_at", TodoItem.user_id, TodoItem.updated_at)
+
+
 class TodoItemCreate(TodoItemBase):
     """TodoItem 생성 스키마"""
 
@@ -40,8 +63,8 @@ class TodoItemCreate(TodoItemBase):
 class TodoItemRead(TodoItemBase):
     """TodoItem 읽기 스키마"""
 
-    id: str
-    user_id: str
+    id: uuid_lib.UUID
+    user_id: uuid_lib.UUID
     completed_at: Optional[datetime]
     created_at: datetime
 
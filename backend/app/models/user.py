@@ -1,4 +1,5 @@
 import json
+import uuid as uuid_lib
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
@@ -58,7 +59,14 @@ class UserCreate(UserBase):
 class UserRead(UserBase):
     """User 읽기 스키마"""
 
-    id: str
+    id: uuid_lib.UUID
+    created_at: datetime
+
+
+class CurrentUser(UserBase):
+    """인증된 사용자 식별 정보 (캐시에 보관, 비밀번호/설정 제외)"""
+
+    id: uuid_lib.UUID
     created_at: datetime
 
 
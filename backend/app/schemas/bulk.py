@@ -0,0 +1,36 @@
+import uuid
+from typing import Any, Dict, List
+
+from app.core.config import get_settings
+from pydantic import BaseModel, Field
+
+settings = get_settings()
+
+
+class BulkCreateRequest(BaseModel):
+    """일괄 생성 요청 스키마 (항목은 엔드포인트에서 하나씩 검증)"""
+
+    items: List[Dict[str, Any]] = Field(
+        min_length=1, max_length=settings.BULK_MAX_ITEMS
+    )
+
+
+class BulkCreatedItem(BaseModel):
+    """생성된 항목 (index는 요청 items에서의 위치)"""
+
+    index: int
+    id: uuid.UUID
+
+
+class BulkItemError(BaseModel):
+    """검증에 실패한 항목"""
+
+    index: int
+    errors: List[Dict[str, Any]]
+
+
+class BulkCreateResponse(BaseModel):
+    """일괄 생성 결과 스키마"""
+
+    created: List[BulkCreatedItem]
+    errors: List[BulkItemError]
@@ -0,0 +1,29 @@
+import uuid
+from datetime import datetime
+from typing import List
+
+from app.models.emotion import EmotionRecordRead
+from app.models.feedback import AIFeedbackRead
+from app.models.focus import FocusSessionRead
+from app.models.sync import SyncEntity
+from app.models.todo import TodoItemRead
+from pydantic import BaseModel
+
+
+class DeletedRecord(BaseModel):
+    """워터마크 이후 삭제된 기록"""
+
+    entity: SyncEntity
+    record_id: uuid.UUID
+    deleted_at: datetime
+
+
+class SyncResponse(BaseModel):
+    """동기화 응답 스키마 (다음 요청에는 watermark를 since로 전달)"""
+
+    watermark: datetime
+    emotions: List[EmotionRecordRead]
+    focus_sessions: List[FocusSessionRead]
+    todos: List[TodoItemRead]
+    feedbacks: List[AIFeedbackRead]
+    deleted: List[DeletedRecord]
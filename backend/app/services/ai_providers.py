@@ -0,0 +1,77 @@
+"""AI 선택 의존성(openai, transformers, onnxruntime) 지연 로드
+
+무거운 패키지는 실제로 처음 쓰일 때 import 하므로, AI 기능을 쓰지 않는
+워커·CLI·테스트는 패키지 설치 여부와 관계없이 빠르게 시작한다.
+"""
+
+import importlib
+import importlib.util
+import threading
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+
+class AIDependencyError(RuntimeError):
+    """AI 기능에 필요한 선택 패키지가 설치되지 않음"""
+
+
+class OptionalDependency:
+    """처음 사용할 때 import 되는 선택 패키지"""
+
+    def __init__(self, module_name: str, install_hint: str):
+        self.module_name = module_name
+        self.install_hint = install_hint
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        """import 하지 않고 설치 여부만 확인"""
+        if self._module is not None:
+            return True
+        return importlib.util.find_spec(self.module_name) is not None
+
+    def load(self) -> ModuleType:
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    try:
+                        self._module = importlib.import_module(self.module_name)
+                    except ImportError as e:
+                        raise AIDependencyError(
+                            f"{self.module_name} is not installed "
+                            f"(pip install {self.install_hint}): {e}"
+                        ) from e
+        return self._module
+
+
+openai_dependency = OptionalDependency("openai", "openai==1.3.0")
+transformers_dependency = OptionalDependency(
+    "transformers", "transformers==4.35.0 torch==2.1.0"
+)
+# ONNX 감정 분석 백엔드: 실행은 onnxruntime, 내보내기는 torch + onnx 추가 필요
+onnxruntime_dependency = OptionalDependency("onnxruntime", "onnxruntime==1.16.3")
+torch_dependency = OptionalDependency("torch", "torch==2.1.0")
+onnx_dependency = OptionalDependency("onnx", "onnx==1.15.0")
+
+
+def create_async_openai_client(api_key: str, **options: Any) -> Any:
+    """사용자 API 키로 비동기 OpenAI 클라이언트 생성 (options는 AsyncOpenAI 인자)"""
+    return openai_dependency.load().AsyncOpenAI(api_key=api_key, **options)
+
+
+def create_sentiment_pipeline(model: str, device: int) -> Any:
+    """HuggingFace 감정 분석 파이프라인 생성 (로컬 실행)"""
+    pipeline = transformers_dependency.load().pipeline
+    return pipeline("sentiment-analysis", model=model, device=device)
+
+
+def dependency_status() -> Dict[str, bool]:
+    """선택 패키지 설치 여부"""
+    return {
+        dependency.module_name: dependency.available()
+        for dependency in (
+            openai_dependency,
+            transformers_dependency,
+            onnxruntime_dependency,
+        )
+    }
@@ -1,67 +1,119 @@
+import hashlib
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-import openai
+from app.db.database import DBSession
 from app.models.emotion import EmotionRecord
 from app.models.feedback import AIFeedback, FeedbackType
 from app.models.focus import FocusSession
 from app.models.todo import TodoItem
-from sqlmodel import Session, select
-from transformers import pipeline
+from app.services.ai_providers import openai_dependency
+from app.services.model_registry import model_registry
+from app.services.openai_pool import get_openai_pool
+from app.services.sentiment_cache import (
+    get_sentiment_cache,
+    normalize_text,
+    sentiment_cache_key,
+)
+from sqlmodel import select
 
 logger = logging.getLogger(__name__)
 
 
+def feedback_fingerprint(summaries: Dict[str, str], feedback_type: Any) -> str:
+    """피드백 입력(요약 + 유형) 지문 — 같으면 같은 프롬프트가 만들어짐"""
+    payload = json.dumps(
+        {"summaries": summaries, "feedback_type": FeedbackType(feedback_type).value},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 class AIService:
-    def __init__(self):
-        # HuggingFace 감정 분석 모델 초기화 (로컬 실행)
-        try:
-            self.emotion_analyzer = pipeline(
-                "sentiment-analysis",
-                model="nlptown/bert-base-multilingual-uncased-sentiment",
-                device=-1,  # CPU 사용 (GPU 사용 시 0)
-            )
-        except Exception as e:
-            logger.error(f"Failed to load emotion analyzer: {e}")
-            self.emotion_analyzer = None
+    def __init__(self, emotion_analyzer: Optional[Any] = None):
+        # 감정 분석 모델은 프로세스 단위 레지스트리에서 빌려 씀 (요청마다 로드하지 않음)
+        self._emotion_analyzer = emotion_analyzer
+
+    @property
+    def emotion_analyzer(self) -> Optional[Any]:
+        if self._emotion_analyzer is None:
+            self._emotion_analyzer = model_registry.get_emotion_analyzer()
+        return self._emotion_analyzer
 
     def analyze_emotion_text(self, text: str) -> Dict[str, Any]:
         """텍스트 감정 분석 (HuggingFace)"""
-        if not text or not self.emotion_analyzer:
-            return {}
-
+        return self.analyze_emotion_texts([text])[0]
+
+    def analyze_emotion_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """여러 텍스트를 한 번의 파이프라인 호출로 감정 분석 (캐시 우선)"""
+        analyses: List[Dict[str, Any]] = [{} for _ in texts]
+        cache = get_sentiment_cache()
+
+        # 캐시 미스만 모델에 전달 (같은 배치 안의 중복 텍스트는 한 번만 분석)
+        misses: Dict[str, List[int]] = {}
+        inputs: Dict[str, str] = {}
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            key = sentiment_cache_key(text)
+            cached = cache.get(key)
+            if cached is not None:
+                analyses[i] = self._to_emotion_analysis(cached)
+                continue
+            misses.setdefault(key, []).append(i)
+            inputs[key] = normalize_text(text)  # 최대 512자
+
+        if not misses or not self.emotion_analyzer:
+            return analyses
+
+        keys = list(misses)
         try:
-            results = self.emotion_analyzer(text[:512])  # 최대 512자
-
-            # 결과를 1-5 스케일로 변환
-            if results:
-                result = results[0]
-                # nlptown 모델은 1-5 별점을 반환
-                stars = int(result["label"].split()[0])
-                confidence = result["score"]
-
-                # 감정 추론
-                emotion_inference = {
-                    1: "very_negative",
-                    2: "negative",
-                    3: "neutral",
-                    4: "positive",
-                    5: "very_positive",
-                }
+            results = self.emotion_analyzer(
+                [inputs[key] for key in keys], batch_size=len(keys)
+            )
 
-                return {
-                    "sentiment_score": stars,
-                    "confidence": confidence,
-                    "emotion_inference": emotion_inference.get(stars, "neutral"),
-                    "analyzed_at": datetime.utcnow().isoformat(),
-                }
+            for key, result in zip(keys, results or []):
+                # 분석 시각은 반환할 때마다 새로 넣으므로 모델 출력만 캐시
+                output = {"label": result["label"], "score": result["score"]}
+                cache.set(key, output)
+                for i in misses[key]:
+                    analyses[i] = self._to_emotion_analysis(output)
         except Exception as e:
             logger.error(f"Emotion analysis failed: {e}")
-            return {}
 
-    def generate_feedback_with_gpt(
+        return analyses
+
+    def cached_emotion_analysis(self, text: str) -> Optional[Dict[str, Any]]:
+        """프로세스 내 캐시에 결과가 있을 때만 반환 (모델, Redis 호출 없음)"""
+        output = get_sentiment_cache().get_local(sentiment_cache_key(text))
+        return self._to_emotion_analysis(output) if output is not None else None
+
+    def _to_emotion_analysis(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """파이프라인 결과(라벨, 점수)를 1-5 스케일로 변환 (호출마다 새 dict)"""
+        # nlptown 모델은 1-5 별점을 반환
+        stars = int(result["label"].split()[0])
+        confidence = result["score"]
+
+        # 감정 추론
+        emotion_inference = {
+            1: "very_negative",
+            2: "negative",
+            3: "neutral",
+            4: "positive",
+            5: "very_positive",
+        }
+
+        return {
+            "sentiment_score": stars,
+            "confidence": confidence,
+            "emotion_inference": emotion_inference.get(stars, "neutral"),
+            "analyzed_at": datetime.utcnow().isoformat(),
+        }
+
+    async def generate_feedback_with_gpt(
         self,
         user_api_key: str,
         user_name: str,
@@ -69,53 +121,104 @@ class AIService:
         sessions: list[FocusSession],
         todos: list[TodoItem],
         feedback_type: FeedbackType = FeedbackType.DAILY_SUMMARY,
+        summaries: Optional[Dict[str, str]] = None,
     ) -> Optional[str]:
-        """GPT를 사용한 개인화된 피드백 생성"""
+        """GPT를 사용한 개인화된 피드백 생성 (summaries를 주면 요약을 다시 만들지 않음)"""
 
         if not user_api_key:
             return None
 
-        try:
-            # OpenAI 클라이언트 설정 (사용자 API 키 사용)
-            client = openai.OpenAI(api_key=user_api_key)
+        # openai는 첫 호출 때 import (미설치 시 AIDependencyError)
+        openai = openai_dependency.load()
 
+        try:
             # 데이터 요약 생성
-            emotion_summary = self._summarize_emotions(emotions)
-            focus_summary = self._summarize_focus(sessions)
-            todo_summary = self._summarize_todos(todos)
+            if summaries is None:
+                summaries = self.summarize_inputs(emotions, sessions, todos)
 
-            # 프롬프트 생성
-            prompt = self._create_feedback_prompt(
-                user_name, emotion_summary, focus_summary, todo_summary, feedback_type
-            )
-
-            # GPT API 호출
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a supportive ADHD coach providing personalized feedback in Korean.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=500,
-                temperature=0.7,
+            # GPT API 호출 (사용자 API 키별 풀 클라이언트, 재시도 포함)
+            response = await get_openai_pool().chat_completion(
+                user_api_key,
+                **self._feedback_request(user_name, summaries, feedback_type),
             )
 
             return response.choices[0].message.content
 
-        except openai.AuthenticationError:
+        except Exception as e:
+            raise self._feedback_error(openai, e)
+
+    async def stream_feedback_with_gpt(
+        self,
+        user_api_key: str,
+        user_name: str,
+        summaries: Dict[str, str],
+        feedback_type: FeedbackType = FeedbackType.DAILY_SUMMARY,
+    ) -> AsyncIterator[str]:
+        """GPT 피드백을 생성되는 대로 조각 단위로 전달
+
+        소비를 멈추면(클라이언트 연결 끊김) 업스트림 스트림도 함께 닫힌다.
+        """
+        openai = openai_dependency.load()
+        chunks = get_openai_pool().stream_chat_completion(
+            user_api_key, **self._feedback_request(user_name, summaries, feedback_type)
+        )
+        try:
+            async for text in chunks:
+                yield text
+        except Exception as e:
+            raise self._feedback_error(openai, e)
+        finally:
+            await chunks.aclose()
+
+    def _feedback_request(
+        self, user_name: str, summaries: Dict[str, str], feedback_type: FeedbackType
+    ) -> Dict[str, Any]:
+        """피드백 생성용 chat.completions 요청 인자"""
+        prompt = self._create_feedback_prompt(
+            user_name,
+            summaries["emotions"],
+            summaries["focus"],
+            summaries["todos"],
+            feedback_type,
+        )
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a supportive ADHD coach providing personalized feedback in Korean.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": 500,
+            "temperature": 0.7,
+        }
+
+    def _feedback_error(self, openai: Any, error: Exception) -> ValueError:
+        """OpenAI 오류 → 사용자에게 보여줄 ValueError"""
+        if isinstance(error, openai.AuthenticationError):
             logger.error("Invalid OpenAI API key")
-            raise ValueError("유효하지 않은 OpenAI API 키입니다.")
-        except openai.RateLimitError:
+            return ValueError("유효하지 않은 OpenAI API 키입니다.")
+        if isinstance(error, openai.RateLimitError):
             logger.error("OpenAI rate limit exceeded")
-            raise ValueError(
+            return ValueError(
                 "API 사용량 한도를 초과했습니다. 잠시 후 다시 시도해주세요."
             )
-        except Exception as e:
-            logger.error(f"GPT feedback generation failed: {e}")
-            raise ValueError(f"피드백 생성 중 오류가 발생했습니다: {str(e)}")
+        logger.error(f"GPT feedback generation failed: {error}")
+        return ValueError(f"피드백 생성 중 오류가 발생했습니다: {str(error)}")
+
+    def summarize_inputs(
+        self,
+        emotions: list[EmotionRecord],
+        sessions: list[FocusSession],
+        todos: list[TodoItem],
+    ) -> Dict[str, str]:
+        """프롬프트에 들어갈 데이터 요약 (지문 계산에도 사용)"""
+        return {
+            "emotions": self._summarize_emotions(emotions),
+            "focus": self._summarize_focus(sessions),
+            "todos": self._summarize_todos(todos),
+        }
 
     def _summarize_emotions(self, emotions: list[EmotionRecord]) -> str:
         """감정 기록 요악"""
@@ -238,32 +341,35 @@ class AIService:
 class AIBackgroundService:
     """백그라운드 AI 작업 서비스"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: DBSession):
         self.db = db
         self.ai_service = AIService()
 
     async def process_emotion_analysis(self, emotion_id: str, text: str):
         """감정 기록에 대한 AI 분석 수행"""
+        from app.services.emotion_batcher import get_emotion_batcher
+
         try:
-            analysis = self.ai_service.analyze_emotion_text(text)
+            analysis = await get_emotion_batcher().analyze(text)
 
             if analysis:
-                emotion = self.db.exec(
+                result = await self.db.exec(
                     select(EmotionRecord).where(EmotionRecord.id == emotion_id)
-                ).first()
+                )
+                emotion = result.first()
 
                 if emotion:
                     emotion.ai_analysis = json.dumps(analysis)
                     self.db.add(emotion)
-                    self.db.commit()
+                    await self.db.commit()
         except Exception as e:
             logger.error(f"Failed to process emotion analysis: {e}")
 
     async def generate_daily_feedback(self, user_id: str):
-        """일일 피드백 생성"""
+        """일일 피드백 생성 (오늘 UTC 기준)"""
         from app.models.user import User
 
-        user = self.db.exec(select(User).where(User.id == user_id)).first()
+        user = (await self.db.exec(select(User).where(User.id == user_id))).first()
         if not user:
             return
 
@@ -273,55 +379,79 @@ class AIBackgroundService:
         if not api_key or not settings.get("enable_ai_analysis", True):
             return
 
-        # 오늘의 데이터 수집
-        today = datetime.utcnow().date()
-        start_of_day = datetime.combine(today, datetime.min.time())
+        start_of_day = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+
+        try:
+            feedback = await self.build_daily_feedback(
+                user, api_key, start_of_day, start_of_day + timedelta(days=1)
+            )
+            if feedback:
+                self.db.add(feedback)
+                await self.db.commit()
 
-        emotions = self.db.exec(
-            select(EmotionRecord).where(
-                EmotionRecord.user_id == user_id,
-                EmotionRecord.recorded_at >= start_of_day,
+        except Exception as e:
+            logger.error(f"Failed to generate daily feedback: {e}")
+
+    async def build_daily_feedback(
+        self, user: Any, api_key: str, start: datetime, end: datetime
+    ) -> Optional[AIFeedback]:
+        """[start, end) 기간 데이터로 일일 피드백 생성 (저장은 호출한 쪽에서)"""
+        emotions = (
+            await self.db.exec(
+                select(EmotionRecord).where(
+                    EmotionRecord.user_id == user.id,
+                    EmotionRecord.recorded_at >= start,
+                    EmotionRecord.recorded_at < end,
+                )
             )
         ).all()
 
-        sessions = self.db.exec(
-            select(FocusSession).where(
-                FocusSession.user_id == user_id, FocusSession.start_time >= start_of_day
+        sessions = (
+            await self.db.exec(
+                select(FocusSession).where(
+                    FocusSession.user_id == user.id,
+                    FocusSession.start_time >= start,
+                    FocusSession.start_time < end,
+                )
             )
         ).all()
 
-        todos = self.db.exec(select(TodoItem).where(TodoItem.user_id == user_id)).all()
+        todos = (
+            await self.db.exec(select(TodoItem).where(TodoItem.user_id == user.id))
+        ).all()
 
-        try:
-            # 피드백 생성
-            feedback_text = self.ai_service.generate_feedback_with_gpt(
-                api_key,
-                user.name,
-                emotions,
-                sessions,
-                todos,
-                FeedbackType.DAILY_SUMMARY,
-            )
+        # 응답을 기다리는 동안 커넥션 반납 (읽은 객체는 값을 유지한 채 분리됨)
+        await self.db.close()
 
-            if feedback_text:
-                # 피드백 저장
-                feedback = AIFeedback(
-                    user_id=user_id,
-                    feedback_text=feedback_text,
-                    feedback_type=FeedbackType.DAILY_SUMMARY,
-                    ai_metadata=json.dumps(
-                        {
-                            "generated_at": datetime.utcnow().isoformat(),
-                            "data_count": {
-                                "emotions": len(emotions),
-                                "sessions": len(sessions),
-                                "todos": len(todos),
-                            },
-                        }
-                    ),
-                )
-                self.db.add(feedback)
-                self.db.commit()
+        summaries = self.ai_service.summarize_inputs(emotions, sessions, todos)
+        fingerprint = feedback_fingerprint(summaries, FeedbackType.DAILY_SUMMARY)
 
-        except Exception as e:
-            logger.error(f"Failed to generate daily feedback: {e}")
+        feedback_text = await self.ai_service.generate_feedback_with_gpt(
+            api_key,
+            user.name,
+            emotions,
+            sessions,
+            todos,
+            FeedbackType.DAILY_SUMMARY,
+            summaries=summaries,
+        )
+        if not feedback_text:
+            return None
+
+        return AIFeedback(
+            user_id=user.id,
+            feedback_text=feedback_text,
+            feedback_type=FeedbackType.DAILY_SUMMARY,
+            input_fingerprint=fingerprint,
+            ai_metadata=json.dumps(
+                {
+                    "generated_at": datetime.utcnow().isoformat(),
+                    "input_fingerprint": fingerprint,
+                    "data_count": {
+                        "emotions": len(emotions),
+                        "sessions": len(sessions),
+                        "todos": len(todos),
+                    },
+                }
+            ),
+        )
@@ -0,0 +1,171 @@
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from app.core.config import get_settings
+from app.core.executors import run_cpu_bound
+from app.core.metrics import register_metrics_source
+from app.services.ai_service import AIService
+
+logger = logging.getLogger(__name__)
+
+BatchRunner = Callable[[List[str]], List[Dict[str, Any]]]
+CacheLookup = Callable[[str], Optional[Dict[str, Any]]]
+
+
+class EmotionBatcher:
+    """감정 분석 마이크로 배칭 엔진
+
+    대기 중인 텍스트를 최대 max_wait_ms 동안 (또는 max_batch_size개가 찰
+    때까지) 모은 뒤, CPU 풀에서 한 번의 배치 호출로 분석하고 결과를
+    각 호출자에게 돌려준다. 모델은 워커당 하나이므로 배치는 한 번에 하나만
+    실행하며, 실행 중에 들어온 요청은 다음 배치로 모인다.
+    """
+
+    def __init__(
+        self,
+        run_batch: BatchRunner,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5,
+        lookup: Optional[CacheLookup] = None,
+    ):
+        self.run_batch = run_batch
+        self.lookup = lookup
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+
+        # 지표
+        self._batches_total = 0
+        self._items_total = 0
+        self._last_batch_size = 0
+        self._max_batch_size_seen = 0
+
+    async def analyze(self, text: str) -> Dict[str, Any]:
+        """텍스트 하나를 배치에 넣고 결과를 기다림"""
+        # 로컬 캐시 적중 시 배치 대기 없이 바로 반환
+        if self.lookup is not None and text:
+            cached = self.lookup(text)
+            if cached is not None:
+                return cached
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._bind(loop)
+
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None and not self._running:
+            self._timer = loop.call_later(self.max_wait, self._dispatch)
+
+        return await future
+
+    def _bind(self, loop: asyncio.AbstractEventLoop):
+        # 이벤트 루프가 바뀌면 (예: 테스트 클라이언트 재생성) 상태 초기화
+        self._loop = loop
+        self._pending = []
+        self._timer = None
+        self._running = set()
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._running or not self._pending:
+            return
+
+        batch = self._pending[: self.max_batch_size]
+        self._pending = self._pending[self.max_batch_size :]
+
+        task = self._loop.create_task(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._on_batch_done)
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]):
+        texts = [text for text, _ in batch]
+        self._record_batch(len(texts))
+
+        try:
+            results = await run_cpu_bound(self.run_batch, texts)
+            # 결과 수가 다르면 어느 결과가 누구 것인지 알 수 없으므로 배치 전체 실패
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Emotion batch returned {len(results)} results "
+                    f"for {len(batch)} texts"
+                )
+        except Exception as e:
+            logger.error(f"Emotion batch failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _on_batch_done(self, task: asyncio.Task):
+        self._running.discard(task)
+        # 실행 중에 쌓인 요청은 이미 충분히 기다렸으므로 바로 처리
+        if self._pending:
+            self._dispatch()
+
+    def _record_batch(self, size: int):
+        self._batches_total += 1
+        self._items_total += size
+        self._last_batch_size = size
+        self._max_batch_size_seen = max(self._max_batch_size_seen, size)
+
+    def metrics(self) -> Dict[str, Any]:
+        """큐 길이 및 배치 크기 지표"""
+        return {
+            "queue_depth": len(self._pending),
+            "running_batches": len(self._running),
+            "batches_total": self._batches_total,
+            "items_total": self._items_total,
+            "last_batch_size": self._last_batch_size,
+            "max_batch_size_seen": self._max_batch_size_seen,
+            "average_batch_size": (
+                round(self._items_total / self._batches_total, 2)
+                if self._batches_total
+                else 0
+            ),
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+def _run_emotion_batch(texts: List[str]) -> List[Dict[str, Any]]:
+    return AIService().analyze_emotion_texts(texts)
+
+
+def _lookup_cached_analysis(text: str) -> Optional[Dict[str, Any]]:
+    return AIService().cached_emotion_analysis(text)
+
+
+_emotion_batcher: Optional[EmotionBatcher] = None
+
+
+def get_emotion_batcher() -> EmotionBatcher:
+    """워커 공유 감정 분석 배처"""
+    global _emotion_batcher
+    if _emotion_batcher is None:
+        settings = get_settings()
+        _emotion_batcher = EmotionBatcher(
+            _run_emotion_batch,
+            max_batch_size=settings.EMOTION_BATCH_MAX_SIZE,
+            max_wait_ms=settings.EMOTION_BATCH_MAX_WAIT_MS,
+            lookup=_lookup_cached_analysis,
+        )
+    return _emotion_batcher
+
+
+register_metrics_source("emotion_batcher", lambda: get_emotion_batcher().metrics())
@@ -0,0 +1,483 @@
+"""사용자 시간대별 일일 피드백 스케줄러
+
+각 시간대의 현지 시각이 FEEDBACK_LOCAL_HOUR를 지나면 그 시간대 사용자들의 작업을
+feedback_jobs 테이블에 한 번에 만들고(INSERT ... SELECT), 대기 중인 작업을 전역
+동시 실행 제한과 API 키별 속도 제한 아래에서 처리한다. 작업 상태가 DB에 남으므로
+중간에 프로세스가 죽어도 다시 시작하면 완료된 사용자는 건너뛰고 나머지를 이어서
+처리한다 (RUNNING 상태로 남은 작업은 임대 시간이 지나면 다시 가져감).
+"""
+
+import asyncio
+import logging
+import time as time_lib
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.core.config import get_settings
+from app.core.executors import run_io_bound
+from app.core.metrics import register_metrics_source
+from app.db.database import OffloadedSession, engine
+from app.models.feedback import AIFeedback, FeedbackJob, FeedbackJobStatus
+from app.models.user import User
+from app.services.ai_service import AIBackgroundService
+from app.services.openai_pool import api_key_hash
+from sqlalchemy import and_, exists, insert, literal, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+logger = logging.getLogger(__name__)
+
+# (db, user, api_key, 시작, 끝) → 저장 전 AIFeedback (생성 실패 시 None)
+FeedbackBuilder = Callable[
+    [OffloadedSession, User, str, datetime, datetime], Awaitable[Optional[AIFeedback]]
+]
+
+_UTC = timezone.utc
+
+
+def resolve_zone(name: Optional[str]) -> ZoneInfo:
+    """시간대 이름 → ZoneInfo (알 수 없는 이름은 UTC)"""
+    try:
+        return ZoneInfo(name) if name else ZoneInfo("UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo("UTC")
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    return value.astimezone(_UTC).replace(tzinfo=None)
+
+
+def local_due_at(local_date: date, zone: ZoneInfo, local_hour: int) -> datetime:
+    """현지 날짜의 마감 시각(local_hour 정각)을 naive UTC로 변환"""
+    return to_naive_utc(datetime.combine(local_date, time(local_hour), tzinfo=zone))
+
+
+def feedback_window(
+    local_date: date, zone: ZoneInfo, local_hour: int
+) -> Tuple[datetime, datetime]:
+    """현지 날짜 피드백의 데이터 범위 [전날 마감, 당일 마감)
+
+    자정이 아니라 마감 시각에서 나눠, 마감 이후 자정 전까지의 기록은 다음 날
+    피드백에 들어간다 (어느 피드백에서도 빠지는 구간이 없음).
+    """
+    return (
+        local_due_at(local_date - timedelta(days=1), zone, local_hour),
+        local_due_at(local_date, zone, local_hour),
+    )
+
+
+async def default_builder(
+    db: OffloadedSession, user: User, api_key: str, start: datetime, end: datetime
+) -> Optional[AIFeedback]:
+    return await AIBackgroundService(db).build_daily_feedback(user, api_key, start, end)
+
+
+class KeyRateLimiter:
+    """API 키(해시)별 분당 요청 수 제한
+
+    키마다 다음 요청 가능 시각을 기록해 간격(60 / rate초)만큼 띄운다.
+    기다리는 동안 전역 동시 실행 슬롯은 잡지 않는다.
+    """
+
+    def __init__(self, rate_per_minute: float, max_keys: int = 10000):
+        self.interval = 60.0 / rate_per_minute if rate_per_minute > 0 else 0.0
+        self.max_keys = max_keys
+        self._next: "OrderedDict[str, float]" = OrderedDict()
+        self.waited_seconds = 0.0
+
+    async def acquire(self, key: str):
+        if self.interval <= 0:
+            return
+        now = time_lib.monotonic()
+        slot = max(now, self._next.get(key, now))
+        self._next[key] = slot + self.interval
+        self._next.move_to_end(key)
+        while len(self._next) > self.max_keys:
+            self._next.popitem(last=False)
+        if slot > now:
+            self.waited_seconds += slot - now
+            await asyncio.sleep(slot - now)
+
+
+class DailyFeedbackScheduler:
+    """시간대별 일일 피드백 작업 생성 및 처리"""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        builder: Optional[FeedbackBuilder] = None,
+        local_hour: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        key_rate_per_minute: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.session_factory = session_factory or (lambda: Session(engine))
+        self.builder = builder or default_builder
+        self.local_hour = (
+            settings.FEEDBACK_LOCAL_HOUR if local_hour is None else local_hour
+        )
+        self.max_concurrency = max_concurrency or settings.FEEDBACK_MAX_CONCURRENCY
+        self.max_attempts = max_attempts or settings.FEEDBACK_MAX_ATTEMPTS
+        self.lease = timedelta(
+            seconds=lease_seconds or settings.FEEDBACK_JOB_LEASE_SECONDS
+        )
+        self.batch_size = batch_size or settings.FEEDBACK_BATCH_SIZE
+        self.limiter = KeyRateLimiter(
+            settings.FEEDBACK_KEY_RATE_PER_MINUTE
+            if key_rate_per_minute is None
+            else key_rate_per_minute
+        )
+        # 이미 작업을 만든 (시간대, 현지 날짜) — 같은 날 반복 조회 방지
+        self._fanned_out: Set[Tuple[str, date]] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+        self._totals = {
+            "created": 0,
+            "succeeded": 0,
+            "skipped": 0,
+            "failed": 0,
+        }
+        self._last_run: Dict[str, Any] = {}
+
+    def _session(self) -> OffloadedSession:
+        return OffloadedSession(self.session_factory())
+
+    def due_dates(self, tz_name: str, now: datetime) -> List[Tuple[date, datetime]]:
+        """시간대의 생성 대상 (현지 날짜, due_at) 목록
+
+        전날은 항상 대상에 넣어, 스케줄러가 현지 자정을 넘겨 멈춰 있었어도
+        빠진 사용자가 없게 한다 (이미 있는 작업은 만들지 않음).
+        """
+        zone = resolve_zone(tz_name)
+        local_now = now.replace(tzinfo=_UTC).astimezone(zone)
+        today = local_now.date()
+        dates = [today - timedelta(days=1)]
+        if local_now.hour >= self.local_hour:
+            dates.append(today)
+        return [
+            (local_date, local_due_at(local_date, zone, self.local_hour))
+            for local_date in dates
+        ]
+
+    async def create_due_jobs(self, now: Optional[datetime] = None) -> int:
+        """마감 시각이 지난 시간대의 사용자 작업 생성 (이미 있으면 건너뜀)"""
+        now = now or datetime.utcnow()
+        db = self._session()
+        created = 0
+        try:
+            tz_names = (
+                await db.exec(select(User.timezone).where(User.is_active).distinct())
+            ).all()
+            status_type = FeedbackJob.__table__.c.status.type
+            due = {tz_name: self.due_dates(tz_name, now) for tz_name in tz_names}
+            # 더 이상 확인하지 않는 (전날보다 이전) 날짜는 기록에서 제거
+            self._fanned_out = {
+                (tz_name, local_date)
+                for tz_name, local_date in self._fanned_out
+                if tz_name in due and local_date >= due[tz_name][0][0]
+            }
+            for tz_name, dates in due.items():
+                for local_date, due_at in dates:
+                    if (tz_name, local_date) in self._fanned_out:
+                        continue
+                    # 해당 날짜가 끝나기 전에 가입한 활성 사용자 중 작업이 없는 사용자
+                    rows = select(
+                        User.id,
+                        literal(local_date, FeedbackJob.__table__.c.local_date.type),
+                        literal(due_at, FeedbackJob.__table__.c.due_at.type),
+                        literal(FeedbackJobStatus.PENDING, status_type),
+                        literal(0),
+                    ).where(
+                        User.timezone == tz_name,
+                        User.is_active,
+                        User.created_at < due_at,
+                        ~exists().where(
+                            FeedbackJob.user_id == User.id,
+                            FeedbackJob.local_date == local_date,
+                        ),
+                    )
+                    statement = insert(FeedbackJob).from_select(
+                        ["user_id", "local_date", "due_at", "status", "attempts"],
+                        rows,
+                    )
+                    try:
+                        result = await db.execute(statement)
+                        await db.commit()
+                    except IntegrityError:
+                        # 다른 스케줄러 인스턴스가 동시에 만든 경우 다음 실행에서 채움
+                        await db.rollback()
+                        continue
+                    created += max(result.rowcount or 0, 0)
+                    self._fanned_out.add((tz_name, local_date))
+        finally:
+            await db.close()
+
+        self._totals["created"] += created
+        return created
+
+    def _claimable(self, now: datetime) -> Any:
+        stale = now - self.lease
+        return or_(
+            FeedbackJob.status == FeedbackJobStatus.PENDING,
+            and_(
+                FeedbackJob.attempts < self.max_attempts,
+                or_(
+                    FeedbackJob.status == FeedbackJobStatus.FAILED,
+                    and_(
+                        FeedbackJob.status == FeedbackJobStatus.RUNNING,
+                        FeedbackJob.claimed_at < stale,
+                    ),
+                ),
+            ),
+        )
+
+    def _job_filter(self, job: FeedbackJob) -> Any:
+        return and_(
+            FeedbackJob.user_id == job.user_id,
+            FeedbackJob.local_date == job.local_date,
+        )
+
+    async def _expire_stale(self, now: datetime):
+        """재시도 횟수를 다 쓴 채 임대가 끝난 RUNNING 작업은 FAILED로 정리"""
+        db = self._session()
+        try:
+            await db.execute(
+                update(FeedbackJob)
+                .where(
+                    FeedbackJob.status == FeedbackJobStatus.RUNNING,
+                    FeedbackJob.claimed_at < now - self.lease,
+                    FeedbackJob.attempts >= self.max_attempts,
+                )
+                .values(status=FeedbackJobStatus.FAILED, error="lease expired")
+            )
+            await db.commit()
+        finally:
+            await db.close()
+
+    def _claim(self, job: FeedbackJob) -> bool:
+        """조건부 UPDATE로 작업 선점 (다른 인스턴스가 가져갔으면 False)"""
+        now = datetime.utcnow()
+        with self.session_factory() as session:
+            result = session.execute(
+                update(FeedbackJob)
+                .where(self._job_filter(job), self._claimable(now))
+                .values(
+                    status=FeedbackJobStatus.RUNNING,
+                    claimed_at=now,
+                    attempts=FeedbackJob.attempts + 1,
+                )
+            )
+            session.commit()
+            return result.rowcount == 1
+
+    def _finish(
+        self,
+        job: FeedbackJob,
+        status: FeedbackJobStatus,
+        feedback: Optional[AIFeedback] = None,
+        error: Optional[str] = None,
+    ):
+        """작업 상태 기록 (피드백 저장과 같은 트랜잭션, 재시작 시 중복 생성 없음)"""
+        with self.session_factory() as session:
+            if feedback is not None:
+                session.add(feedback)
+            session.execute(
+                update(FeedbackJob)
+                .where(self._job_filter(job))
+                .values(
+                    status=status,
+                    finished_at=datetime.utcnow(),
+                    feedback_id=feedback.id if feedback is not None else None,
+                    error=error[:500] if error else None,
+                )
+            )
+            session.commit()
+
+    async def _build(self, job: FeedbackJob, user: User, api_key: str) -> AIFeedback:
+        start, _ = feedback_window(
+            job.local_date, resolve_zone(user.timezone), self.local_hour
+        )
+        end = job.due_at
+        db = self._session()
+        try:
+            feedback = await self.builder(db, user, api_key, start, end)
+        finally:
+            await db.close()
+        if feedback is None:
+            raise RuntimeError("no feedback generated")
+        return feedback
+
+    async def _process_job(self, job: FeedbackJob, user: User) -> FeedbackJobStatus:
+        """작업 하나 처리 후 최종 상태 반환 (선점 실패 시 RUNNING)
+
+        선점과 상태 기록은 각각 I/O 풀에서 한 번에 커밋까지 끝내, 응답을
+        기다리는 동안 쓰기 트랜잭션이나 커넥션을 잡고 있지 않는다.
+        """
+        settings = user.get_settings()
+        api_key = settings.get("openai_api_key")
+        if not api_key or not settings.get("enable_ai_analysis", True):
+            if not await run_io_bound(self._claim, job):
+                return FeedbackJobStatus.RUNNING
+            await run_io_bound(self._finish, job, FeedbackJobStatus.SKIPPED)
+            return FeedbackJobStatus.SKIPPED
+
+        await self.limiter.acquire(api_key_hash(api_key))
+        async with self._semaphore:
+            if not await run_io_bound(self._claim, job):
+                return FeedbackJobStatus.RUNNING
+            self._in_flight += 1
+            try:
+                feedback = await self._build(job, user, api_key)
+            except Exception as e:
+                logger.warning(
+                    f"Daily feedback failed for user {job.user_id} "
+                    f"({job.local_date}): {e}"
+                )
+                await run_io_bound(
+                    self._finish,
+                    job,
+                    FeedbackJobStatus.FAILED,
+                    error=f"{type(e).__name__}: {e}",
+                )
+                return FeedbackJobStatus.FAILED
+            finally:
+                self._in_flight -= 1
+            await run_io_bound(self._finish, job, FeedbackJobStatus.DONE, feedback)
+            return FeedbackJobStatus.DONE
+
+    async def process_due_jobs(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """due_at이 지난 작업을 배치 단위로 처리"""
+        now = now or datetime.utcnow()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        await self._expire_stale(now)
+
+        counts = {"processed": 0, "succeeded": 0, "skipped": 0, "failed": 0}
+        after: Optional[Tuple[datetime, Any]] = None
+        while True:
+            # (due_at, user_id) 키셋 페이지네이션 — 처리 중 상태가 바뀌어도 누락 없음
+            query = (
+                select(FeedbackJob, User)
+                .join(User, User.id == FeedbackJob.user_id)
+                .where(FeedbackJob.due_at <= now, self._claimable(now))
+                .order_by(FeedbackJob.due_at, FeedbackJob.user_id)
+                .limit(self.batch_size)
+            )
+            if after is not None:
+                query = query.where(
+                    or_(
+                        FeedbackJob.due_at > after[0],
+                        and_(
+                            FeedbackJob.due_at == after[0],
+                            FeedbackJob.user_id > after[1],
+                        ),
+                    )
+                )
+            db = self._session()
+            try:
+                rows = (await db.exec(query)).all()
+            finally:
+                await db.close()
+            if not rows:
+                break
+
+            statuses = await asyncio.gather(
+                *(self._process_job(job, user) for job, user in rows),
+                return_exceptions=True,
+            )
+            for status in statuses:
+                if isinstance(status, BaseException):
+                    # 상태 기록 자체가 실패한 작업은 임대 만료 후 다시 처리됨
+                    logger.error(f"Daily feedback job crashed: {status}")
+                    status = FeedbackJobStatus.FAILED
+                if status == FeedbackJobStatus.RUNNING:
+                    continue
+                counts["processed"] += 1
+                key = {
+                    FeedbackJobStatus.DONE: "succeeded",
+                    FeedbackJobStatus.SKIPPED: "skipped",
+                    FeedbackJobStatus.FAILED: "failed",
+                }[status]
+                counts[key] += 1
+                self._totals[key] += 1
+
+            last_job = rows[-1][0]
+            after = (last_job.due_at, last_job.user_id)
+            if len(rows) < self.batch_size:
+                break
+
+        return counts
+
+    async def run_once(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """작업 생성 + 처리 한 번 실행 후 요약 반환"""
+        started = time_lib.perf_counter()
+        created = await self.create_due_jobs(now)
+        counts = await self.process_due_jobs(now)
+        duration = time_lib.perf_counter() - started
+        summary = {
+            "created": created,
+            **counts,
+            "duration_seconds": round(duration, 3),
+            "throughput_per_second": (
+                round(counts["processed"] / duration, 2) if duration > 0 else 0.0
+            ),
+            "finished_at": datetime.utcnow().isoformat(),
+        }
+        self._last_run = summary
+        if counts["processed"]:
+            logger.info(f"Daily feedback run: {summary}")
+        return summary
+
+    async def run_forever(self, interval_seconds: Optional[float] = None):
+        """주기적으로 run_once 실행 (취소될 때까지)"""
+        interval = (
+            interval_seconds or get_settings().FEEDBACK_SCHEDULER_INTERVAL_SECONDS
+        )
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Daily feedback scheduler run failed: {e}")
+            await asyncio.sleep(interval)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            **self._totals,
+            "in_flight": self._in_flight,
+            "max_concurrency": self.max_concurrency,
+            "rate_limit_wait_seconds": round(self.limiter.waited_seconds, 3),
+            "last_run": self._last_run,
+        }
+
+
+_feedback_scheduler: Optional[DailyFeedbackScheduler] = None
+
+
+def get_feedback_scheduler() -> DailyFeedbackScheduler:
+    """프로세스 공유 일일 피드백 스케줄러"""
+    global _feedback_scheduler
+    if _feedback_scheduler is None:
+        _feedback_scheduler = DailyFeedbackScheduler()
+    return _feedback_scheduler
+
+
+def set_feedback_scheduler(scheduler: Optional[DailyFeedbackScheduler]):
+    """스케줄러 교체 (테스트용, None이면 다음 호출 시 재생성)"""
+    global _feedback_scheduler
+    _feedback_scheduler = scheduler
+
+
+register_metrics_source(
+    "feedback_scheduler",
+    lambda: (
+        _feedback_scheduler.metrics()
+        if _feedback_scheduler is not None
+        else {"succeeded": 0}
+    ),
+)
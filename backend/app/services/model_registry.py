@@ -0,0 +1,104 @@
+import logging
+import threading
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import get_settings
+from app.services.ai_providers import create_sentiment_pipeline
+
+logger = logging.getLogger(__name__)
+
+
+class ModelState(str, Enum):
+    NOT_LOADED = "not_loaded"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+
+def load_emotion_pipeline() -> Any:
+    """감정 분석 모델 로드 (EMOTION_MODEL_BACKEND에 따라 PyTorch 또는 ONNX)"""
+    settings = get_settings()
+    if settings.EMOTION_MODEL_BACKEND == "onnx":
+        from app.services.onnx_sentiment import load_onnx_sentiment_pipeline
+
+        return load_onnx_sentiment_pipeline(
+            settings.EMOTION_ONNX_MODEL_DIR, settings.EMOTION_ONNX_THREADS
+        )
+    return create_sentiment_pipeline(
+        settings.EMOTION_MODEL_NAME, settings.EMOTION_MODEL_DEVICE
+    )
+
+
+class ModelRegistry:
+    """워커 프로세스 단위로 공유되는 AI 모델 레지스트리
+
+    모델은 처음 요청될 때 한 번만 로드되며, 여러 스레드에서 동시에
+    요청하더라도 로더는 한 번만 실행된다.
+    """
+
+    def __init__(self, loader: Callable[[], Any] = load_emotion_pipeline):
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._emotion_analyzer: Optional[Any] = None
+        self._state = ModelState.NOT_LOADED
+
+    @property
+    def state(self) -> ModelState:
+        return self._state
+
+    @property
+    def is_ready(self) -> bool:
+        return self._state == ModelState.READY
+
+    def get_emotion_analyzer(self) -> Optional[Any]:
+        """공유 감정 분석 모델 반환 (필요 시 로드)"""
+        if self._state == ModelState.READY:
+            return self._emotion_analyzer
+
+        with self._lock:
+            # 실패한 모델은 reset() 전까지 다시 로드하지 않음
+            if self._state in (ModelState.READY, ModelState.FAILED):
+                return self._emotion_analyzer
+
+            self._state = ModelState.LOADING
+            try:
+                self._emotion_analyzer = self._loader()
+                self._state = ModelState.READY
+                logger.info("Emotion analyzer loaded")
+            except Exception:
+                # 원인은 서버 로그에만 남김 (/health는 인증 없이 열려 있음)
+                logger.exception("Failed to load emotion analyzer")
+                self._emotion_analyzer = None
+                self._state = ModelState.FAILED
+
+        return self._emotion_analyzer
+
+    def warm_up(self) -> bool:
+        """모델 미리 로드 (lifespan에서 호출)"""
+        return self.get_emotion_analyzer() is not None
+
+    def set_emotion_analyzer(self, analyzer: Any) -> None:
+        """이미 로드된 모델(또는 테스트용 스텁) 등록"""
+        with self._lock:
+            self._emotion_analyzer = analyzer
+            self._state = ModelState.READY
+
+    def reset(self, loader: Optional[Callable[[], Any]] = None) -> None:
+        """레지스트리 초기화 (다음 요청 시 다시 로드)"""
+        with self._lock:
+            if loader is not None:
+                self._loader = loader
+            self._emotion_analyzer = None
+            self._state = ModelState.NOT_LOADED
+
+    def status(self) -> Dict[str, Any]:
+        """준비 상태 조회"""
+        return {"emotion_analyzer": self._state.value}
+
+
+model_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    return model_registry
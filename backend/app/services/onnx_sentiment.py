@@ -0,0 +1,159 @@
+"""ONNX Runtime 감정 분석 백엔드 (int8 동적 양자화)
+
+PyTorch 파이프라인 대신 ONNX로 내보낸 뒤 가중치를 int8로 동적 양자화한 모델을
+onnxruntime으로 실행한다. 결과 형식은 transformers 파이프라인과 같아
+(`[{"label": "4 stars", "score": 0.61}, ...]`) AIService가 그대로 사용한다.
+
+내보내기(`python -m app.cli export-onnx`)에는 torch, onnx가 필요하고,
+실행에는 onnxruntime과 transformers(토크나이저)만 필요하다.
+"""
+
+import inspect
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from app.services.ai_providers import (
+    onnx_dependency,
+    onnxruntime_dependency,
+    torch_dependency,
+    transformers_dependency,
+)
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILE = "model.int8.onnx"
+LABELS_FILE = "labels.json"
+
+
+def export_quantized_model(
+    model_name: str, output_dir: Union[str, Path], opset: int = 14
+) -> Path:
+    """HuggingFace 모델 → ONNX 내보내기 + int8 동적 양자화
+
+    output_dir에 양자화된 모델, 토크나이저, 라벨 목록을 저장하고 모델 경로를 반환한다.
+    """
+    transformers = transformers_dependency.load()
+    torch = torch_dependency.load()
+    onnx_dependency.load()
+    onnxruntime_dependency.load()
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tokenizer = transformers.AutoTokenizer.from_pretrained(model_name)
+    model = transformers.AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.eval()
+
+    sample = tokenizer(["감정 분석 예시 문장"], return_tensors="pt")
+    input_names = [
+        name
+        for name in ("input_ids", "attention_mask", "token_type_ids")
+        if name in sample
+    ]
+    float_path = output_dir / "model.onnx"
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+    options = {}
+    # torch 2.9부터 기본값인 dynamo 내보내기는 onnxscript가 필요하고 dynamic_axes를
+    # 그대로 쓰지 않으므로 TorchScript 내보내기 사용
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        options["dynamo"] = False
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            str(float_path),
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            **options,
+        )
+
+    model_path = output_dir / MODEL_FILE
+    quantize_dynamic(str(float_path), str(model_path), weight_type=QuantType.QInt8)
+    float_path.unlink()
+
+    tokenizer.save_pretrained(output_dir)
+    labels = [model.config.id2label[i] for i in range(model.config.num_labels)]
+    (output_dir / LABELS_FILE).write_text(json.dumps(labels, ensure_ascii=False))
+    logger.info(f"Exported quantized ONNX model to {model_path}")
+    return model_path
+
+
+class OnnxSentimentPipeline:
+    """transformers 감정 분석 파이프라인과 같은 방식으로 호출하는 ONNX 모델"""
+
+    def __init__(
+        self,
+        session: Any,
+        tokenizer: Any,
+        labels: List[str],
+        max_length: int = 512,
+    ):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.labels = labels
+        self.max_length = max_length
+        self.input_names = [i.name for i in session.get_inputs()]
+
+    def __call__(
+        self, texts: Union[str, List[str]], batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        import numpy as np
+
+        if isinstance(texts, str):
+            texts = [texts]
+        batch_size = batch_size or len(texts) or 1
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                texts[start : start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np",
+            )
+            feeds = {
+                name: encoded[name].astype(np.int64)
+                for name in self.input_names
+                if name in encoded
+            }
+            (logits,) = self.session.run(["logits"], feeds)
+            # softmax (파이프라인과 같은 점수)
+            logits = logits - logits.max(axis=-1, keepdims=True)
+            probs = np.exp(logits)
+            probs /= probs.sum(axis=-1, keepdims=True)
+            for row in probs:
+                best = int(row.argmax())
+                results.append({"label": self.labels[best], "score": float(row[best])})
+        return results
+
+
+def load_onnx_sentiment_pipeline(
+    model_dir: Union[str, Path], threads: int = 0
+) -> OnnxSentimentPipeline:
+    """export_quantized_model로 만든 디렉터리에서 파이프라인 로드"""
+    onnxruntime = onnxruntime_dependency.load()
+    transformers = transformers_dependency.load()
+
+    model_dir = Path(model_dir)
+    model_path = model_dir / MODEL_FILE
+    if not model_path.exists():
+        raise FileNotFoundError(
+            f"{model_path} not found "
+            f"(run: python -m app.cli export-onnx --output {model_dir})"
+        )
+
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if threads:
+        options.intra_op_num_threads = threads
+    session = onnxruntime.InferenceSession(
+        str(model_path), options, providers=["CPUExecutionProvider"]
+    )
+    tokenizer = transformers.AutoTokenizer.from_pretrained(model_dir)
+    labels = json.loads((model_dir / LABELS_FILE).read_text())
+    return OnnxSentimentPipeline(session, tokenizer, labels)
@@ -0,0 +1,302 @@
+"""사용자 API 키별 비동기 OpenAI 클라이언트 풀
+
+클라이언트는 API 키 해시로 구분해 재사용하고(LRU로 개수 제한), 모든 클라이언트가
+하나의 httpx 연결 풀을 공유한다. 키마다 동시 요청 수를 제한하며, 429/5xx/연결
+오류는 지터를 준 지수 백오프로 재시도한다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Optional
+
+from app.core.config import get_settings
+from app.core.metrics import register_metrics_source
+from app.services.ai_providers import create_async_openai_client, openai_dependency
+
+logger = logging.getLogger(__name__)
+
+
+def api_key_hash(api_key: str) -> str:
+    """API 키 원문을 메모리/지표에 남기지 않기 위한 해시"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+class _PooledClient:
+    def __init__(self, client: Any, max_concurrency: int):
+        self.client = client
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.users = 0  # 이 클라이언트로 대기 중이거나 실행 중인 요청 수
+
+
+async def _close_on_loop_shutdown(http_client: Any) -> AsyncGenerator[None, None]:
+    """루프 종료 시 연결 풀을 닫는 async generator
+
+    asyncio.run()은 루프를 닫기 전에 shutdown_asyncgens()로 살아 있는 async
+    generator를 닫으므로, 루프가 끝나기 전에 그 루프에서 소켓을 정리할 수 있다.
+    """
+    try:
+        yield
+    finally:
+        await http_client.aclose()
+
+
+class OpenAIClientPool:
+    """API 키 해시 → AsyncOpenAI 클라이언트 LRU 풀"""
+
+    def __init__(
+        self,
+        max_clients: int = 256,
+        max_concurrency_per_key: int = 4,
+        max_connections: int = 100,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        base_url: Optional[str] = None,
+    ):
+        self.max_clients = max_clients
+        self.max_concurrency_per_key = max_concurrency_per_key
+        self.max_connections = max_connections
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.base_url = base_url or None
+        self._clients: "OrderedDict[str, _PooledClient]" = OrderedDict()
+        self._http_client: Any = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_guard: Optional[AsyncGenerator[None, None]] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._requests = 0
+        self._retries = 0
+        self._evictions = 0
+        self._streams = 0
+        self._aborted_streams = 0
+
+    def _timeout(self) -> Any:
+        import httpx
+
+        return httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+
+    def _release_loop_client(self):
+        """이전 루프의 연결 풀 정리
+
+        asyncio.run()으로 끝난 루프의 클라이언트는 종료 시 이미 닫혔고, 다른
+        스레드에서 아직 돌고 있는 루프라면 그 루프에 닫기를 예약한다.
+        """
+        http_client, loop = self._http_client, self._loop
+        self._http_client = None
+        self._loop_guard = None
+        self._clients.clear()
+        if http_client is None or loop is None or loop.is_closed():
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(http_client.aclose(), loop)
+
+    async def _ensure_loop(self):
+        # httpx 연결과 세마포어는 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만듦
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._http_client is not None:
+            return
+
+        import httpx
+
+        self._release_loop_client()
+        self._loop = loop
+        self._http_client = httpx.AsyncClient(
+            timeout=self._timeout(),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+        # 첫 yield까지 진행해야 루프가 종료 시 닫을 generator로 추적함
+        self._loop_guard = _close_on_loop_shutdown(self._http_client)
+        await self._loop_guard.__anext__()
+
+    async def _get(self, api_key: str) -> _PooledClient:
+        """키에 해당하는 클라이언트 반환 (없으면 생성, 가득 차면 유휴 키부터 제거)
+
+        반환 시 users를 1 늘리므로 호출한 쪽이 끝난 뒤 줄여야 한다 (_acquire).
+        """
+        await self._ensure_loop()
+        key = api_key_hash(api_key)
+        with self._lock:
+            pooled = self._clients.get(key)
+            if pooled is not None:
+                self._clients.move_to_end(key)
+                pooled.users += 1
+                return pooled
+
+            # SDK 자체 재시도는 끄고 아래 백오프 정책으로 재시도
+            client = create_async_openai_client(
+                api_key,
+                base_url=self.base_url,
+                http_client=self._http_client,
+                timeout=self._timeout(),
+                max_retries=0,
+            )
+            pooled = _PooledClient(client, self.max_concurrency_per_key)
+            pooled.users += 1
+            self._clients[key] = pooled
+            # 요청이 남은 키를 제거하면 같은 키에 세마포어가 둘 생겨 키별 동시 실행
+            # 제한이 깨지므로 유휴 키만 제거 (모두 사용 중이면 잠시 한도를 넘김).
+            # 제거된 클라이언트는 닫지 않음 (공유 http 클라이언트가 함께 닫히므로)
+            excess = len(self._clients) - self.max_clients
+            if excess > 0:
+                idle = [k for k, p in self._clients.items() if p.users == 0]
+                for idle_key in idle[:excess]:
+                    del self._clients[idle_key]
+                    self._evictions += 1
+            return pooled
+
+    @asynccontextmanager
+    async def _acquire(self, api_key: str) -> AsyncIterator[_PooledClient]:
+        """키별 동시 실행 슬롯을 잡은 클라이언트"""
+        pooled = await self._get(api_key)
+        try:
+            async with pooled.semaphore:
+                self._in_flight += 1
+                self._requests += 1
+                try:
+                    yield pooled
+                finally:
+                    self._in_flight -= 1
+        finally:
+            pooled.users -= 1
+
+    def backoff_delay(self, attempt: int) -> float:
+        """full jitter 지수 백오프 (0 ~ min(max, base * 2^attempt))"""
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2**attempt)
+        )
+
+    async def _create(self, pooled: _PooledClient, request: Dict[str, Any]) -> Any:
+        """chat.completions.create 호출 (재시도 가능한 오류는 백오프 후 재시도)"""
+        openai = openai_dependency.load()
+        retryable = (
+            openai.RateLimitError,
+            openai.InternalServerError,
+            openai.APIConnectionError,
+        )
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await pooled.client.chat.completions.create(**request)
+            except retryable as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_delay(attempt)
+                self._retries += 1
+                logger.warning(
+                    f"OpenAI request failed ({type(e).__name__}), "
+                    f"retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+
+    async def chat_completion(self, api_key: str, **request: Any) -> Any:
+        """chat.completions.create 호출 (키별 동시 실행 제한 + 재시도)"""
+        async with self._acquire(api_key) as pooled:
+            return await self._create(pooled, request)
+
+    async def stream_chat_completion(
+        self, api_key: str, **request: Any
+    ) -> AsyncIterator[str]:
+        """스트리밍 chat completion — 생성된 내용 조각을 차례로 yield
+
+        재시도는 첫 응답을 받기 전까지만 한다. 소비자가 도중에 멈추면
+        (aclose/취소) 업스트림 HTTP 응답을 닫아 생성을 중단시킨다.
+        """
+        async with self._acquire(api_key) as pooled:
+            self._streams += 1
+            completed = False
+            try:
+                stream = await self._create(pooled, {**request, "stream": True})
+                try:
+                    async for chunk in stream:
+                        if not chunk.choices:
+                            continue
+                        text = chunk.choices[0].delta.content
+                        if text:
+                            yield text
+                    completed = True
+                finally:
+                    await stream.response.aclose()
+            finally:
+                if not completed:
+                    self._aborted_streams += 1
+
+    async def aclose(self):
+        """공유 연결 풀 닫기 (lifespan 종료 시)"""
+        http_client, guard = self._http_client, self._loop_guard
+        self._http_client = None
+        self._loop_guard = None
+        self._clients.clear()
+        self._loop = None
+        if guard is not None:
+            await guard.aclose()
+        elif http_client is not None:
+            await http_client.aclose()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "clients": len(self._clients),
+            "max_clients": self.max_clients,
+            "in_flight": self._in_flight,
+            "requests": self._requests,
+            "retries": self._retries,
+            "evictions": self._evictions,
+            "streams": self._streams,
+            "aborted_streams": self._aborted_streams,
+        }
+
+
+def create_openai_pool() -> OpenAIClientPool:
+    settings = get_settings()
+    return OpenAIClientPool(
+        max_clients=settings.OPENAI_CLIENT_POOL_SIZE,
+        max_concurrency_per_key=settings.OPENAI_MAX_CONCURRENCY_PER_KEY,
+        max_connections=settings.OPENAI_MAX_CONNECTIONS,
+        connect_timeout=settings.OPENAI_CONNECT_TIMEOUT_SECONDS,
+        read_timeout=settings.OPENAI_READ_TIMEOUT_SECONDS,
+        max_retries=settings.OPENAI_MAX_RETRIES,
+        backoff_base=settings.OPENAI_BACKOFF_BASE_SECONDS,
+        backoff_max=settings.OPENAI_BACKOFF_MAX_SECONDS,
+        base_url=settings.OPENAI_BASE_URL,
+    )
+
+
+_openai_pool: Optional[OpenAIClientPool] = None
+
+
+def get_openai_pool() -> OpenAIClientPool:
+    """워커 공유 OpenAI 클라이언트 풀"""
+    global _openai_pool
+    if _openai_pool is None:
+        _openai_pool = create_openai_pool()
+    return _openai_pool
+
+
+def set_openai_pool(pool: Optional[OpenAIClientPool]):
+    """풀 교체 (테스트용, None이면 다음 호출 시 재생성)"""
+    global _openai_pool
+    _openai_pool = pool
+
+
+async def close_openai_pool():
+    """lifespan 종료 시 공유 연결 풀 정리"""
+    if _openai_pool is not None:
+        await _openai_pool.aclose()
+
+
+register_metrics_source(
+    "openai_pool",
+    lambda: _openai_pool.metrics() if _openai_pool is not None else {"clients": 0},
+)
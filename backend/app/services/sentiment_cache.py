@@ -0,0 +1,69 @@
+import hashlib
+import unicodedata
+from typing import Any, Optional
+
+from app.core.cache import LRUCache, RedisCacheTier, TwoTierCache, create_redis_client
+from app.core.config import get_settings
+from app.core.metrics import register_metrics_source
+
+MAX_TEXT_LENGTH = 512
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키 및 모델 입력용 텍스트 정규화 (uncased 모델이므로 소문자화)"""
+    text = unicodedata.normalize("NFC", text)
+    return " ".join(text.split()).lower()[:MAX_TEXT_LENGTH]
+
+
+def emotion_model_id() -> str:
+    """결과를 만든 모델 식별자 (양자화 ONNX 결과는 PyTorch 결과와 따로 캐시)"""
+    settings = get_settings()
+    if settings.EMOTION_MODEL_BACKEND == "onnx":
+        return f"{settings.EMOTION_MODEL_NAME}:onnx-int8"
+    return settings.EMOTION_MODEL_NAME
+
+
+def sentiment_cache_key(text: str, model_id: Optional[str] = None) -> str:
+    """정규화된 텍스트와 모델 ID의 해시"""
+    model_id = model_id or emotion_model_id()
+    payload = f"{model_id}\0{normalize_text(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def create_sentiment_cache(redis_client: Any = None) -> TwoTierCache:
+    """감정 분석 결과 캐시 생성 (redis_client가 있으면 Redis 계층 사용)"""
+    settings = get_settings()
+    remote = (
+        RedisCacheTier(
+            redis_client,
+            prefix="sentiment",
+            ttl=settings.SENTIMENT_CACHE_REDIS_TTL_SECONDS,
+        )
+        if redis_client is not None
+        else None
+    )
+    return TwoTierCache(
+        local=LRUCache(maxsize=settings.SENTIMENT_CACHE_SIZE), remote=remote
+    )
+
+
+_sentiment_cache: Optional[TwoTierCache] = None
+
+
+def get_sentiment_cache() -> TwoTierCache:
+    """워커 공유 감정 분석 결과 캐시"""
+    global _sentiment_cache
+    if _sentiment_cache is None:
+        _sentiment_cache = create_sentiment_cache(
+            create_redis_client(get_settings().REDIS_URL)
+        )
+    return _sentiment_cache
+
+
+def set_sentiment_cache(cache: Optional[TwoTierCache]):
+    """캐시 교체 (테스트용, None이면 다음 호출 시 재생성)"""
+    global _sentiment_cache
+    _sentiment_cache = cache
+
+
+register_metrics_source("sentiment_cache", lambda: get_sentiment_cache().stats())
@@ -0,0 +1,184 @@
+import uuid
+from collections import Counter, defaultdict
+from datetime import date
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.db.database import DBSession
+from app.models.emotion import EmotionRecord, EmotionType
+from app.models.focus import FocusSession, SessionType
+from app.models.stats import (
+    EMOTION_COUNT_COLUMNS,
+    FOCUS_MINUTES_COLUMNS,
+    DailyUserStats,
+)
+from sqlalchemy import delete, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, func, select
+
+# 기록 하나가 롤업에 더하는 값: (날짜, {컬럼: 증분})
+Contribution = Tuple[date, Dict[str, int]]
+
+ROLLUP_KEYS = ("user_id", "day")
+
+
+def emotion_contribution(record: EmotionRecord) -> Contribution:
+    """감정 기록 하나의 롤업 기여분"""
+    column = EMOTION_COUNT_COLUMNS[EmotionType(record.emotion_type)]
+    return record.recorded_at.date(), {
+        column: 1,
+        "emotion_level_sum": record.emotion_level,
+    }
+
+
+def focus_contribution(session: FocusSession) -> Optional[Contribution]:
+    """집중 세션 하나의 롤업 기여분 (종료된 세션만 집계)"""
+    if session.end_time is None:
+        return None
+
+    rated = session.productivity_rating is not None
+    return session.start_time.date(), {
+        "focus_sessions": 1,
+        "focus_minutes": session.duration_minutes,
+        "focus_rated_sessions": int(rated),
+        "focus_rating_sum": session.productivity_rating if rated else 0,
+        FOCUS_MINUTES_COLUMNS[SessionType(session.session_type)]: (
+            session.duration_minutes
+        ),
+    }
+
+
+async def update_daily_stats(
+    db: DBSession,
+    user_id: uuid.UUID,
+    before: Optional[Contribution],
+    after: Optional[Contribution],
+):
+    """기록 변경 전후 기여분의 차이를 롤업에 반영 (커밋은 호출한 쪽에서)"""
+    deltas: Dict[date, Counter] = defaultdict(Counter)
+    if before is not None:
+        deltas[before[0]].subtract(before[1])
+    if after is not None:
+        deltas[after[0]].update(after[1])
+
+    await _apply_deltas(db, user_id, deltas)
+
+
+async def add_daily_stats(
+    db: DBSession, user_id: uuid.UUID, contributions: Iterable[Optional[Contribution]]
+):
+    """여러 기록의 기여분을 날짜별로 합쳐 롤업에 반영 (일괄 생성용, 커밋은 호출한 쪽에서)"""
+    deltas: Dict[date, Counter] = defaultdict(Counter)
+    for contribution in contributions:
+        if contribution is not None:
+            deltas[contribution[0]].update(contribution[1])
+
+    await _apply_deltas(db, user_id, deltas)
+
+
+async def _apply_deltas(db: DBSession, user_id: uuid.UUID, deltas: Dict[date, Counter]):
+    for day, delta in deltas.items():
+        changes = {column: value for column, value in delta.items() if value}
+        if changes:
+            await _apply_delta(db, user_id, day, changes)
+
+
+async def _apply_delta(
+    db: DBSession, user_id: uuid.UUID, day: date, changes: Dict[str, int]
+):
+    table = DailyUserStats.__table__
+    dialect = db.get_bind().dialect.name
+
+    if dialect in ("sqlite", "postgresql"):
+        upsert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        statement = upsert(table).values(user_id=user_id, day=day, **changes)
+        statement = statement.on_conflict_do_update(
+            index_elements=ROLLUP_KEYS,
+            set_={
+                column: table.c[column] + statement.excluded[column]
+                for column in changes
+            },
+        )
+        await db.execute(statement)
+        return
+
+    # ON CONFLICT를 지원하지 않는 DB는 UPDATE 후 없으면 INSERT
+    result = await db.execute(
+        update(table)
+        .where(table.c.user_id == user_id, table.c.day == day)
+        .values({column: table.c[column] + value for column, value in changes.items()})
+    )
+    if result.rowcount == 0:
+        await db.execute(insert(table).values(user_id=user_id, day=day, **changes))
+
+
+def _as_date(value) -> date:
+    # SQLite의 date()는 문자열, PostgreSQL은 date 반환
+    return value if isinstance(value, date) else date.fromisoformat(str(value))
+
+
+def rebuild_daily_stats(session: Session, user_id: Optional[uuid.UUID] = None) -> int:
+    """원본 기록에서 롤업을 다시 계산 (백필/복구용, 재계산한 행 수 반환)"""
+    rows: Dict[Tuple[uuid.UUID, date], Counter] = defaultdict(Counter)
+
+    def scoped(statement, model):
+        if user_id is not None:
+            statement = statement.where(model.user_id == user_id)
+        return statement
+
+    day = func.date(EmotionRecord.recorded_at)
+    keys = (EmotionRecord.user_id, day, EmotionRecord.emotion_type)
+    statement = select(
+        *keys, func.count(), func.sum(EmotionRecord.emotion_level)
+    ).group_by(*keys)
+    for owner, value, emotion_type, count, level_sum in session.exec(
+        scoped(statement, EmotionRecord)
+    ):
+        row = rows[owner, _as_date(value)]
+        row[EMOTION_COUNT_COLUMNS[EmotionType(emotion_type)]] += count
+        row["emotion_level_sum"] += level_sum
+
+    day = func.date(FocusSession.start_time)
+    keys = (FocusSession.user_id, day, FocusSession.session_type)
+    statement = (
+        select(
+            *keys,
+            func.count(),
+            func.sum(FocusSession.duration_minutes),
+            func.count(FocusSession.productivity_rating),
+            func.sum(FocusSession.productivity_rating),
+        )
+        .where(FocusSession.end_time != None)
+        .group_by(*keys)
+    )
+    for owner, value, session_type, count, minutes, rated, rating_sum in session.exec(
+        scoped(statement, FocusSession)
+    ):
+        row = rows[owner, _as_date(value)]
+        row["focus_sessions"] += count
+        row["focus_minutes"] += minutes or 0
+        row["focus_rated_sessions"] += rated
+        row["focus_rating_sum"] += rating_sum or 0
+        row[FOCUS_MINUTES_COLUMNS[SessionType(session_type)]] += minutes or 0
+
+    statement = delete(DailyUserStats)
+    if user_id is not None:
+        statement = statement.where(DailyUserStats.user_id == user_id)
+    session.execute(statement)
+
+    if rows:
+        columns = [
+            c.name for c in DailyUserStats.__table__.c if c.name not in ROLLUP_KEYS
+        ]
+        session.execute(
+            insert(DailyUserStats),
+            [
+                {
+                    "user_id": owner,
+                    "day": value,
+                    **{column: counts[column] for column in columns},
+                }
+                for (owner, value), counts in rows.items()
+            ],
+        )
+    session.commit()
+    return len(rows)
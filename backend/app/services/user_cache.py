@@ -0,0 +1,100 @@
+import uuid as uuid_lib
+from typing import Any, Dict, Optional, Union
+
+from app.core.cache import LRUCache, RedisCacheTier, TwoTierCache, create_redis_client
+from app.core.config import get_settings
+from app.core.metrics import register_metrics_source
+from app.models.user import CurrentUser, User
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+_PENDING_KEY = "invalidated_user_ids"
+
+
+def create_user_cache(redis_client: Any = None) -> TwoTierCache:
+    """인증 사용자 캐시 생성 (redis_client가 있으면 Redis 계층 사용)
+
+    Redis를 쓰면 다른 워커의 무효화가 늦게 반영되지 않도록
+    로컬 계층 TTL을 USER_CACHE_LOCAL_TTL_SECONDS로 짧게 둔다.
+    """
+    settings = get_settings()
+    if redis_client is None:
+        return TwoTierCache(
+            local=LRUCache(
+                maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+            )
+        )
+    return TwoTierCache(
+        local=LRUCache(
+            maxsize=settings.USER_CACHE_SIZE,
+            ttl=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+        ),
+        remote=RedisCacheTier(
+            redis_client, prefix="user", ttl=settings.USER_CACHE_TTL_SECONDS
+        ),
+    )
+
+
+_user_cache: Optional[TwoTierCache] = None
+
+
+def get_user_cache() -> TwoTierCache:
+    """워커 공유 인증 사용자 캐시"""
+    global _user_cache
+    if _user_cache is None:
+        _user_cache = create_user_cache(create_redis_client(get_settings().REDIS_URL))
+    return _user_cache
+
+
+def set_user_cache(cache: Optional[TwoTierCache]):
+    """캐시 교체 (테스트용, None이면 다음 호출 시 재생성)"""
+    global _user_cache
+    _user_cache = cache
+
+
+def user_cache_key(user_id: Union[str, uuid_lib.UUID]) -> str:
+    return str(user_id)
+
+
+def to_cache_entry(user: User) -> Dict[str, Any]:
+    """인가에 필요한 필드만 JSON으로 저장 (비밀번호 해시, 설정 제외)"""
+    return CurrentUser.model_validate(user, from_attributes=True).model_dump(
+        mode="json"
+    )
+
+
+def from_cache_entry(entry: Dict[str, Any]) -> CurrentUser:
+    return CurrentUser.model_validate(entry)
+
+
+def invalidate_cached_user(user_id: Union[str, uuid_lib.UUID]):
+    """사용자 캐시 항목 삭제 (로컬 + Redis)"""
+    get_user_cache().delete(user_cache_key(user_id))
+
+
+# 사용자 행이 수정/삭제되면 커밋 후 캐시를 무효화한다.
+# flush 시점에 지우면 커밋 전에 다른 요청이 옛 값을 다시 채울 수 있으므로
+# 세션에 ID를 모아 두었다가 after_commit에서 지운다.
+def _mark_user_changed(mapper, connection, target: User):
+    session = object_session(target)
+    if session is None:
+        invalidate_cached_user(target.id)
+        return
+    session.info.setdefault(_PENDING_KEY, set()).add(target.id)
+
+
+def _invalidate_after_commit(session: Session):
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_cached_user(user_id)
+
+
+def _discard_after_rollback(session: Session, previous_transaction):
+    session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(User, "after_update", _mark_user_changed)
+event.listen(User, "after_delete", _mark_user_changed)
+event.listen(Session, "after_commit", _invalidate_after_commit)
+event.listen(Session, "after_soft_rollback", _discard_after_rollback)
+
+register_metrics_source("user_cache", lambda: get_user_cache().stats())
@@ -1,33 +1,37 @@
 import uuid
 from typing import Optional
 
-from app.core.security import get_password_hash, verify_password
+from app.core.executors import run_password_hashing
+from app.core.security import get_password_hash, verify_and_update_password
+from app.db.database import DBSession
 from app.models.user import User, UserCreate
-from sqlmodel import Session, select
+from sqlmodel import select
 
 
 class UserService:
-    def __init__(self, db: Session):
+    def __init__(self, db: DBSession):
         self.db = db
 
-    def get_user_by_email(self, email: str) -> Optional[User]:
+    async def get_user_by_email(self, email: str) -> Optional[User]:
         """이메일로 사용자 조회"""
         statement = select(User).where(User.email == email)
-        return self.db.exec(statement).first()
+        return (await self.db.exec(statement)).first()
 
-    def get_user_by_id(self, user_id: str) -> Optional[User]:
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """ID로 사용자 조회"""
         try:
             user_uuid = uuid.UUID(user_id)
-            statement = select(User).where(User.id == user_uuid)
-            return self.db.exec(statement).first()
         except ValueError:
             return None
+        statement = select(User).where(User.id == user_uuid)
+        return (await self.db.exec(statement)).first()
 
-    def create_user(self, user_create: UserCreate) -> User:
+    async def create_user(self, user_create: UserCreate) -> User:
         """새 사용자 생성"""
-        # 비밀번호 해싱
-        hashed_password = get_password_hash(user_create.password)
+        # 비밀번호 해싱 (CPU 바운드 → 비밀번호 전용 프로세스 풀)
+        hashed_password = await run_password_hashing(
+            get_password_hash, user_create.password
+        )
 
         # User 객체 생성
         db_user = User(
@@ -39,23 +43,34 @@ class UserService:
         )
 
         self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
         return db_user
 
-    def authenticate_user(self, email: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """사용자 인증"""
-        user = self.get_user_by_email(email)
+        user = await self.get_user_by_email(email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = await run_password_hashing(
+            verify_and_update_password, password, user.hashed_password
+        )
+        if not valid:
             return None
+        if new_hash:
+            # BCRYPT_ROUNDS가 바뀐 경우 로그인 시점에 새 설정으로 다시 해싱
+            user.hashed_password = new_hash
+            self.db.add(user)
+            await self.db.commit()
+            await self.db.refresh(user)
         return user
 
-    def update_user_password(self, user: User, new_password: str) -> User:
+    async def update_user_password(self, user: User, new_password: str) -> User:
         """비밀번호 변경"""
-        user.hashed_password = get_password_hash(new_password)
+        user.hashed_password = await run_password_hashing(
+            get_password_hash, new_password
+        )
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.commit()
+        await self.db.refresh(user)
         return user
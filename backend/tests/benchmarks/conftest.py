@@ -0,0 +1,30 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlmodel import Session
+
+
+@pytest.fixture
+def bench_user_id(authenticated_client: TestClient) -> uuid.UUID:
+    """벤치마크용 사용자 ID"""
+    response = authenticated_client.get("/api/v1/auth/me")
+    return uuid.UUID(response.json()["id"])
+
+
+@pytest.fixture
+def bulk_insert(session: Session):
+    """API를 거치지 않고 대량 데이터 삽입"""
+
+    def insert_rows(model, rows):
+        now = datetime.utcnow()
+        for row in rows:
+            row.setdefault("id", uuid.uuid4())
+            row.setdefault("created_at", now)
+            row.setdefault("updated_at", now)
+        session.execute(insert(model), rows)
+        session.commit()
+
+    return insert_rows
@@ -0,0 +1,38 @@
+import asyncio
+import time
+
+import pytest
+from app.api.deps import get_current_user
+from app.core import security
+from fastapi.testclient import TestClient
+
+
+def timed_dependency(token: str, clear_token_cache: bool, repeat: int = 2000):
+    """get_current_user 호출당 평균 소요 시간 (사용자 캐시는 채워진 상태)"""
+
+    async def run():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            if clear_token_cache:
+                security.clear_token_cache()
+            await get_current_user(db=None, token=token)
+        return (time.perf_counter() - start) / repeat
+
+    return asyncio.run(run())
+
+
+@pytest.mark.slow
+def test_auth_dependency_overhead(authenticated_client: TestClient):
+    """토큰 캐시 적용 전후 인증 의존성 오버헤드"""
+    token = authenticated_client.headers["Authorization"].split()[1]
+    # 사용자 캐시를 채워 DB 조회 없이 토큰 처리 비용만 측정
+    assert authenticated_client.get("/api/v1/auth/me").status_code == 200
+
+    uncached = min(timed_dependency(token, clear_token_cache=True) for _ in range(3))
+    cached = min(timed_dependency(token, clear_token_cache=False) for _ in range(3))
+
+    print(
+        f"jwt verify={uncached * 1e6:6.1f}us/call "
+        f"cached={cached * 1e6:6.1f}us/call ({uncached / cached:.1f}x)"
+    )
+    assert cached < uncached
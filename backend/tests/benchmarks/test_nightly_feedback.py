@@ -0,0 +1,74 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from app.db.pool import enable_sqlite_wal
+from app.models.feedback import AIFeedback
+from app.models.user import User
+from app.services.feedback_scheduler import DailyFeedbackScheduler
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine
+
+USERS = 1000
+LLM_LATENCY = 0.05  # 가짜 OpenAI 응답 지연(초)
+
+
+@pytest.mark.slow
+def test_nightly_run_throughput(tmp_path):
+    """스케줄러 자체 오버헤드 측정 (LLM 호출은 고정 지연으로 대체)
+
+    처리량이 동시 실행 수 / LLM 지연에 가까우면 DB 작업 상태 관리가 병목이 아님.
+    """
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'nightly.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    enable_sqlite_wal(engine)  # 앱 기본 설정(SQLITE_WAL)과 동일
+    SQLModel.metadata.create_all(engine)
+    created = datetime(2024, 1, 1)
+    with Session(engine) as session:
+        session.execute(
+            insert(User),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "email": f"bench{i}@example.com",
+                    "name": f"user{i}",
+                    "timezone": "UTC",
+                    "is_active": True,
+                    "hashed_password": "x",
+                    "settings": json.dumps({"openai_api_key": f"sk-{i}"}),
+                    "created_at": created,
+                    "updated_at": created,
+                }
+                for i in range(USERS)
+            ],
+        )
+        session.commit()
+
+    async def build(db, user, api_key, start, end):
+        await asyncio.sleep(LLM_LATENCY)
+        return AIFeedback(user_id=user.id, feedback_text="ok")
+
+    concurrency = 64
+    scheduler = DailyFeedbackScheduler(
+        session_factory=lambda: Session(engine),
+        builder=build,
+        local_hour=21,
+        max_concurrency=concurrency,
+        key_rate_per_minute=0,
+    )
+    # 전날 작업만 생성되는 시각 (사용자당 1건)
+    summary = asyncio.run(scheduler.run_once(datetime(2024, 1, 15, 12, 0)))
+    engine.dispose()
+
+    ideal = concurrency / LLM_LATENCY
+    per_100k = 100_000 / summary["throughput_per_second"]
+    print(
+        f"{summary['processed']} jobs in {summary['duration_seconds']:.1f}s "
+        f"({summary['throughput_per_second']:.0f}/s, ideal {ideal:.0f}/s), "
+        f"100k users ≈ {per_100k / 60:.1f}min"
+    )
+    assert summary["succeeded"] == USERS
@@ -0,0 +1,69 @@
+import random
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from app.api.pagination import encode_cursor, order_by_keys
+from app.api.v1.endpoints.emotions import EMOTION_SORT_KEYS
+from app.models.emotion import EmotionRecord, EmotionType
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+PAGE_SIZE = 100
+PAGE = 1000
+
+
+def timed_page(client: TestClient, params, repeat: int = 3):
+    """목록 요청 최소 소요 시간"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get("/api/v1/emotions/", params=params)
+        samples.append(time.perf_counter() - start)
+        assert response.status_code == 200
+    return min(samples), response.json()
+
+
+@pytest.mark.slow
+def test_deep_page_cursor_vs_offset(
+    authenticated_client, bulk_insert, bench_user_id, session: Session
+):
+    """1000번째 페이지: 커서 방식은 앞 페이지를 건너뛰는 비용이 없음"""
+    rng = random.Random(11)
+    types = list(EmotionType)
+    now = datetime.utcnow()
+    bulk_insert(
+        EmotionRecord,
+        [
+            {
+                "user_id": bench_user_id,
+                "emotion_level": rng.randint(1, 5),
+                "emotion_type": rng.choice(types),
+                "recorded_at": now - timedelta(seconds=rng.randint(0, 365 * 86400)),
+            }
+            for _ in range(PAGE * PAGE_SIZE)
+        ],
+    )
+
+    # 999번째 페이지 마지막 행으로 커서 생성
+    last = session.exec(
+        select(EmotionRecord)
+        .where(EmotionRecord.user_id == bench_user_id)
+        .order_by(*order_by_keys(EMOTION_SORT_KEYS))
+        .offset((PAGE - 1) * PAGE_SIZE - 1)
+    ).first()
+    cursor = encode_cursor([last.recorded_at, last.id])
+
+    offset_time, offset_page = timed_page(
+        authenticated_client, {"skip": (PAGE - 1) * PAGE_SIZE, "limit": PAGE_SIZE}
+    )
+    cursor_time, cursor_page = timed_page(
+        authenticated_client, {"cursor": cursor, "limit": PAGE_SIZE}
+    )
+
+    print(
+        f"page={PAGE} offset={offset_time * 1000:7.1f}ms "
+        f"cursor={cursor_time * 1000:7.1f}ms"
+    )
+    assert [e["id"] for e in cursor_page] == [e["id"] for e in offset_page]
+    assert cursor_time < offset_time
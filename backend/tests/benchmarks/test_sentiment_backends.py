@@ -0,0 +1,138 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from app.core.config import get_settings
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+CORPUS = json.loads((Path(__file__).parent / "sentiment_corpus.json").read_text())
+
+# 각 백엔드를 새 프로세스에서 로드해 최대 RSS 측정 (import 비용 포함).
+# Linux의 ru_maxrss는 fork 시점 부모(두 모델을 올린 pytest)의 값을 물려받으므로
+# exec 이후 주소 공간 기준인 VmHWM을 우선 사용
+MEMORY_SCRIPT = """
+import json, resource, sys
+from app.services.ai_providers import create_sentiment_pipeline
+from app.services.onnx_sentiment import load_onnx_sentiment_pipeline
+
+backend, model, model_dir, corpus_path = sys.argv[1:]
+if backend == "pytorch":
+    pipeline = create_sentiment_pipeline(model, -1)
+else:
+    pipeline = load_onnx_sentiment_pipeline(model_dir)
+pipeline(json.load(open(corpus_path)), batch_size=16)
+try:
+    status = open("/proc/self/status").read()
+    print(status.split("VmHWM:")[1].split()[0])
+except OSError:
+    print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def stars(result) -> int:
+    return int(result["label"].split()[0])
+
+
+@pytest.fixture(scope="module")
+def backends(tmp_path_factory):
+    """(PyTorch 파이프라인, int8 ONNX 파이프라인, ONNX 모델 디렉터리)
+
+    torch/onnx/onnxruntime이 없거나 모델을 받을 수 없으면(오프라인) 건너뜀.
+    """
+    for module in ("torch", "onnx", "onnxruntime", "transformers"):
+        pytest.importorskip(module)
+    from app.services.ai_providers import create_sentiment_pipeline
+    from app.services.onnx_sentiment import (
+        export_quantized_model,
+        load_onnx_sentiment_pipeline,
+    )
+
+    model_name = get_settings().EMOTION_MODEL_NAME
+    model_dir = tmp_path_factory.mktemp("emotion-onnx-int8")
+    try:
+        export_quantized_model(model_name, model_dir)
+        pytorch = create_sentiment_pipeline(model_name, -1)
+    except OSError as e:
+        pytest.skip(f"{model_name} is not available: {e}")
+    return pytorch, load_onnx_sentiment_pipeline(model_dir), model_dir
+
+
+def timed(pipeline, batch_size: int, repeat: int = 3) -> float:
+    """코퍼스 전체 처리 시간 중 최솟값 (텍스트당 ms)"""
+    pipeline(CORPUS[:2], batch_size=2)  # 첫 호출 초기화 비용 제외
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        if batch_size == 1:
+            for text in CORPUS:
+                pipeline([text], batch_size=1)
+        else:
+            pipeline(CORPUS, batch_size=batch_size)
+        best = min(best, time.perf_counter() - started)
+    return best / len(CORPUS) * 1000
+
+
+def peak_rss_mb(backend: str, model_dir: Path) -> float:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            MEMORY_SCRIPT,
+            backend,
+            get_settings().EMOTION_MODEL_NAME,
+            str(model_dir),
+            str(Path(__file__).parent / "sentiment_corpus.json"),
+        ],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "DATABASE_URL": "sqlite://"},
+        capture_output=True,
+        text=True,
+        timeout=600,
+    )
+    assert result.returncode == 0, result.stderr
+    return int(result.stdout.split()[-1]) / 1024
+
+
+@pytest.mark.slow
+def test_onnx_int8_agrees_with_pytorch(backends):
+    """양자화 모델의 별점이 PyTorch 결과와 거의 같음 (고정 코퍼스)"""
+    pytorch, onnx, _ = backends
+
+    expected = [stars(r) for r in pytorch(CORPUS, batch_size=16)]
+    actual = [stars(r) for r in onnx(CORPUS, batch_size=16)]
+
+    agreement = sum(a == b for a, b in zip(expected, actual)) / len(CORPUS)
+    max_diff = max(abs(a - b) for a, b in zip(expected, actual))
+    print(f"star agreement={agreement:.1%} max diff={max_diff}")
+    assert agreement >= 0.9
+    assert max_diff <= 1
+
+
+@pytest.mark.slow
+def test_sentiment_backend_latency_and_memory(backends):
+    """PyTorch fp32 대비 ONNX int8 지연 시간과 최대 메모리"""
+    pytorch, onnx, model_dir = backends
+
+    rows = []
+    for name, pipeline in (("pytorch", pytorch), ("onnx-int8", onnx)):
+        single = timed(pipeline, batch_size=1)
+        batched = timed(pipeline, batch_size=16)
+        rows.append((name, single, batched))
+    memory = {
+        "pytorch": peak_rss_mb("pytorch", model_dir),
+        "onnx-int8": peak_rss_mb("onnx", model_dir),
+    }
+
+    for name, single, batched in rows:
+        print(
+            f"{name:10s} single={single:6.1f}ms/text batch16={batched:6.1f}ms/text "
+            f"peak_rss={memory[name]:7.0f}MB"
+        )
+    (_, torch_single, _), (_, onnx_single, _) = rows
+    print(f"speedup (single)={torch_single / onnx_single:.1f}x")
+    assert onnx_single < torch_single
+    assert memory["onnx-int8"] < memory["pytorch"]
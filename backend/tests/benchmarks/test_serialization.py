@@ -0,0 +1,74 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from app.models.emotion import EmotionRecord
+from app.models.focus import FocusSession
+from app.models.todo import TodoItem
+from fastapi.testclient import TestClient
+
+PAGE_SIZE = 100
+
+
+def timed_list(client: TestClient, path: str, repeat: int = 30) -> float:
+    """100개짜리 목록 페이지 요청 최소 소요 시간"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(path, params={"limit": PAGE_SIZE})
+        samples.append(time.perf_counter() - start)
+        assert response.status_code == 200
+        assert len(response.json()) == PAGE_SIZE
+    return min(samples)
+
+
+@pytest.mark.slow
+def test_list_serialization_latency(
+    authenticated_client: TestClient, bulk_insert, bench_user_id
+):
+    """목록 엔드포인트 응답 생성(검증 + 직렬화) 시간"""
+    now = datetime.utcnow()
+    bulk_insert(
+        EmotionRecord,
+        [
+            {
+                "user_id": bench_user_id,
+                "emotion_level": i % 5 + 1,
+                "emotion_type": "calm",
+                "note": "benchmark note " * 4,
+                "recorded_at": now - timedelta(minutes=i),
+            }
+            for i in range(PAGE_SIZE)
+        ],
+    )
+    bulk_insert(
+        FocusSession,
+        [
+            {
+                "user_id": bench_user_id,
+                "start_time": now - timedelta(hours=i),
+                "end_time": now - timedelta(hours=i) + timedelta(minutes=25),
+                "duration_minutes": 25,
+                "session_type": "pomodoro",
+                "productivity_rating": i % 5 + 1,
+            }
+            for i in range(PAGE_SIZE)
+        ],
+    )
+    bulk_insert(
+        TodoItem,
+        [
+            {
+                "user_id": bench_user_id,
+                "title": f"benchmark todo {i}",
+                "description": "benchmark description",
+                "priority": i % 5 + 1,
+                "due_date": now + timedelta(days=i),
+            }
+            for i in range(PAGE_SIZE)
+        ],
+    )
+
+    for path in ("/api/v1/emotions/", "/api/v1/focus/", "/api/v1/todos/"):
+        elapsed = timed_list(authenticated_client, path)
+        print(f"{path:<20} {PAGE_SIZE} rows: {elapsed * 1000:6.2f}ms")
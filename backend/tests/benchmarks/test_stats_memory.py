@@ -0,0 +1,69 @@
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pytest
+from app.models.emotion import EmotionRecord, EmotionType
+from app.services.stats_service import rebuild_daily_stats
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+
+def measure(client: TestClient, url: str, params=None):
+    """요청 한 번의 소요 시간과 최대 메모리 사용량"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = client.get(url, params=params)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert response.status_code == 200
+    return elapsed, peak, response.json()
+
+
+@pytest.mark.slow
+def test_emotion_stats_memory_is_constant(
+    authenticated_client, bulk_insert, bench_user_id, session: Session
+):
+    """기록 수가 늘어도 감정 통계 요청의 메모리 사용량은 일정"""
+    rng = random.Random(7)
+    types = list(EmotionType)
+    results = []
+    inserted = 0
+    now = datetime.utcnow()
+
+    # 첫 요청의 초기화 비용은 측정에서 제외
+    authenticated_client.get("/api/v1/emotions/stats/summary")
+
+    for total in (1000, 4000, 16000):
+        bulk_insert(
+            EmotionRecord,
+            [
+                {
+                    "user_id": bench_user_id,
+                    "emotion_level": rng.randint(1, 5),
+                    "emotion_type": rng.choice(types),
+                    "recorded_at": now - timedelta(minutes=rng.randint(0, 80 * 1440)),
+                }
+                for _ in range(total - inserted)
+            ],
+        )
+        inserted = total
+        rebuild_daily_stats(session, bench_user_id)
+
+        elapsed, peak, data = measure(
+            authenticated_client, "/api/v1/emotions/stats/summary", {"days": 90}
+        )
+        assert data["total_records"] == total
+        results.append((total, elapsed, peak))
+
+    for total, elapsed, peak in results:
+        print(
+            f"rows={total:>6} time={elapsed * 1000:7.1f}ms peak={peak / 1024:8.1f}KiB"
+        )
+
+    smallest_peak = results[0][2]
+    largest_peak = results[-1][2]
+    # 행 수는 16배지만 메모리는 거의 그대로여야 함
+    assert largest_peak < smallest_peak * 2
@@ -0,0 +1,75 @@
+import random
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from app.models.todo import TodoItem
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session
+
+
+def timed_stats(client: TestClient, repeat: int = 5):
+    """통계 요청 최소 소요 시간"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get("/api/v1/todos/stats/summary")
+        samples.append(time.perf_counter() - start)
+        assert response.status_code == 200
+    return min(samples), response.json()
+
+
+@pytest.mark.slow
+def test_todo_stats_latency_with_100k_todos(
+    authenticated_client, bulk_insert, bench_user_id, session: Session
+):
+    """할 일 10만 개에서도 통계 요청은 인덱스 집계로 빠르게 응답"""
+    rng = random.Random(9)
+    now = datetime.utcnow()
+    results = []
+    inserted = 0
+
+    for total in (10_000, 100_000):
+        rows = []
+        for _ in range(total - inserted):
+            completed = rng.random() < 0.6
+            rows.append(
+                {
+                    "user_id": bench_user_id,
+                    "title": "benchmark",
+                    "completed": completed,
+                    "priority": rng.randint(1, 5),
+                    "due_date": now + timedelta(days=rng.randint(-30, 30))
+                    if rng.random() < 0.7
+                    else None,
+                    "completed_at": now if completed else None,
+                }
+            )
+        bulk_insert(TodoItem, rows)
+        inserted = total
+
+        elapsed, data = timed_stats(authenticated_client)
+        assert data["total"] == total
+        results.append((total, elapsed))
+
+    for total, elapsed in results:
+        print(f"todos={total:>7} time={elapsed * 1000:7.1f}ms")
+
+    # 엔드포인트가 실제로 보내는 쿼리가 테이블 대신 복합 인덱스만 읽는지 확인
+    plans = []
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        if "FROM todo_items" in statement:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plans.append(" / ".join(row[3] for row in cursor.fetchall()))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", explain)
+    try:
+        authenticated_client.get("/api/v1/todos/stats/summary")
+    finally:
+        event.remove(engine, "before_cursor_execute", explain)
+    assert "COVERING INDEX ix_todo_items_user_completed_due" in plans[-1]
+
+    assert results[-1][1] < 0.5
@@ -1,5 +1,9 @@
+import json
 import os
 import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Generator
 
 import pytest
@@ -16,10 +20,17 @@ from app.main import app
 # 모든 모델을 명시적으로 import (순서 중요)
 from app.models.base import BaseModel
 from app.models.emotion import EmotionRecord
-from app.models.feedback import AIFeedback
+from app.models.feedback import AIFeedback, FeedbackJob
 from app.models.focus import FocusSession
+from app.models.stats import DailyUserStats
+from app.models.sync import Tombstone
 from app.models.todo import TodoItem
 from app.models.user import User
+from app.services.model_registry import model_registry
+from app.services.sentiment_cache import create_sentiment_cache, set_sentiment_cache
+from app.services.feedback_scheduler import set_feedback_scheduler
+from app.services.openai_pool import set_openai_pool
+from app.services.user_cache import set_user_cache
 
 
 @pytest.fixture(scope="function")  # 각 테스트마다 새로운 DB
@@ -95,8 +106,186 @@ def authenticated_client(client: TestClient, test_user_data) -> TestClient:
     return client
 
 
+class StubEmotionAnalyzer:
+    """테스트용 로컬 감정 분석 모델 (HuggingFace 파이프라인 대체)"""
+
+    def __init__(self, label: str = "4 stars", score: float = 0.9):
+        self.label = label
+        self.score = score
+        self.calls = []
+
+    def __call__(self, inputs, **kwargs):
+        self.calls.append(inputs)
+        texts = inputs if isinstance(inputs, list) else [inputs]
+        return [{"label": self.label, "score": self.score} for _ in texts]
+
+
+@pytest.fixture
+def stub_emotion_analyzer():
+    """공유 레지스트리에 스텁 모델 등록"""
+    analyzer = StubEmotionAnalyzer()
+    model_registry.set_emotion_analyzer(analyzer)
+    set_sentiment_cache(create_sentiment_cache())
+    yield analyzer
+    model_registry.reset()
+    set_sentiment_cache(None)
+
+
+class FakeRedis:
+    """테스트용 인메모리 Redis (get/set/delete만 지원)"""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value.encode("utf-8") if isinstance(value, str) else value
+        return True
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+
+@pytest.fixture
+def fake_redis():
+    """인메모리 Redis 대체 객체"""
+    return FakeRedis()
+
+
+class FakeOpenAIServer:
+    """테스트용 로컬 OpenAI HTTP 서버 (chat/completions만 지원)
+
+    statuses에 넣은 상태 코드를 차례로 응답하고, 비면 200 완료 응답을 반환한다.
+    stream=true 요청에는 reply를 한 글자씩 SSE로 보낸다.
+    """
+
+    def __init__(self):
+        self.statuses = []
+        self.delay = 0.0
+        self.reply = "테스트 피드백"
+        self.chunk_delay = 0.0  # 스트리밍 청크 사이 지연
+        self.completed_streams = 0
+        self.disconnects = 0
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v1"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with server._lock:
+                    server.requests.append(
+                        {"authorization": self.headers["Authorization"], "body": body}
+                    )
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                    status = server.statuses.pop(0) if server.statuses else 200
+                try:
+                    time.sleep(server.delay)
+                    if status == 200 and body.get("stream"):
+                        self._stream(body)
+                        return
+                    if status == 200:
+                        payload = {
+                            "id": "chatcmpl-test",
+                            "object": "chat.completion",
+                            "created": int(time.time()),
+                            "model": body["model"],
+                            "choices": [
+                                {
+                                    "index": 0,
+                                    "message": {
+                                        "role": "assistant",
+                                        "content": server.reply,
+                                    },
+                                    "finish_reason": "stop",
+                                }
+                            ],
+                        }
+                    else:
+                        payload = {"error": {"message": "fake error", "type": "test"}}
+                    data = json.dumps(payload).encode("utf-8")
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except ConnectionError:
+                    pass  # 클라이언트가 타임아웃으로 먼저 연결을 끊은 경우
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+            def _stream(self, body):
+                """stream=true 요청: reply를 한 글자씩 SSE 청크로 전송"""
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                chunks = [
+                    {"role": "assistant", "content": ""},
+                    *({"content": char} for char in server.reply),
+                ]
+                try:
+                    for delta in chunks:
+                        payload = {
+                            "id": "chatcmpl-test",
+                            "object": "chat.completion.chunk",
+                            "created": int(time.time()),
+                            "model": body["model"],
+                            "choices": [
+                                {"index": 0, "delta": delta, "finish_reason": None}
+                            ],
+                        }
+                        self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode())
+                        self.wfile.flush()
+                        time.sleep(server.chunk_delay)
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    self.wfile.flush()
+                    server.completed_streams += 1
+                except ConnectionError:
+                    server.disconnects += 1  # 클라이언트가 스트림을 중간에 닫음
+
+        return Handler
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def fake_openai_server():
+    """로컬 가짜 OpenAI 서버"""
+    server = FakeOpenAIServer()
+    server.start()
+    yield server
+    server.stop()
+
+
 @pytest.fixture(autouse=True)
 def reset_database():
     """각 테스트 전후로 데이터베이스 상태 리셋"""
     yield
     # 테스트 후 정리 작업이 필요한 경우 여기에 추가
+    set_user_cache(None)
+    set_openai_pool(None)
+    set_feedback_scheduler(None)
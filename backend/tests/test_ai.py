@@ -0,0 +1,652 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from app.core.cache import LRUCache
+from app.services.ai_service import AIService
+from app.services.emotion_batcher import EmotionBatcher
+from app.services.model_registry import ModelRegistry, ModelState
+from app.services.openai_pool import OpenAIClientPool, set_openai_pool
+from app.services.sentiment_cache import (
+    create_sentiment_cache,
+    get_sentiment_cache,
+    sentiment_cache_key,
+    set_sentiment_cache,
+)
+from fastapi.testclient import TestClient
+
+
+def test_analyze_emotion_uses_shared_model(
+    authenticated_client: TestClient, stub_emotion_analyzer
+):
+    """감정 분석 엔드포인트가 공유 모델을 사용하는지 테스트"""
+    for text in ["오늘은 기분이 좋다", "피곤함"]:
+        response = authenticated_client.post(
+            "/api/v1/ai/analyze-emotion", params={"text": text}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["sentiment_score"] == 4
+        assert data["emotion_inference"] == "positive"
+
+    assert len(stub_emotion_analyzer.calls) == 2
+
+
+def test_registry_loads_model_once():
+    """여러 스레드에서 동시에 요청해도 모델은 한 번만 로드"""
+    load_count = 0
+
+    def loader():
+        nonlocal load_count
+        load_count += 1
+        time.sleep(0.05)
+        return object()
+
+    registry = ModelRegistry(loader=loader)
+    assert registry.state == ModelState.NOT_LOADED
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get_emotion_analyzer()))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert load_count == 1
+    assert len({id(r) for r in results}) == 1
+    assert registry.is_ready
+
+
+def test_registry_failed_state(caplog):
+    """모델 로드 실패 시 상태만 노출(원인은 로그에만) 및 재시도하지 않음"""
+    calls = []
+
+    def loader():
+        calls.append(1)
+        raise RuntimeError("model not found at /srv/models")
+
+    registry = ModelRegistry(loader=loader)
+    assert registry.get_emotion_analyzer() is None
+    assert registry.get_emotion_analyzer() is None
+    assert len(calls) == 1
+    assert registry.status() == {"emotion_analyzer": "failed"}
+    assert "model not found at /srv/models" in caplog.text
+
+    registry.reset(loader=lambda: "model")
+    assert registry.warm_up()
+    assert registry.state == ModelState.READY
+
+
+def test_ai_service_borrows_shared_model(stub_emotion_analyzer):
+    """AIService 인스턴스들이 같은 모델을 공유"""
+    assert AIService().emotion_analyzer is stub_emotion_analyzer
+    assert AIService().emotion_analyzer is stub_emotion_analyzer
+
+
+def test_health_reports_model_state(client: TestClient, stub_emotion_analyzer):
+    """헬스 체크에 모델 준비 상태 포함"""
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json()["models"]["emotion_analyzer"] == "ready"
+
+
+def test_batcher_groups_concurrent_requests():
+    """동시 요청을 배치로 묶고 결과를 각 호출자에게 돌려줌"""
+    batch_sizes = []
+
+    def run_batch(texts):
+        batch_sizes.append(len(texts))
+        return [{"text": text} for text in texts]
+
+    batcher = EmotionBatcher(run_batch, max_batch_size=4, max_wait_ms=50)
+
+    async def main():
+        return await asyncio.gather(*(batcher.analyze(f"note {i}") for i in range(10)))
+
+    results = asyncio.run(main())
+
+    assert [r["text"] for r in results] == [f"note {i}" for i in range(10)]
+    assert batch_sizes == [4, 4, 2]
+    metrics = batcher.metrics()
+    assert metrics["batches_total"] == 3
+    assert metrics["items_total"] == 10
+    assert metrics["max_batch_size_seen"] == 4
+    assert metrics["queue_depth"] == 0
+
+
+def test_batcher_flushes_after_max_wait():
+    """배치가 차지 않아도 최대 대기 시간 후 처리"""
+    batcher = EmotionBatcher(lambda texts: [{} for _ in texts], max_batch_size=16)
+
+    result = asyncio.run(batcher.analyze("혼자 온 요청"))
+
+    assert result == {}
+    assert batcher.metrics()["last_batch_size"] == 1
+
+
+def test_batcher_propagates_errors():
+    """배치 실행 실패 시 대기 중인 모든 호출자에게 예외 전달"""
+
+    def run_batch(texts):
+        raise RuntimeError("inference failed")
+
+    batcher = EmotionBatcher(run_batch, max_batch_size=2)
+
+    async def main():
+        return await asyncio.gather(
+            batcher.analyze("a"), batcher.analyze("b"), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_batcher_fails_short_results():
+    """배치 결과 수가 입력보다 적어도 호출자가 멈추지 않고 예외를 받음"""
+    batcher = EmotionBatcher(lambda texts: [{}], max_batch_size=2)
+
+    async def main():
+        return await asyncio.wait_for(
+            asyncio.gather(
+                batcher.analyze("a"), batcher.analyze("b"), return_exceptions=True
+            ),
+            timeout=5,
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_batched_analysis_uses_single_model_call(stub_emotion_analyzer):
+    """배치 분석은 모델을 한 번만 호출하고 빈 텍스트는 건너뜀"""
+    results = AIService().analyze_emotion_texts(["좋음", "", "나쁨"])
+
+    assert len(stub_emotion_analyzer.calls) == 1
+    assert stub_emotion_analyzer.calls[0] == ["좋음", "나쁨"]
+    assert results[1] == {}
+    assert results[0]["sentiment_score"] == 4
+
+
+def test_internal_metrics_exposes_batcher(client: TestClient):
+    """내부 지표 엔드포인트에 배처 지표 포함"""
+    response = client.get("/internal/metrics")
+    assert response.status_code == 200
+    assert "queue_depth" in response.json()["emotion_batcher"]
+
+
+def test_sentiment_cache_skips_repeated_notes(stub_emotion_analyzer):
+    """정규화 후 같은 텍스트는 모델을 다시 호출하지 않음"""
+    ai_service = AIService()
+    first = ai_service.analyze_emotion_text("피곤함")
+    second = ai_service.analyze_emotion_text("  피곤함 ")
+
+    assert len(stub_emotion_analyzer.calls) == 1
+    assert {k: v for k, v in first.items() if k != "analyzed_at"} == {
+        k: v for k, v in second.items() if k != "analyzed_at"
+    }
+
+
+def test_sentiment_cache_hit_returns_fresh_copy(stub_emotion_analyzer):
+    """캐시에는 라벨/점수만 두고, 적중 시 분석 시각이 새로 찍힌 별도 dict 반환"""
+    ai_service = AIService()
+    first = ai_service.analyze_emotion_text("피곤함")
+    first["sentiment_score"] = 1  # 호출한 쪽의 수정이 다른 호출에 번지지 않음
+    time.sleep(0.01)
+    second = ai_service.analyze_emotion_text("피곤함")
+
+    assert second is not first
+    assert second["sentiment_score"] == 4
+    assert second["analyzed_at"] > first["analyzed_at"]
+    cached = get_sentiment_cache().get(sentiment_cache_key("피곤함"))
+    assert set(cached) == {"label", "score"}
+    # 배처의 로컬 캐시 경로도 같은 형식
+    assert ai_service.cached_emotion_analysis("피곤함")["sentiment_score"] == 4
+
+
+def test_sentiment_cache_shared_through_redis(stub_emotion_analyzer, fake_redis):
+    """Redis 계층을 통해 다른 워커의 분석 결과를 재사용"""
+    worker_a = create_sentiment_cache(fake_redis)
+    set_sentiment_cache(worker_a)
+    AIService().analyze_emotion_text("괜찮음")
+
+    worker_b = create_sentiment_cache(fake_redis)
+    set_sentiment_cache(worker_b)
+    result = AIService().analyze_emotion_text("괜찮음")
+
+    assert result["sentiment_score"] == 4
+    assert len(stub_emotion_analyzer.calls) == 1
+    assert worker_b.stats()["remote_hits"] == 1
+    assert worker_b.stats()["misses"] == 0
+
+
+def test_sentiment_cache_key_depends_on_model():
+    """캐시 키는 512자로 자른 정규화 텍스트와 모델 ID로 결정"""
+    long_text = "가" * 600
+    assert sentiment_cache_key(long_text, "model-a") == sentiment_cache_key(
+        long_text[:512] + "나", "model-a"
+    )
+    assert sentiment_cache_key("Tired", "model-a") == sentiment_cache_key(
+        "tired", "model-a"
+    )
+    assert sentiment_cache_key("tired", "model-a") != sentiment_cache_key(
+        "tired", "model-b"
+    )
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """크기 제한 초과 시 가장 오래 사용하지 않은 항목 제거"""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def fake_openai_pool(server, **options) -> OpenAIClientPool:
+    options.setdefault("backoff_base", 0.01)
+    return OpenAIClientPool(base_url=server.base_url, **options)
+
+
+def chat(pool: OpenAIClientPool, api_key: str = "sk-test"):
+    return pool.chat_completion(
+        api_key, model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}]
+    )
+
+
+def test_openai_pool_reuses_clients_per_key(fake_openai_server):
+    """같은 키는 클라이언트를 재사용하고, 풀이 가득 차면 오래된 키부터 제거"""
+    pool = fake_openai_pool(fake_openai_server, max_clients=2)
+
+    async def main():
+        for key in ("sk-a", "sk-a", "sk-b", "sk-c"):
+            response = await chat(pool, key)
+            assert response.choices[0].message.content == "테스트 피드백"
+        await pool.aclose()
+
+    asyncio.run(main())
+
+    assert [r["authorization"] for r in fake_openai_server.requests] == [
+        "Bearer sk-a",
+        "Bearer sk-a",
+        "Bearer sk-b",
+        "Bearer sk-c",
+    ]
+    metrics = pool.metrics()
+    assert metrics["requests"] == 4
+    assert metrics["evictions"] == 1
+
+
+def test_openai_pool_retries_rate_limit_and_server_errors(fake_openai_server):
+    """429/5xx는 백오프 후 재시도"""
+    fake_openai_server.statuses = [429, 503]
+    pool = fake_openai_pool(fake_openai_server, max_retries=3)
+
+    response = asyncio.run(chat(pool))
+
+    assert response.choices[0].message.content == "테스트 피드백"
+    assert len(fake_openai_server.requests) == 3
+    assert pool.metrics()["retries"] == 2
+
+
+def test_openai_pool_does_not_retry_client_errors(fake_openai_server):
+    """인증 오류 같은 4xx는 재시도하지 않음"""
+    import openai
+
+    fake_openai_server.statuses = [401]
+    pool = fake_openai_pool(fake_openai_server)
+
+    with pytest.raises(openai.AuthenticationError):
+        asyncio.run(chat(pool))
+    assert len(fake_openai_server.requests) == 1
+
+
+def test_openai_pool_gives_up_after_max_retries(fake_openai_server):
+    """재시도 횟수를 넘으면 마지막 오류 전달"""
+    import openai
+
+    fake_openai_server.statuses = [429] * 5
+    pool = fake_openai_pool(fake_openai_server, max_retries=2)
+
+    with pytest.raises(openai.RateLimitError):
+        asyncio.run(chat(pool))
+    assert len(fake_openai_server.requests) == 3
+
+
+def test_openai_pool_read_timeout(fake_openai_server):
+    """응답이 read timeout보다 늦으면 APITimeoutError"""
+    import openai
+
+    fake_openai_server.delay = 0.5
+    pool = fake_openai_pool(fake_openai_server, read_timeout=0.1, max_retries=0)
+
+    with pytest.raises(openai.APITimeoutError):
+        asyncio.run(chat(pool))
+
+
+def test_openai_pool_limits_concurrency_per_key(fake_openai_server):
+    """키별 동시 요청 수 제한"""
+    fake_openai_server.delay = 0.1
+    pool = fake_openai_pool(fake_openai_server, max_concurrency_per_key=2)
+
+    async def main():
+        await asyncio.gather(*(chat(pool) for _ in range(6)))
+
+    asyncio.run(main())
+
+    assert len(fake_openai_server.requests) == 6
+    assert fake_openai_server.max_active == 2
+
+
+def test_openai_pool_keeps_busy_keys_when_evicting(fake_openai_server):
+    """사용 중인 키는 LRU에서 제거하지 않아 키별 동시 실행 제한이 유지됨"""
+    fake_openai_server.delay = 0.1
+    pool = fake_openai_pool(
+        fake_openai_server, max_clients=1, max_concurrency_per_key=1
+    )
+
+    async def main():
+        await asyncio.gather(chat(pool, "sk-a"), chat(pool, "sk-b"), chat(pool, "sk-a"))
+        await chat(pool, "sk-c")  # 이제 유휴 키가 제거됨
+        await pool.aclose()
+
+    asyncio.run(main())
+
+    # sk-a 두 요청은 같은 세마포어로 차례로 실행 (sk-b와만 겹침)
+    assert fake_openai_server.max_active == 2
+    assert pool.metrics()["evictions"] == 2
+
+
+def test_openai_pool_closes_connections_of_finished_loop(fake_openai_server):
+    """asyncio.run이 끝날 때 그 루프에서 만든 연결 풀도 닫힘"""
+    pool = fake_openai_pool(fake_openai_server)
+
+    async def main():
+        await chat(pool)
+        return pool._http_client
+
+    first = asyncio.run(main())
+    assert first.is_closed
+
+    second = asyncio.run(main())
+    assert second is not first and second.is_closed
+    assert len(fake_openai_server.requests) == 2
+
+
+def test_generate_feedback_uses_openai_pool(
+    authenticated_client: TestClient, fake_openai_server
+):
+    """피드백 생성 엔드포인트가 풀을 통해 OpenAI를 호출하고 결과를 저장"""
+    set_openai_pool(fake_openai_pool(fake_openai_server))
+    authenticated_client.post(
+        "/api/v1/ai/settings", json={"openai_api_key": "sk-user-key"}
+    )
+    authenticated_client.post(
+        "/api/v1/emotions", json={"emotion_level": 4, "emotion_type": "happy"}
+    )
+
+    response = authenticated_client.post("/api/v1/ai/generate-feedback")
+    assert response.status_code == 200
+    assert response.json()["feedback"] == "테스트 피드백"
+    assert fake_openai_server.requests[0]["authorization"] == "Bearer sk-user-key"
+
+    feedbacks = authenticated_client.get("/api/v1/ai/feedbacks").json()
+    assert [f["feedback_text"] for f in feedbacks] == ["테스트 피드백"]
+
+
+def test_generate_feedback_reuses_result_for_unchanged_input(
+    authenticated_client: TestClient, fake_openai_server
+):
+    """입력이 그대로면 GPT를 다시 부르지 않고, 바뀌거나 force=true면 새로 생성"""
+    set_openai_pool(fake_openai_pool(fake_openai_server))
+    authenticated_client.post(
+        "/api/v1/ai/settings", json={"openai_api_key": "sk-user-key"}
+    )
+    authenticated_client.post(
+        "/api/v1/emotions", json={"emotion_level": 4, "emotion_type": "happy"}
+    )
+
+    first = authenticated_client.post("/api/v1/ai/generate-feedback").json()
+    second = authenticated_client.post("/api/v1/ai/generate-feedback").json()
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["feedback"] == first["feedback"]
+    assert len(fake_openai_server.requests) == 1
+
+    # 유형이 다르면 다른 지문
+    other = authenticated_client.post(
+        "/api/v1/ai/generate-feedback", params={"feedback_type": "weekly_report"}
+    )
+    assert other.json()["cached"] is False
+
+    forced = authenticated_client.post(
+        "/api/v1/ai/generate-feedback", params={"force": True}
+    )
+    assert forced.json()["cached"] is False
+
+    authenticated_client.post("/api/v1/todos", json={"title": "새 할 일"})
+    changed = authenticated_client.post("/api/v1/ai/generate-feedback")
+    assert changed.json()["cached"] is False
+    assert len(fake_openai_server.requests) == 4
+
+    feedbacks = authenticated_client.get("/api/v1/ai/feedbacks").json()
+    assert len(feedbacks) == 4
+    metadata = json.loads(feedbacks[0]["ai_metadata"])
+    assert len(metadata["input_fingerprint"]) == 64
+
+
+def test_generate_feedback_rejects_unknown_type(authenticated_client: TestClient):
+    authenticated_client.post(
+        "/api/v1/ai/settings", json={"openai_api_key": "sk-user-key"}
+    )
+
+    response = authenticated_client.post(
+        "/api/v1/ai/generate-feedback", params={"feedback_type": "poem"}
+    )
+    assert response.status_code == 400
+
+
+def parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_openai_pool_streams_chunks_before_completion(fake_openai_server):
+    """첫 조각은 전체 생성이 끝나기 전에 도착"""
+    fake_openai_server.chunk_delay = 0.05
+    pool = fake_openai_pool(fake_openai_server)
+
+    async def main():
+        await chat(pool)  # openai import와 연결 생성 비용은 측정에서 제외
+        started = time.perf_counter()
+        first_chunk_at = None
+        parts = []
+        async for text in pool.stream_chat_completion(
+            "sk-test", model="gpt-4o-mini", messages=[]
+        ):
+            if first_chunk_at is None:
+                first_chunk_at = time.perf_counter() - started
+            parts.append(text)
+        await pool.aclose()
+        return first_chunk_at, time.perf_counter() - started, "".join(parts)
+
+    first_chunk_at, total, text = asyncio.run(main())
+
+    assert text == "테스트 피드백"
+    assert fake_openai_server.requests[1]["body"]["stream"] is True
+    assert first_chunk_at < total / 3
+    assert pool.metrics()["streams"] == 1
+    assert pool.metrics()["aborted_streams"] == 0
+
+
+def test_openai_pool_closes_upstream_when_consumer_stops(fake_openai_server):
+    """소비자가 중간에 멈추면 업스트림 응답을 닫고 키 슬롯을 반납"""
+    fake_openai_server.chunk_delay = 0.05
+    fake_openai_server.reply = "가" * 100
+    pool = fake_openai_pool(fake_openai_server, max_concurrency_per_key=1)
+
+    async def main():
+        chunks = pool.stream_chat_completion(
+            "sk-test", model="gpt-4o-mini", messages=[]
+        )
+        assert await chunks.__anext__() == "가"
+        await chunks.aclose()
+        # 같은 키의 다음 요청이 막히지 않음
+        response = await asyncio.wait_for(chat(pool), timeout=2)
+        await pool.aclose()
+        return response
+
+    asyncio.run(main())
+
+    deadline = time.time() + 2
+    while fake_openai_server.disconnects == 0 and time.time() < deadline:
+        time.sleep(0.05)
+    assert fake_openai_server.disconnects == 1
+    assert fake_openai_server.completed_streams == 0
+    metrics = pool.metrics()
+    assert metrics["aborted_streams"] == 1
+    assert metrics["in_flight"] == 0
+
+
+def test_stream_feedback_sends_deltas_and_persists(
+    authenticated_client: TestClient, fake_openai_server
+):
+    set_openai_pool(fake_openai_pool(fake_openai_server))
+    authenticated_client.post(
+        "/api/v1/ai/settings", json={"openai_api_key": "sk-user-key"}
+    )
+
+    response = authenticated_client.get("/api/v1/ai/generate-feedback/stream")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_sse(response.text)
+
+    deltas = [data["text"] for name, data in events if name == "delta"]
+    assert "".join(deltas) == "테스트 피드백"
+    assert len(deltas) > 1
+    name, done = events[-1]
+    assert name == "done" and done["cached"] is False
+
+    feedbacks = authenticated_client.get("/api/v1/ai/feedbacks").json()
+    assert [(f["id"], f["feedback_text"]) for f in feedbacks] == [
+        (done["feedback_id"], "테스트 피드백")
+    ]
+
+    # 입력이 그대로면 저장된 피드백을 한 번에 전송
+    again = parse_sse(
+        authenticated_client.get("/api/v1/ai/generate-feedback/stream").text
+    )
+    assert again[0] == ("delta", {"text": "테스트 피드백"})
+    assert again[-1][1]["cached"] is True
+    assert len(fake_openai_server.requests) == 1
+
+
+def test_stream_feedback_reports_upstream_errors(
+    authenticated_client: TestClient, fake_openai_server
+):
+    fake_openai_server.statuses = [401]
+    set_openai_pool(fake_openai_pool(fake_openai_server))
+    authenticated_client.post(
+        "/api/v1/ai/settings", json={"openai_api_key": "sk-bad-key"}
+    )
+
+    response = authenticated_client.get("/api/v1/ai/generate-feedback/stream")
+
+    assert parse_sse(response.text) == [
+        ("error", {"detail": "유효하지 않은 OpenAI API 키입니다."})
+    ]
+    assert authenticated_client.get("/api/v1/ai/feedbacks").json() == []
+
+
+class FakeOnnxSession:
+    """onnxruntime.InferenceSession 대역 — 입력 길이에 따라 고정 logits 반환"""
+
+    def __init__(self):
+        self.feeds = []
+
+    def get_inputs(self):
+        return [
+            type("Input", (), {"name": name})()
+            for name in ("input_ids", "attention_mask", "token_type_ids")
+        ]
+
+    def run(self, outputs, feeds):
+        import numpy as np
+
+        assert outputs == ["logits"]
+        self.feeds.append(feeds)
+        lengths = feeds["attention_mask"].sum(axis=1)
+        # 토큰 수 n → (n % 5 + 1)점이 가장 높은 logits
+        logits = np.zeros((len(lengths), 5), dtype=np.float32)
+        logits[np.arange(len(lengths)), lengths % 5] = 3.0
+        return [logits]
+
+
+def fake_tokenizer(texts, padding, truncation, max_length, return_tensors):
+    """공백 단위 토큰화 후 가장 긴 입력에 맞춰 패딩"""
+    import numpy as np
+
+    lengths = [min(len(text.split()), max_length) for text in texts]
+    width = max(lengths)
+    mask = np.array([[1] * n + [0] * (width - n) for n in lengths], dtype=np.int32)
+    return {
+        "input_ids": mask * 7,
+        "attention_mask": mask,
+        "token_type_ids": np.zeros_like(mask),
+    }
+
+
+def test_onnx_pipeline_matches_pipeline_output_contract():
+    """ONNX 백엔드도 파이프라인과 같은 label/score를 돌려줘 분석 결과 형식이 같음"""
+    pytest.importorskip("numpy")
+    from app.services.onnx_sentiment import OnnxSentimentPipeline
+
+    session = FakeOnnxSession()
+    labels = ["1 star", "2 stars", "3 stars", "4 stars", "5 stars"]
+    pipeline = OnnxSentimentPipeline(session, fake_tokenizer, labels)
+
+    results = pipeline(["a b c", "a", "a b c d e f g h"], batch_size=2)
+    assert [r["label"] for r in results] == ["4 stars", "2 stars", "4 stars"]
+    assert results[0]["score"] == pytest.approx(0.834, abs=1e-3)
+    # batch_size마다 한 번씩 실행, 입력은 int64로 변환
+    assert len(session.feeds) == 2
+    assert session.feeds[0]["input_ids"].dtype.name == "int64"
+    assert pipeline("a b") == [{"label": "3 stars", "score": results[1]["score"]}]
+
+    set_sentiment_cache(create_sentiment_cache())
+    try:
+        analysis = AIService(emotion_analyzer=pipeline).analyze_emotion_text("a b c")
+    finally:
+        set_sentiment_cache(None)
+    assert analysis["sentiment_score"] == 4
+    assert analysis["emotion_inference"] == "positive"
+    assert analysis["confidence"] == pytest.approx(0.834, abs=1e-3)
+
+
+def test_onnx_backend_selected_in_settings(monkeypatch, tmp_path):
+    """EMOTION_MODEL_BACKEND=onnx면 ONNX 모델을 로드하고, 없으면 실패 상태로 노출"""
+    from app.core.config import get_settings
+    from app.services.model_registry import load_emotion_pipeline
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "EMOTION_MODEL_BACKEND", "onnx")
+    monkeypatch.setattr(settings, "EMOTION_ONNX_MODEL_DIR", str(tmp_path / "missing"))
+
+    registry = ModelRegistry(loader=load_emotion_pipeline)
+    assert registry.get_emotion_analyzer() is None
+    assert registry.state == ModelState.FAILED
+    # 양자화 모델 결과는 PyTorch 결과와 캐시를 공유하지 않음
+    assert sentiment_cache_key("tired") != sentiment_cache_key(
+        "tired", settings.EMOTION_MODEL_NAME
+    )
@@ -0,0 +1,97 @@
+import asyncio
+import uuid
+
+import httpx
+from app.api.deps import get_db
+from app.db.database import OffloadedSession, is_async_url, to_sync_url
+from app.main import app
+from app.models.user import User
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.pool import StaticPool
+
+
+def test_async_mode_selected_by_url_scheme():
+    """DATABASE_URL 스킴으로 비동기 엔진 모드 선택"""
+    assert is_async_url("sqlite+aiosqlite:///./adhd_helper.db")
+    assert is_async_url("postgresql+asyncpg://user:pw@localhost/adhd_helper")
+    assert not is_async_url("sqlite:///./adhd_helper.db")
+    assert not is_async_url("postgresql://user:pw@localhost/adhd_helper")
+
+    assert (
+        to_sync_url("postgresql+asyncpg://user:pw@localhost/adhd_helper")
+        == "postgresql://user:pw@localhost/adhd_helper"
+    )
+    assert to_sync_url("sqlite:///./adhd_helper.db") == "sqlite:///./adhd_helper.db"
+
+
+def test_offloaded_session_keeps_attributes_after_commit():
+    """커밋 후 속성 접근이 이벤트 루프에서 다시 SELECT하지 않음"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+
+    async def main():
+        db = OffloadedSession(Session(engine))
+        user = User(email="offload@example.com", name="Offload", hashed_password="x")
+        db.add(user)
+        await db.commit()
+        assert not inspect(user).expired_attributes
+        await db.close()
+
+    asyncio.run(main())
+    engine.dispose()
+
+
+def test_endpoints_with_async_session():
+    """aiosqlite 비동기 세션으로 인증/감정 기록 흐름 테스트"""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def get_db_override():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    async def main():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+        async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+            user = {
+                "email": f"async_{uuid.uuid4().hex[:8]}@example.com",
+                "password": "testpassword123",
+                "name": "Async User",
+            }
+            response = await client.post("/api/v1/auth/register", json=user)
+            assert response.status_code == 200
+
+            response = await client.post(
+                "/api/v1/auth/login",
+                json={"email": user["email"], "password": user["password"]},
+            )
+            assert response.status_code == 200
+            token = response.json()["access_token"]
+            client.headers.update({"Authorization": f"Bearer {token}"})
+
+            for level in (2, 4):
+                response = await client.post(
+                    "/api/v1/emotions/",
+                    json={"emotion_level": level, "emotion_type": "calm"},
+                )
+                assert response.status_code == 200
+
+            response = await client.get("/api/v1/emotions/")
+            assert len(response.json()) == 2
+
+            response = await client.get("/api/v1/emotions/stats/summary")
+            assert response.json()["average_level"] == 3.0
+
+        await engine.dispose()
+
+    app.dependency_overrides[get_db] = get_db_override
+    try:
+        asyncio.run(main())
+    finally:
+        app.dependency_overrides.clear()
@@ -1,6 +1,18 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
 import pytest
+from app.core import security
+from app.core.config import get_settings
+from app.core.executors import PoolSaturatedError, ProcessWorkerPool, password_pool
+from app.models.user import User
+from app.services.user_cache import create_user_cache, get_user_cache, set_user_cache
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from passlib.hash import bcrypt
+from sqlalchemy import event
+from sqlmodel import Session, select
 
 
 def test_register(client: TestClient):
@@ -113,3 +125,172 @@ def test_unauthorized_access(client: TestClient):
     """인증되지 않은 접근 테스트"""
     response = client.get("/api/v1/auth/me")
     assert response.status_code == 401
+
+
+@contextmanager
+def count_user_selects(engine):
+    """users 테이블 SELECT 횟수 집계"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if (
+            statement.lstrip().upper().startswith("SELECT")
+            and "FROM users" in statement
+        ):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def test_current_user_cached(authenticated_client: TestClient, session: Session):
+    """인증 사용자는 캐시되어 요청마다 users 조회를 하지 않음"""
+    authenticated_client.get("/api/v1/auth/me")
+
+    with count_user_selects(session.get_bind()) as statements:
+        for _ in range(3):
+            assert authenticated_client.get("/api/v1/todos/").status_code == 200
+            assert authenticated_client.get("/api/v1/auth/me").status_code == 200
+
+    assert statements == []
+    assert get_user_cache().stats()["local_hits"] >= 6
+
+
+def test_deactivated_user_invalidates_cache(
+    authenticated_client: TestClient, session: Session
+):
+    """사용자 비활성화 시 캐시가 무효화되어 다음 요청부터 거부"""
+    assert authenticated_client.get("/api/v1/auth/me").status_code == 200
+
+    user = session.exec(select(User)).one()
+    user.is_active = False
+    session.add(user)
+    session.commit()
+
+    response = authenticated_client.get("/api/v1/todos/")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
+
+
+def test_updated_user_refreshes_cache(
+    authenticated_client: TestClient, session: Session
+):
+    """사용자 정보 변경 후에는 새 값을 반환"""
+    assert authenticated_client.get("/api/v1/auth/me").json()["name"] == "Test User"
+
+    user = session.exec(select(User)).one()
+    user.name = "Renamed"
+    session.add(user)
+    session.commit()
+
+    assert authenticated_client.get("/api/v1/auth/me").json()["name"] == "Renamed"
+
+
+def test_user_cache_shared_through_redis(
+    authenticated_client: TestClient, session: Session, fake_redis
+):
+    """Redis 계층으로 다른 워커의 캐시와 무효화를 공유"""
+    set_user_cache(create_user_cache(fake_redis))
+    assert authenticated_client.get("/api/v1/auth/me").status_code == 200
+    assert any(key.startswith("user:") for key in fake_redis.store)
+
+    # 다른 워커: 로컬 캐시는 비어 있지만 Redis에서 조회
+    set_user_cache(create_user_cache(fake_redis))
+    with count_user_selects(session.get_bind()) as statements:
+        assert authenticated_client.get("/api/v1/auth/me").status_code == 200
+    assert statements == []
+    assert get_user_cache().stats()["remote_hits"] == 1
+
+    user = session.exec(select(User)).one()
+    user.is_active = False
+    session.add(user)
+    session.commit()
+    assert not any(key.startswith("user:") for key in fake_redis.store)
+
+
+def test_verified_token_cached(monkeypatch):
+    """같은 토큰은 서명 검증을 한 번만 수행"""
+    security.clear_token_cache()
+    token = security.create_access_token("user-1")
+    calls = []
+    real_decode = security.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(1)
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+
+    for _ in range(5):
+        claims = security.decode_token_claims(token)
+        assert claims.sub == "user-1"
+        assert claims.type is None
+    assert len(calls) == 1
+
+    refresh = security.decode_token_claims(security.create_refresh_token("user-1"))
+    assert refresh.type == "refresh"
+
+    # 변조된 토큰은 캐시되지 않고 매번 거부
+    assert security.decode_token(token[:-2] + "xx") is None
+    assert security.decode_token(token[:-2] + "xx") is None
+
+
+def test_verified_token_expires_with_token():
+    """캐시 항목은 토큰 만료 시점에 함께 만료"""
+    security.clear_token_cache()
+    token = security.create_access_token("user-1", timedelta(seconds=1))
+    assert security.decode_token(token) == "user-1"
+
+    # exp는 초 단위로 잘리고 jose는 exp와 같은 초까지 허용하므로 2초 이상 대기
+    time.sleep(2.1)
+    assert security.decode_token(token) is None
+
+
+def test_login_rehashes_outdated_hash(client: TestClient, session: Session):
+    """BCRYPT_ROUNDS와 다른 해시는 로그인 성공 시 새 설정으로 다시 해싱"""
+    credentials = {"email": "rehash@example.com", "password": "testpassword123"}
+    client.post("/api/v1/auth/register", json={**credentials, "name": "Rehash"})
+
+    user = session.exec(select(User)).one()
+    user.hashed_password = bcrypt.using(rounds=4).hash(credentials["password"])
+    session.add(user)
+    session.commit()
+
+    response = client.post("/api/v1/auth/login", json=credentials)
+    assert response.status_code == 200
+
+    session.refresh(user)
+    rounds = get_settings().BCRYPT_ROUNDS
+    assert user.hashed_password.startswith(f"$2b${rounds:02d}$")
+    assert client.post("/api/v1/auth/login", json=credentials).status_code == 200
+
+
+def test_auth_rejected_when_password_pool_saturated(client: TestClient, monkeypatch):
+    """해싱 대기열이 가득 차면 이벤트 루프를 막지 않고 503 + Retry-After"""
+    monkeypatch.setattr(password_pool, "max_pending", 0)
+
+    credentials = {"email": "storm@example.com", "password": "testpassword123"}
+    response = client.post(
+        "/api/v1/auth/register", json={**credentials, "name": "Storm"}
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert password_pool.metrics()["rejected"] >= 1
+
+
+async def test_process_pool_bounds_pending_work():
+    """실행 중 + 대기 작업이 한도에 도달하면 즉시 거부"""
+    pool = ProcessWorkerPool("test", max_workers=1, max_pending=2)
+    try:
+        running = [asyncio.create_task(pool.run(time.sleep, 0.3)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(PoolSaturatedError):
+            await pool.run(time.sleep, 0)
+        await asyncio.gather(*running)
+        await pool.run(time.sleep, 0)
+        assert pool.metrics()["rejected"] == 1
+    finally:
+        pool.shutdown()
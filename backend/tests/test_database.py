@@ -0,0 +1,258 @@
+from contextlib import contextmanager
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from app import cli
+from app.core.config import Settings, get_settings
+from app.db.database import prepare_database
+from app.db.migrations import (
+    SchemaVersionError,
+    alembic_config,
+    head_revision,
+    verify_schema,
+)
+from app.db.pool import enable_sqlite_wal, engine_options, pool_metrics
+from fastapi.testclient import TestClient
+from sqlalchemy import event, inspect, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.pool import StaticPool
+
+
+def test_memory_sqlite_uses_static_pool():
+    """인메모리 SQLite는 StaticPool 사용"""
+    options = engine_options("sqlite://", Settings())
+    assert options["poolclass"] is StaticPool
+    assert options["echo"] is False
+
+
+def test_pool_settings_applied():
+    """풀 설정값이 엔진 인자로 전달됨"""
+    settings = Settings(
+        DB_POOL_SIZE=3, DB_MAX_OVERFLOW=2, DB_POOL_TIMEOUT=5, DB_POOL_RECYCLE=60
+    )
+    options = engine_options("postgresql://user:pw@localhost/adhd", settings)
+
+    assert options["pool_size"] == 3
+    assert options["max_overflow"] == 2
+    assert options["pool_timeout"] == 5
+    assert options["pool_recycle"] == 60
+    assert options["pool_pre_ping"] is True
+    assert options["poolclass"].metrics.capacity == 5
+
+
+def test_pool_checkout_metrics(tmp_path):
+    """체크아웃 횟수, 포화도, 타임아웃 집계"""
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    settings = Settings(DB_POOL_SIZE=1, DB_MAX_OVERFLOW=1, DB_POOL_TIMEOUT=0.05)
+    engine = create_engine(url, **engine_options(url, settings))
+
+    first = engine.connect()
+    second = engine.connect()
+    metrics = pool_metrics(engine)
+    assert metrics["checkouts"] == 2
+    assert metrics["checked_out"] == 2
+    assert metrics["saturation"] == 1.0
+
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    assert pool_metrics(engine)["timeouts"] == 1
+
+    first.close()
+    second.close()
+    assert pool_metrics(engine)["checked_out"] == 0
+    engine.dispose()
+
+
+def test_sqlite_wal_mode(tmp_path):
+    """파일 SQLite는 WAL 저널 모드 사용"""
+    url = f"sqlite:///{tmp_path / 'wal.db'}"
+    engine = create_engine(url, **engine_options(url, Settings()))
+    enable_sqlite_wal(engine)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+    engine.dispose()
+
+
+def test_internal_metrics_exposes_pool(client: TestClient):
+    """내부 지표 엔드포인트에 커넥션 풀 지표 포함"""
+    response = client.get("/internal/metrics")
+    assert response.status_code == 200
+    assert "sync" in response.json()["db_pool"]
+
+
+@contextmanager
+def capture_query_plans(engine):
+    """실행되는 SELECT마다 SQLite EXPLAIN QUERY PLAN 결과 수집"""
+    plans = []
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            details = " / ".join(row[3] for row in cursor.fetchall())
+            plans.append((statement, details))
+
+    event.listen(engine, "before_cursor_execute", explain)
+    try:
+        yield plans
+    finally:
+        event.remove(engine, "before_cursor_execute", explain)
+
+
+def plan_for(plans, table: str) -> str:
+    """해당 테이블을 조회한 마지막 쿼리의 실행 계획"""
+    for statement, details in reversed(plans):
+        if f"FROM {table}" in statement:
+            return details
+    raise AssertionError(f"no query on {table}")
+
+
+def test_hot_queries_use_composite_indexes(
+    authenticated_client: TestClient, session: Session
+):
+    """목록/통계 쿼리가 복합 인덱스를 사용하는지 EXPLAIN으로 확인"""
+    authenticated_client.post(
+        "/api/v1/emotions/", json={"emotion_level": 3, "emotion_type": "calm"}
+    )
+    authenticated_client.post(
+        "/api/v1/emotions/", json={"emotion_level": 4, "emotion_type": "calm"}
+    )
+    for _ in range(3):
+        response = authenticated_client.post("/api/v1/focus/", json={})
+        authenticated_client.put(f"/api/v1/focus/{response.json()['id']}/end", json={})
+    authenticated_client.post("/api/v1/focus/", json={})
+
+    # 인덱스 크기 통계가 있어야 진행 중 세션 조회에 부분 인덱스를 선택함
+    session.execute(text("ANALYZE"))
+    session.commit()
+
+    cursor = authenticated_client.get("/api/v1/emotions/", params={"limit": 1}).headers[
+        "X-Next-Cursor"
+    ]
+
+    with capture_query_plans(session.get_bind()) as plans:
+        authenticated_client.get("/api/v1/emotions/")
+        emotion_list = plan_for(plans, "emotion_records")
+        authenticated_client.get("/api/v1/emotions/", params={"cursor": cursor})
+        emotion_page = plan_for(plans, "emotion_records")
+
+        authenticated_client.get("/api/v1/focus/")
+        focus_list = plan_for(plans, "focus_sessions")
+        authenticated_client.get("/api/v1/focus/current")
+        focus_current = plan_for(plans, "focus_sessions")
+        authenticated_client.get(
+            "/api/v1/focus/stats/summary", params={"group_by": "session_type"}
+        )
+        authenticated_client.get("/api/v1/emotions/stats/summary")
+        stats = plan_for(plans, "daily_user_stats")
+
+        authenticated_client.get("/api/v1/todos/")
+        todo_list = plan_for(plans, "todo_items")
+        authenticated_client.get("/api/v1/todos/stats/summary")
+        todo_stats = plan_for(plans, "todo_items")
+
+        authenticated_client.get("/api/v1/ai/feedbacks")
+        feedbacks = plan_for(plans, "ai_feedbacks")
+
+    assert "ix_emotion_records_user_recorded_at" in emotion_list
+    assert "ix_emotion_records_user_recorded_at (user_id=? AND" in emotion_page
+    assert "ix_focus_sessions_user_start_time" in focus_list
+    assert "ix_focus_sessions_user_open" in focus_current
+    assert "sqlite_autoindex_daily_user_stats" in stats
+    assert "ix_todo_items_user_list_order" in todo_list
+    assert "COVERING INDEX ix_todo_items_user_completed_due" in todo_stats
+    assert "ix_ai_feedbacks_user_created_at" in feedbacks
+
+    # 목록 정렬은 인덱스 순서를 그대로 사용 (별도 정렬 없음)
+    for plan in (emotion_list, emotion_page, focus_list, todo_list, feedbacks):
+        assert "TEMP B-TREE" not in plan
+
+
+def test_migrations_match_models(tmp_path):
+    """Alembic 마이그레이션 결과가 모델 정의(인덱스 포함)와 일치"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+    config = alembic_config(engine)
+
+    command.upgrade(config, "head")
+    with engine.connect() as conn:
+        diff = compare_metadata(MigrationContext.configure(conn), SQLModel.metadata)
+    assert diff == []
+
+    command.downgrade(config, "base")
+    with engine.connect() as conn:
+        assert inspect(conn).get_table_names() == ["alembic_version"]
+    engine.dispose()
+
+
+def test_initial_revision_is_pre_migration_schema(tmp_path):
+    """0001은 create_all 시절 스키마만 담아 stamp 0001 후 upgrade로 나머지가 생김"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'stamp.db'}")
+    config = alembic_config(engine)
+
+    command.upgrade(config, "0001")
+    with engine.connect() as conn:
+        assert "daily_user_stats" not in inspect(conn).get_table_names()
+        indexes = {i["name"] for i in inspect(conn).get_indexes("todo_items")}
+        assert "ix_todo_items_user_completed_due" not in indexes
+
+    command.upgrade(config, "head")
+    with engine.connect() as conn:
+        assert "daily_user_stats" in inspect(conn).get_table_names()
+        indexes = {i["name"] for i in inspect(conn).get_indexes("todo_items")}
+        assert "ix_todo_items_user_completed_due" in indexes
+    engine.dispose()
+
+
+def test_verify_startup_mode(tmp_path, monkeypatch):
+    """verify 모드는 마이그레이션이 적용된 DB에서만 시작 (CLI 작업도 같은 경로)"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'verify.db'}")
+    monkeypatch.setattr("app.db.database.engine", engine)
+    monkeypatch.setattr(cli, "engine", engine)
+    monkeypatch.setattr(get_settings(), "DB_STARTUP_MODE", "verify")
+
+    with pytest.raises(SchemaVersionError):
+        prepare_database("verify")
+    with pytest.raises(SchemaVersionError):
+        cli.main(["rebuild-stats"])
+    with pytest.raises(SchemaVersionError):
+        cli.main(["daily-feedback"])
+    assert inspect(engine).get_table_names() == []
+
+    assert cli.main(["migrate", "--revision", "0001"]) == 0
+    with pytest.raises(SchemaVersionError):
+        verify_schema(engine)
+
+    assert cli.main(["migrate"]) == 0
+    prepare_database("verify")
+    assert verify_schema(engine) == head_revision()
+    assert cli.main(["rebuild-stats"]) == 0
+    engine.dispose()
+
+
+def test_create_all_stamps_head_on_empty_database(tmp_path, monkeypatch):
+    """빈 DB에 create_all하면 head로 stamp, 리비전 없는 기존 DB는 verify가 stamp 안내"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'create_all.db'}")
+    monkeypatch.setattr("app.db.database.engine", engine)
+
+    prepare_database("create_all")
+    assert verify_schema(engine) == head_revision()
+    engine.dispose()
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'unstamped.db'}")
+    monkeypatch.setattr("app.db.database.engine", engine)
+    SQLModel.metadata.create_all(engine)
+
+    prepare_database("create_all")
+    with pytest.raises(SchemaVersionError, match="alembic stamp"):
+        prepare_database("verify")
+    engine.dispose()
+
+
+def test_health_reports_startup(client: TestClient):
+    """헬스 체크에 시작 과정 소요 시간 포함"""
+    startup = client.get("/health").json()["startup"]
+    assert startup["db_startup_mode"] == "create_all"
+    assert startup["duration_ms"] >= 0
@@ -60,3 +60,122 @@ def test_emotion_stats(authenticated_client: TestClient):
     assert data["average_level"] == 4.0
     assert data["most_common_emotion"] == "happy"
     assert data["period_days"] == 7  # 7일 기간 확인
+
+
+def test_emotion_stats_daily_breakdown(authenticated_client: TestClient):
+    """감정 통계 일별 집계 테스트"""
+    for emotion in [
+        {"emotion_level": 2, "emotion_type": "sad"},
+        {"emotion_level": 4, "emotion_type": "calm"},
+    ]:
+        response = authenticated_client.post("/api/v1/emotions", json=emotion)
+        assert response.status_code == 200
+
+    response = authenticated_client.get(
+        "/api/v1/emotions/stats/summary", params={"include_daily": True}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["emotion_distribution"] == {"sad": 1, "calm": 1}
+    assert len(data["daily"]) == 1
+    assert data["daily"][0]["count"] == 2
+    assert data["daily"][0]["average_level"] == 3.0
+
+
+def test_emotion_cursor_pagination(authenticated_client: TestClient):
+    """커서 페이지네이션은 offset 방식과 같은 순서로 중복/누락 없이 조회"""
+    # 같은 recorded_at이 섞여 있어도 id로 순서가 정해져야 함
+    same_time = datetime.utcnow().isoformat()
+    for level in range(1, 6):
+        authenticated_client.post(
+            "/api/v1/emotions/",
+            json={
+                "emotion_level": level,
+                "emotion_type": "calm",
+                "recorded_at": same_time if level % 2 else None,
+            },
+        )
+
+    expected = [e["id"] for e in authenticated_client.get("/api/v1/emotions/").json()]
+
+    seen = []
+    response = authenticated_client.get("/api/v1/emotions/", params={"limit": 2})
+    seen += [e["id"] for e in response.json()]
+    while "X-Next-Cursor" in response.headers:
+        response = authenticated_client.get(
+            "/api/v1/emotions/",
+            params={"limit": 2, "cursor": response.headers["X-Next-Cursor"]},
+        )
+        seen += [e["id"] for e in response.json()]
+
+    assert seen == expected
+
+    # 첫 페이지를 받은 뒤 새 기록이 추가돼도 다음 페이지가 밀리지 않음
+    response = authenticated_client.get("/api/v1/emotions/", params={"limit": 2})
+    cursor = response.headers["X-Next-Cursor"]
+    authenticated_client.post(
+        "/api/v1/emotions/", json={"emotion_level": 3, "emotion_type": "sad"}
+    )
+    response = authenticated_client.get(
+        "/api/v1/emotions/", params={"limit": 2, "cursor": cursor}
+    )
+    assert [e["id"] for e in response.json()] == expected[2:4]
+
+
+def test_emotion_invalid_cursor(authenticated_client: TestClient):
+    """잘못된 커서는 400"""
+    response = authenticated_client.get(
+        "/api/v1/emotions/", params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+
+def test_bulk_create_emotions(authenticated_client: TestClient):
+    """감정 기록 일괄 생성: 잘못된 항목은 건너뛰고 나머지는 저장"""
+    items = [
+        {"emotion_level": 5, "emotion_type": "happy"},
+        {"emotion_level": 9, "emotion_type": "happy"},
+        {"emotion_level": 3, "emotion_type": "neutral"},
+        {"emotion_type": "unknown"},
+    ]
+    response = authenticated_client.post("/api/v1/emotions/bulk", json={"items": items})
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["index"] for item in data["created"]] == [0, 2]
+    assert [error["index"] for error in data["errors"]] == [1, 3]
+    assert data["errors"][0]["errors"][0]["loc"] == ["emotion_level"]
+
+    records = authenticated_client.get("/api/v1/emotions/").json()
+    assert {record["id"] for record in records} == {
+        item["id"] for item in data["created"]
+    }
+
+    # 롤업도 함께 갱신됨
+    stats = authenticated_client.get("/api/v1/emotions/stats/summary").json()
+    assert stats["total_records"] == 2
+    assert stats["average_level"] == 4.0
+
+
+def test_bulk_create_emotions_atomic(authenticated_client: TestClient):
+    """atomic=true이면 하나라도 잘못된 경우 아무것도 저장하지 않음"""
+    items = [
+        {"emotion_level": 5, "emotion_type": "happy"},
+        {"emotion_level": 0, "emotion_type": "happy"},
+    ]
+    response = authenticated_client.post(
+        "/api/v1/emotions/bulk", params={"atomic": True}, json={"items": items}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["index"] == 1
+    assert authenticated_client.get("/api/v1/emotions/").json() == []
+
+
+def test_bulk_create_emotions_limit(authenticated_client: TestClient):
+    """BULK_MAX_ITEMS를 넘는 요청은 거부"""
+    from app.core.config import get_settings
+
+    items = [{"emotion_level": 3, "emotion_type": "calm"}] * (
+        get_settings().BULK_MAX_ITEMS + 1
+    )
+    response = authenticated_client.post("/api/v1/emotions/bulk", json={"items": items})
+    assert response.status_code == 422
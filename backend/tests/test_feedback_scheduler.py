@@ -0,0 +1,345 @@
+import asyncio
+import json
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+from app.core.metrics import collect_metrics
+from app.models.emotion import EmotionRecord, EmotionType
+from app.models.feedback import AIFeedback, FeedbackJob, FeedbackJobStatus
+from app.models.user import User
+from app.services.feedback_scheduler import (
+    DailyFeedbackScheduler,
+    KeyRateLimiter,
+    feedback_window,
+    resolve_zone,
+    set_feedback_scheduler,
+)
+from app.services.openai_pool import OpenAIClientPool, set_openai_pool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+# 2024-01-15 12:30 UTC = 서울 21:30 (마감 지남), 뉴욕 07:30 (아직 전)
+NOW = datetime(2024, 1, 15, 12, 30)
+SEOUL_DAY = date(2024, 1, 15)
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    """스케줄러는 작업마다 세션을 따로 열므로 파일 DB 사용"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'scheduler.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def add_users(engine, timezone: str, count: int, settings=None, **fields):
+    created = datetime(2024, 1, 1)
+    with Session(engine) as session:
+        users = [
+            User(
+                email=f"{timezone}-{i}-{id(fields)}@example.com".lower(),
+                name=f"user{i}",
+                timezone=timezone,
+                hashed_password="x",
+                settings=json.dumps(
+                    settings
+                    if settings is not None
+                    else {"openai_api_key": f"sk-{timezone}-{i}"}
+                ),
+                created_at=created,
+                **fields,
+            )
+            for i in range(count)
+        ]
+        session.add_all(users)
+        session.commit()
+        return [user.id for user in users]
+
+
+def jobs(engine):
+    with Session(engine) as session:
+        return session.exec(
+            select(FeedbackJob).order_by(FeedbackJob.user_id, FeedbackJob.local_date)
+        ).all()
+
+
+def stub_builder(calls, fail_for=(), delay=0.0):
+    async def build(db, user, api_key, start, end):
+        calls.append((user.id, start, end))
+        if delay:
+            await asyncio.sleep(delay)
+        if user.id in fail_for:
+            raise RuntimeError("boom")
+        return AIFeedback(user_id=user.id, feedback_text="좋은 하루였어요")
+
+    return build
+
+
+def scheduler_for(engine, builder, **options):
+    options.setdefault("local_hour", 21)
+    options.setdefault("key_rate_per_minute", 0)
+    return DailyFeedbackScheduler(
+        session_factory=lambda: Session(engine), builder=builder, **options
+    )
+
+
+def test_feedback_window_ends_at_local_deadline():
+    """[전날 21시, 당일 21시) 현지 시각을 UTC로 변환"""
+    start, end = feedback_window(SEOUL_DAY, resolve_zone("Asia/Seoul"), 21)
+
+    assert start == datetime(2024, 1, 14, 12, 0)
+    assert end == datetime(2024, 1, 15, 12, 0)
+    assert resolve_zone("Not/AZone").key == "UTC"
+
+
+def test_jobs_created_only_for_due_timezones(file_engine):
+    """현지 마감 시각이 지난 시간대만 오늘 작업 생성 (전날 분은 보충)"""
+    seoul = add_users(file_engine, "Asia/Seoul", 3)
+    new_york = add_users(file_engine, "America/New_York", 2)
+    add_users(file_engine, "Asia/Seoul", 1, is_active=False)
+    scheduler = scheduler_for(file_engine, stub_builder([]))
+
+    created = asyncio.run(scheduler.create_due_jobs(NOW))
+
+    by_user = {}
+    for job in jobs(file_engine):
+        by_user.setdefault(job.user_id, []).append(job.local_date)
+    assert set(by_user) == set(seoul) | set(new_york)
+    for user_id in seoul:
+        assert by_user[user_id] == [SEOUL_DAY - timedelta(days=1), SEOUL_DAY]
+    for user_id in new_york:
+        assert by_user[user_id] == [date(2024, 1, 14)]
+    assert created == 3 * 2 + 2
+
+    # 다시 실행해도 중복 생성 없음 (새 스케줄러 인스턴스여도)
+    assert asyncio.run(scheduler.create_due_jobs(NOW)) == 0
+    assert asyncio.run(scheduler_for(file_engine, None).create_due_jobs(NOW)) == 0
+    assert len(jobs(file_engine)) == created
+
+
+def test_fanned_out_dates_are_pruned(file_engine):
+    """작업 생성 기록은 아직 확인하는 날짜(전날 이후)만 유지"""
+    add_users(file_engine, "Asia/Seoul", 1)
+    scheduler = scheduler_for(file_engine, stub_builder([]))
+
+    asyncio.run(scheduler.create_due_jobs(NOW))
+    assert scheduler._fanned_out == {
+        ("Asia/Seoul", SEOUL_DAY - timedelta(days=1)),
+        ("Asia/Seoul", SEOUL_DAY),
+    }
+
+    asyncio.run(scheduler.create_due_jobs(NOW + timedelta(days=3)))
+    assert scheduler._fanned_out == {
+        ("Asia/Seoul", SEOUL_DAY + timedelta(days=2)),
+        ("Asia/Seoul", SEOUL_DAY + timedelta(days=3)),
+    }
+
+
+def test_run_generates_feedback_for_local_day_and_does_not_repeat(file_engine):
+    """사용자 현지 하루 범위 데이터로 생성하고, 완료된 작업은 다시 돌지 않음"""
+    (user_id,) = add_users(file_engine, "Asia/Seoul", 1)
+    add_users(file_engine, "UTC", 1, settings={})  # API 키 없음 → 건너뜀
+    calls = []
+    scheduler = scheduler_for(file_engine, stub_builder(calls))
+
+    summary = asyncio.run(scheduler.run_once(NOW))
+
+    assert summary["created"] == 3
+    assert summary["processed"] == 3
+    assert summary["succeeded"] == 2
+    assert summary["skipped"] == 1
+    assert summary["failed"] == 0
+    assert (user_id, datetime(2024, 1, 14, 12), datetime(2024, 1, 15, 12)) in calls
+
+    with Session(file_engine) as session:
+        feedbacks = session.exec(select(AIFeedback)).all()
+        done = session.exec(
+            select(FeedbackJob).where(FeedbackJob.status == FeedbackJobStatus.DONE)
+        ).all()
+    assert len(feedbacks) == 2
+    assert {job.feedback_id for job in done} == {f.id for f in feedbacks}
+
+    calls.clear()
+    summary = asyncio.run(scheduler.run_once(NOW + timedelta(minutes=5)))
+    assert summary["processed"] == 0
+    assert calls == []
+
+
+def test_failed_jobs_are_retried_until_max_attempts(file_engine):
+    (user_id,) = add_users(file_engine, "UTC", 1)
+    calls = []
+    scheduler = scheduler_for(
+        file_engine, stub_builder(calls, fail_for={user_id}), max_attempts=2
+    )
+    now = datetime(2024, 1, 15, 22, 0)
+
+    first = asyncio.run(scheduler.run_once(now))
+    second = asyncio.run(scheduler.run_once(now))
+    third = asyncio.run(scheduler.run_once(now))
+
+    # 오늘 + 전날 작업이 각각 두 번씩 시도된 뒤 멈춤
+    assert first["failed"] == 2 and second["failed"] == 2
+    assert third["processed"] == 0
+    assert len(calls) == 4
+    for job in jobs(file_engine):
+        assert job.status == FeedbackJobStatus.FAILED
+        assert job.attempts == 2
+        assert job.error == "RuntimeError: boom"
+
+
+def test_stale_running_job_is_resumed_after_crash(file_engine):
+    """RUNNING으로 남은 작업(프로세스 중단)은 임대 시간이 지나면 다시 처리"""
+    (crashed, fresh) = add_users(file_engine, "UTC", 2)
+    now = datetime.utcnow()
+    today = now.date()
+    with Session(file_engine) as session:
+        for user_id, claimed_at in (
+            (crashed, now - timedelta(hours=1)),
+            (fresh, now - timedelta(seconds=5)),
+        ):
+            session.add(
+                FeedbackJob(
+                    user_id=user_id,
+                    local_date=today,
+                    due_at=now - timedelta(hours=2),
+                    status=FeedbackJobStatus.RUNNING,
+                    attempts=1,
+                    claimed_at=claimed_at,
+                )
+            )
+        session.commit()
+    calls = []
+    scheduler = scheduler_for(file_engine, stub_builder(calls), lease_seconds=600)
+
+    counts = asyncio.run(scheduler.process_due_jobs(now))
+
+    assert counts["succeeded"] == 1
+    assert [call[0] for call in calls] == [crashed]
+    status = {(job.user_id, job.local_date): job for job in jobs(file_engine)}
+    assert status[(crashed, today)].status == FeedbackJobStatus.DONE
+    assert status[(crashed, today)].attempts == 2
+    assert status[(fresh, today)].status == FeedbackJobStatus.RUNNING
+
+
+def test_global_concurrency_limit(file_engine):
+    add_users(file_engine, "UTC", 12)
+    active = {"now": 0, "max": 0}
+
+    async def build(db, user, api_key, start, end):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.02)
+        active["now"] -= 1
+        return AIFeedback(user_id=user.id, feedback_text="ok")
+
+    scheduler = scheduler_for(file_engine, build, max_concurrency=3, batch_size=5)
+    summary = asyncio.run(scheduler.run_once(datetime(2024, 1, 15, 22, 0)))
+
+    assert summary["succeeded"] == 24
+    assert active["max"] == 3
+
+
+def test_key_rate_limiter_spaces_requests_per_key():
+    limiter = KeyRateLimiter(rate_per_minute=600)  # 키당 0.1초 간격
+
+    async def main():
+        started = time.perf_counter()
+        await asyncio.gather(*(limiter.acquire("shared") for _ in range(3)))
+        shared = time.perf_counter() - started
+        started = time.perf_counter()
+        await asyncio.gather(*(limiter.acquire(f"key-{i}") for i in range(3)))
+        return shared, time.perf_counter() - started
+
+    shared, distinct = asyncio.run(main())
+
+    assert shared >= 0.19
+    assert distinct < 0.05
+    assert limiter.waited_seconds == pytest.approx(0.3, abs=0.05)
+
+
+def test_scheduler_uses_openai_pool_and_reports_metrics(
+    file_engine, fake_openai_server
+):
+    """기본 빌더는 사용자 키로 OpenAI 풀을 호출하고, 지표를 노출"""
+    (user_id,) = add_users(file_engine, "Asia/Seoul", 1)
+    with Session(file_engine) as session:
+        session.add(
+            EmotionRecord(
+                user_id=user_id,
+                emotion_level=7,
+                emotion_type=EmotionType.HAPPY,
+                recorded_at=datetime(2024, 1, 15, 3, 0),
+            )
+        )
+        session.commit()
+    set_openai_pool(OpenAIClientPool(base_url=fake_openai_server.base_url))
+    scheduler = scheduler_for(file_engine, None)
+    set_feedback_scheduler(scheduler)
+
+    async def main():
+        summary = await scheduler.create_due_jobs(NOW)
+        # 오늘 작업만 남김
+        with Session(file_engine) as session:
+            for job in session.exec(select(FeedbackJob)).all():
+                if job.local_date != SEOUL_DAY:
+                    session.delete(job)
+            session.commit()
+        counts = await scheduler.process_due_jobs(NOW)
+        return summary, counts
+
+    _, counts = asyncio.run(main())
+
+    assert counts["succeeded"] == 1
+    assert fake_openai_server.requests[0]["authorization"] == "Bearer sk-Asia/Seoul-0"
+    with Session(file_engine) as session:
+        feedback = session.exec(select(AIFeedback)).one()
+    assert feedback.feedback_text == "테스트 피드백"
+    assert json.loads(feedback.ai_metadata)["data_count"]["emotions"] == 1
+
+    metrics = collect_metrics()["feedback_scheduler"]
+    assert metrics["succeeded"] == 1
+    assert metrics["in_flight"] == 0
+
+
+def test_records_after_deadline_go_to_next_day_feedback(
+    file_engine, fake_openai_server
+):
+    """마감(21시) 이후 자정 전 기록은 다음 날 피드백에 포함되어 빠지지 않음"""
+    (user_id,) = add_users(file_engine, "Asia/Seoul", 1)
+    with Session(file_engine) as session:
+        for recorded_at in (
+            datetime(2024, 1, 14, 13, 0),  # 서울 1/14 22:00
+            datetime(2024, 1, 15, 14, 30),  # 서울 1/15 23:30
+        ):
+            session.add(
+                EmotionRecord(
+                    user_id=user_id,
+                    emotion_level=5,
+                    emotion_type=EmotionType.CALM,
+                    recorded_at=recorded_at,
+                )
+            )
+        session.commit()
+    set_openai_pool(OpenAIClientPool(base_url=fake_openai_server.base_url))
+    scheduler = scheduler_for(file_engine, None)
+
+    asyncio.run(scheduler.run_once(NOW))
+    asyncio.run(scheduler.run_once(NOW + timedelta(days=1)))
+
+    with Session(file_engine) as session:
+        counts = {
+            job.local_date: json.loads(feedback.ai_metadata)["data_count"]["emotions"]
+            for job, feedback in session.exec(
+                select(FeedbackJob, AIFeedback).join(
+                    AIFeedback, AIFeedback.id == FeedbackJob.feedback_id
+                )
+            ).all()
+        }
+    assert counts == {
+        SEOUL_DAY - timedelta(days=1): 0,
+        SEOUL_DAY: 1,
+        SEOUL_DAY + timedelta(days=1): 1,
+    }
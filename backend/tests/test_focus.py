@@ -0,0 +1,135 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+
+def create_completed_session(
+    client: TestClient,
+    start_time: datetime,
+    minutes: int,
+    session_type: str,
+    rating=None,
+):
+    response = client.post(
+        "/api/v1/focus",
+        json={
+            "start_time": start_time.isoformat(),
+            "duration_minutes": minutes,
+            "session_type": session_type,
+        },
+    )
+    assert response.status_code == 200
+    session_id = response.json()["id"]
+
+    response = client.put(
+        f"/api/v1/focus/{session_id}/end", json={"productivity_rating": rating}
+    )
+    assert response.status_code == 200
+
+
+def test_focus_stats(authenticated_client: TestClient):
+    """집중 세션 통계 조회 테스트"""
+    now = datetime.utcnow()
+    create_completed_session(authenticated_client, now, 25, "pomodoro", rating=4)
+    create_completed_session(authenticated_client, now, 50, "deep_work", rating=2)
+    create_completed_session(authenticated_client, now, 5, "break")
+
+    # 진행 중인 세션은 통계에서 제외
+    authenticated_client.post("/api/v1/focus", json={"duration_minutes": 25})
+
+    response = authenticated_client.get("/api/v1/focus/stats/summary")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_sessions"] == 3
+    assert data["total_minutes"] == 80
+    assert data["average_duration"] == 26.7
+    assert data["average_productivity"] == 3.0
+    assert "buckets" not in data
+
+
+def test_focus_stats_grouped(authenticated_client: TestClient):
+    """일/주/세션 타입별 집계 테스트"""
+    today = datetime.utcnow()
+    yesterday = today - timedelta(days=1)
+    create_completed_session(authenticated_client, yesterday, 25, "pomodoro", 5)
+    create_completed_session(authenticated_client, today, 25, "pomodoro", 3)
+    create_completed_session(authenticated_client, today, 60, "deep_work")
+
+    response = authenticated_client.get(
+        "/api/v1/focus/stats/summary", params={"group_by": "day"}
+    )
+    data = response.json()
+    assert data["group_by"] == "day"
+    assert [b["bucket"] for b in data["buckets"]] == [
+        yesterday.date().isoformat(),
+        today.date().isoformat(),
+    ]
+    assert data["buckets"][1]["total_minutes"] == 85
+    assert data["buckets"][1]["average_productivity"] == 3.0
+    assert data["buckets"][1]["minutes_by_type"] == {"pomodoro": 25, "deep_work": 60}
+
+    response = authenticated_client.get(
+        "/api/v1/focus/stats/summary", params={"group_by": "week"}
+    )
+    weeks = response.json()["buckets"]
+    assert sum(b["total_sessions"] for b in weeks) == 3
+    for bucket in weeks:
+        assert datetime.fromisoformat(bucket["bucket"]).weekday() == 0
+
+    response = authenticated_client.get(
+        "/api/v1/focus/stats/summary", params={"group_by": "session_type"}
+    )
+    by_type = {b["bucket"]: b for b in response.json()["buckets"]}
+    assert by_type["pomodoro"]["total_sessions"] == 2
+    assert by_type["pomodoro"]["average_productivity"] == 4.0
+    assert by_type["deep_work"]["total_minutes"] == 60
+
+
+def test_focus_stats_invalid_group_by(authenticated_client: TestClient):
+    """지원하지 않는 group_by 값 거부"""
+    response = authenticated_client.get(
+        "/api/v1/focus/stats/summary", params={"group_by": "month"}
+    )
+    assert response.status_code == 422
+
+
+def test_focus_cursor_with_wrong_value_types(authenticated_client: TestClient):
+    """형식은 맞지만 값 타입이 다른 커서도 400 (500이 아님)"""
+    for values in (["2024-01-01T00:00:00", 5], [None, None], [[1], {"a": 1}]):
+        cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+        response = authenticated_client.get("/api/v1/focus/", params={"cursor": cursor})
+        assert response.status_code == 400, values
+
+
+def test_bulk_create_focus_sessions(authenticated_client: TestClient):
+    """집중 세션 일괄 생성 후 종료된 세션만 통계에 반영"""
+    now = datetime.utcnow()
+    items = [
+        {
+            "start_time": now.isoformat(),
+            "end_time": (now + timedelta(minutes=25)).isoformat(),
+            "duration_minutes": 25,
+            "session_type": "pomodoro",
+            "productivity_rating": 4,
+        },
+        {
+            "start_time": now.isoformat(),
+            "end_time": (now + timedelta(minutes=50)).isoformat(),
+            "duration_minutes": 50,
+            "session_type": "deep_work",
+        },
+        {"duration_minutes": 25},
+        {"duration_minutes": -1},
+    ]
+    response = authenticated_client.post("/api/v1/focus/bulk", json={"items": items})
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["created"]) == 3
+    assert [error["index"] for error in data["errors"]] == [3]
+
+    stats = authenticated_client.get("/api/v1/focus/stats/summary").json()
+    assert stats["total_sessions"] == 2
+    assert stats["total_minutes"] == 75
+    assert stats["average_productivity"] == 4.0
@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# `import app.main` 누적 시간 예산 (FastAPI/pydantic/SQLAlchemy 포함)
+IMPORT_TIME_BUDGET_SECONDS = 3.0
+
+# 앱 시작 시 import 되면 안 되는 무거운 AI 의존성
+HEAVY_MODULES = ("openai", "transformers", "torch", "onnxruntime", "numpy")
+
+
+def run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=BACKEND_DIR,
+        # 개발용 DB 파일을 건드리지 않도록 인메모리 DB 사용
+        env={**os.environ, "DATABASE_URL": "sqlite://"},
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def parse_importtime(stderr: str):
+    """-X importtime 출력 → {모듈: 누적 마이크로초}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_app_import_time_budget():
+    """app.main import는 AI 의존성 없이 예산 안에 끝남"""
+    result = run_python("import app.main", "-X", "importtime")
+    assert result.returncode == 0, result.stderr
+    modules = parse_importtime(result.stderr)
+
+    imported_heavy = [name for name in HEAVY_MODULES if name in modules]
+    assert imported_heavy == []
+
+    seconds = modules["app.main"] / 1_000_000
+    print(f"import app.main: {seconds:.3f}s (budget {IMPORT_TIME_BUDGET_SECONDS}s)")
+    assert seconds < IMPORT_TIME_BUDGET_SECONDS
+
+
+def test_app_boots_without_ai_packages():
+    """openai/transformers/onnxruntime이 설치되지 않아도 앱이 시작되고 헬스 체크 응답"""
+    code = """
+import sys
+for name in ("openai", "transformers", "onnxruntime"):
+    sys.modules[name] = None  # import 시 ImportError
+
+from fastapi.testclient import TestClient
+from app.main import app
+
+with TestClient(app) as client:
+    data = client.get("/health").json()
+    assert data["ai_dependencies"] == {
+        "openai": False, "transformers": False, "onnxruntime": False
+    }, data
+
+from app.services.ai_providers import AIDependencyError, create_async_openai_client
+try:
+    create_async_openai_client("sk-test")
+except AIDependencyError:
+    print("ok")
+"""
+    result = run_python(code)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().endswith("ok")
@@ -0,0 +1,76 @@
+import asyncio
+import time
+import uuid
+
+import httpx
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.db.database import get_session
+from app.main import app
+
+
+def p99(samples):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+@pytest.fixture
+def file_db_app(tmp_path):
+    """요청마다 새 세션을 여는 파일 기반 DB (동시 요청 테스트용)"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'load.db'}", connect_args={"check_same_thread": False}
+    )
+    SQLModel.metadata.create_all(engine)
+
+    def get_session_override():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    yield app
+    app.dependency_overrides.clear()
+    engine.dispose()
+
+
+@pytest.mark.slow
+def test_health_p99_flat_during_login_storm(file_db_app):
+    """로그인 요청이 몰려도 /health 응답 지연은 그대로 유지"""
+    user = {
+        "email": f"load_{uuid.uuid4().hex[:8]}@example.com",
+        "password": "testpassword123",
+        "name": "Load Test",
+    }
+
+    async def measure_health(client, count):
+        samples = []
+        for _ in range(count):
+            start = time.perf_counter()
+            response = await client.get("/health")
+            samples.append(time.perf_counter() - start)
+            assert response.status_code == 200
+            await asyncio.sleep(0.005)
+        return samples
+
+    async def main():
+        async with httpx.AsyncClient(app=file_db_app, base_url="http://test") as client:
+            response = await client.post("/api/v1/auth/register", json=user)
+            assert response.status_code == 200
+
+            baseline = await measure_health(client, 50)
+
+            login = {"email": user["email"], "password": user["password"]}
+            storm = [
+                asyncio.create_task(client.post("/api/v1/auth/login", json=login))
+                for _ in range(24)
+            ]
+            under_load = await measure_health(client, 50)
+            responses = await asyncio.gather(*storm)
+
+        assert all(r.status_code == 200 for r in responses)
+        return baseline, under_load
+
+    baseline, under_load = asyncio.run(main())
+
+    # bcrypt 한 번(수백 ms)보다 훨씬 짧아야 이벤트 루프가 막히지 않은 것
+    assert p99(under_load) < max(5 * p99(baseline), 0.1)
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+from app import cli
+from app.models.emotion import EmotionRecord, EmotionType
+from app.models.stats import DailyUserStats
+from app.services.stats_service import rebuild_daily_stats
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+
+def rollup_rows(session: Session):
+    session.expire_all()
+    rows = session.exec(select(DailyUserStats).order_by(DailyUserStats.day)).all()
+    return [row.dict() for row in rows]
+
+
+def test_rollup_follows_record_changes(
+    authenticated_client: TestClient, session: Session
+):
+    """기록 생성/수정/삭제가 일간 롤업에 증분 반영됨"""
+    yesterday = (datetime.utcnow() - timedelta(days=1)).isoformat()
+
+    response = authenticated_client.post(
+        "/api/v1/emotions/",
+        json={"emotion_level": 2, "emotion_type": "sad", "recorded_at": yesterday},
+    )
+    emotion_id = response.json()["id"]
+    authenticated_client.post(
+        "/api/v1/emotions/", json={"emotion_level": 4, "emotion_type": "happy"}
+    )
+    authenticated_client.put(
+        f"/api/v1/emotions/{emotion_id}",
+        json={"emotion_level": 3, "emotion_type": "calm"},
+    )
+
+    response = authenticated_client.post(
+        "/api/v1/focus", json={"duration_minutes": 30, "session_type": "deep_work"}
+    )
+    authenticated_client.put(
+        f"/api/v1/focus/{response.json()['id']}/end", json={"productivity_rating": 4}
+    )
+
+    response = authenticated_client.post("/api/v1/todos/", json={"title": "done"})
+    todo_id = response.json()["id"]
+    authenticated_client.put(f"/api/v1/todos/{todo_id}", json={"completed": True})
+    response = authenticated_client.post("/api/v1/todos/", json={"title": "gone"})
+    authenticated_client.put(
+        f"/api/v1/todos/{response.json()['id']}", json={"completed": True}
+    )
+    authenticated_client.delete(f"/api/v1/todos/{response.json()['id']}")
+
+    incremental = rollup_rows(session)
+    assert len(incremental) == 2
+    assert incremental[0]["calm_count"] == 1
+    assert incremental[0]["sad_count"] == 0
+    assert incremental[0]["emotion_level_sum"] == 3
+    assert incremental[1]["happy_count"] == 1
+    assert incremental[1]["focus_minutes"] == 30
+    assert incremental[1]["deep_work_minutes"] == 30
+    assert incremental[1]["focus_rating_sum"] == 4
+
+    # 원본에서 다시 계산해도 같은 결과
+    rebuild_daily_stats(session)
+    assert rollup_rows(session) == incremental
+
+
+def test_rebuild_backfills_existing_records(
+    authenticated_client: TestClient, session: Session, monkeypatch
+):
+    """롤업 이전에 쌓인 기록은 rebuild-stats 명령으로 백필"""
+    user_id = authenticated_client.get("/api/v1/auth/me").json()["id"]
+    for level, emotion_type in ((1, EmotionType.ANXIOUS), (5, EmotionType.HAPPY)):
+        session.add(
+            EmotionRecord(
+                user_id=user_id, emotion_level=level, emotion_type=emotion_type
+            )
+        )
+    session.commit()
+
+    response = authenticated_client.get("/api/v1/emotions/stats/summary")
+    assert response.json()["total_records"] == 0
+
+    monkeypatch.setattr(cli, "engine", session.get_bind())
+    monkeypatch.setattr(cli, "prepare_database", lambda mode: None)
+    assert cli.main(["rebuild-stats"]) == 0
+
+    response = authenticated_client.get("/api/v1/emotions/stats/summary")
+    data = response.json()
+    assert data["total_records"] == 2
+    assert data["average_level"] == 3.0
+    assert data["emotion_distribution"] == {"anxious": 1, "happy": 1}
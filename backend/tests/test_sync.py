@@ -0,0 +1,51 @@
+from app.api.v1.endpoints import sync
+from fastapi.testclient import TestClient
+
+
+def test_sync_returns_deltas_since_watermark(
+    authenticated_client: TestClient, monkeypatch
+):
+    """워터마크 이후 생성/수정/삭제된 기록만 반환"""
+    monkeypatch.setattr(sync.settings, "SYNC_WATERMARK_LAG_SECONDS", 0)
+    client = authenticated_client
+
+    emotion = client.post(
+        "/api/v1/emotions", json={"emotion_level": 3, "emotion_type": "calm"}
+    ).json()
+    kept = client.post("/api/v1/todos", json={"title": "유지"}).json()
+    removed = client.post("/api/v1/todos", json={"title": "삭제 예정"}).json()
+
+    # 처음 동기화는 전체 스냅샷
+    full = client.get("/api/v1/sync/").json()
+    assert [e["id"] for e in full["emotions"]] == [emotion["id"]]
+    assert {t["id"] for t in full["todos"]} == {kept["id"], removed["id"]}
+    assert full["deleted"] == []
+
+    # 워터마크 이후 변경
+    created = client.post("/api/v1/todos", json={"title": "새 할 일"}).json()
+    client.put(f"/api/v1/emotions/{emotion['id']}", json={"emotion_level": 5})
+    client.delete(f"/api/v1/todos/{removed['id']}")
+
+    delta = client.get("/api/v1/sync/", params={"since": full["watermark"]}).json()
+    assert [t["id"] for t in delta["todos"]] == [created["id"]]
+    assert [(e["id"], e["emotion_level"]) for e in delta["emotions"]] == [
+        (emotion["id"], 5)
+    ]
+    assert delta["focus_sessions"] == [] and delta["feedbacks"] == []
+    assert [(d["entity"], d["record_id"]) for d in delta["deleted"]] == [
+        ("todo", removed["id"])
+    ]
+
+    # 변경이 없으면 빈 델타
+    empty = client.get("/api/v1/sync/", params={"since": delta["watermark"]}).json()
+    assert empty["emotions"] == empty["todos"] == empty["deleted"] == []
+
+
+def test_sync_watermark_lag(authenticated_client: TestClient):
+    """워터마크는 조회 시각보다 이르게 잡혀 직전 변경이 다음 동기화에도 포함"""
+    client = authenticated_client
+    client.post("/api/v1/todos", json={"title": "방금 만든 할 일"})
+
+    first = client.get("/api/v1/sync/").json()
+    again = client.get("/api/v1/sync/", params={"since": first["watermark"]}).json()
+    assert len(again["todos"]) == 1
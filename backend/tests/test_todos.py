@@ -1,4 +1,8 @@
+import uuid
+from datetime import datetime, timedelta
+
 import pytest
+from app.api.pagination import encode_cursor
 from fastapi.testclient import TestClient
 
 
@@ -48,3 +52,93 @@ def test_delete_todo(authenticated_client: TestClient):
     response = authenticated_client.get("/api/v1/todos")
     todos = response.json()
     assert not any(t["id"] == todo_id for t in todos)
+
+
+def test_todo_stats(authenticated_client: TestClient):
+    """할 일 통계 조회 테스트"""
+    past = (datetime.utcnow() - timedelta(days=1)).isoformat()
+    future = (datetime.utcnow() + timedelta(days=1)).isoformat()
+
+    todos = [
+        {"title": "overdue", "due_date": past},
+        {"title": "upcoming", "due_date": future},
+        {"title": "no due date"},
+        {"title": "done late", "due_date": past},
+    ]
+    ids = []
+    for todo in todos:
+        response = authenticated_client.post("/api/v1/todos/", json=todo)
+        ids.append(response.json()["id"])
+    authenticated_client.put(f"/api/v1/todos/{ids[3]}", json={"completed": True})
+
+    response = authenticated_client.get("/api/v1/todos/stats/summary")
+    assert response.status_code == 200
+    assert response.json() == {
+        "total": 4,
+        "completed": 1,
+        "pending": 3,
+        "overdue": 1,
+        "completion_rate": 25.0,
+    }
+
+
+def test_todo_cursor_pagination(authenticated_client: TestClient):
+    """정렬 방향이 섞인 할 일 목록도 커서로 끝까지 조회"""
+    for i in range(7):
+        response = authenticated_client.post(
+            "/api/v1/todos/", json={"title": f"todo {i}", "priority": i % 3 + 1}
+        )
+        if i % 2:
+            authenticated_client.put(
+                f"/api/v1/todos/{response.json()['id']}", json={"completed": True}
+            )
+
+    expected = [t["id"] for t in authenticated_client.get("/api/v1/todos/").json()]
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = authenticated_client.get("/api/v1/todos/", params=params)
+        seen += [t["id"] for t in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert seen == expected
+
+
+def test_todo_cursor_rejects_string_boolean(authenticated_client: TestClient):
+    """완료 여부 커서 값은 JSON 불리언만 허용 ("false" 문자열은 400)"""
+    values = ["false", 1, datetime.utcnow().isoformat(), str(uuid.uuid4())]
+    response = authenticated_client.get(
+        "/api/v1/todos/", params={"cursor": encode_cursor(values)}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+    values[0] = False
+    response = authenticated_client.get(
+        "/api/v1/todos/", params={"cursor": encode_cursor(values)}
+    )
+    assert response.status_code == 200
+
+
+def test_bulk_create_todos(authenticated_client: TestClient):
+    """할 일 일괄 생성"""
+    items = [
+        {"title": "첫 번째", "priority": 3},
+        {"title": "완료된 일", "completed": True},
+        {"priority": 2},
+    ]
+    response = authenticated_client.post("/api/v1/todos/bulk", json={"items": items})
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["index"] for item in data["created"]] == [0, 1]
+    assert data["errors"][0]["index"] == 2
+
+    stats = authenticated_client.get("/api/v1/todos/stats/summary").json()
+    assert stats["total"] == 2
+    assert stats["completed"] == 1
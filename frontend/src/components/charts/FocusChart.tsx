@@ -1,51 +1,38 @@
-/* eslint-disable @typescript-eslint/no-explicit-any */
 import { useQuery } from "@tanstack/react-query";
 import { Bar } from 'react-chartjs-2';
 import { focusService } from "@/services/focus.service";
-import { format, subDays, startOfDay, endOfDay } from 'date-fns';
+import { format, parseISO } from 'date-fns';
 
 interface FocusChartProps {
   period: number;
 }
 
 export function FocusChart({ period }: FocusChartProps) {
-  const { data: sessions = [] } = useQuery({
-    queryKey: ['focusSessions', period],
-    queryFn: () => focusService.getSessions(),
+  // 날짜별 집계는 서버에서 계산 (세션 목록 전체를 받지 않음)
+  const { data: stats } = useQuery({
+    queryKey: ['focusStats', period, 'day'],
+    queryFn: () => focusService.getGroupedFocusStats(period, 'day'),
   });
 
-  // 날짜별 집중 시간 합계
-  const dailyFocus = sessions
-    .filter(session =>
-      new Date(session.start_time) >= subDays(new Date(), period)
-    )
-    .reduce((acc: any, session) => {
-      const date = format(new Date(session.start_time), 'MM/dd');
-      if (!acc[date]) {
-        acc[date] = { pomodoro: 0, deep_work: 0, break: 0 };
-      }
-      acc[date][session.session_type] += session.duration_minutes;
-      return acc;
-    }, {});
-  
-  const dates = Object.keys(dailyFocus).sort();
+  const buckets = stats?.buckets ?? [];
+  const dates = buckets.map(bucket => format(parseISO(bucket.bucket), 'MM/dd'));
 
   const data = {
     labels: dates,
     datasets: [
       {
         label: '포모도로',
-        data: dates.map(date => dailyFocus[date]?.pomodoro || 0),
+        data: buckets.map(bucket => bucket.minutes_by_type.pomodoro || 0),
         backgroundColor: '#EF4444',
       },
       {
         label: 'Deep Work',
-        data: dates.map(date => dailyFocus[date]?.deep_work || 0),
+        data: buckets.map(bucket => bucket.minutes_by_type.deep_work || 0),
         backgroundColor: '#8B5CF6',
       },
       {
         label: '휴식',
-        data: dates.map(date => dailyFocus[date]?.break || 0),
+        data: buckets.map(bucket => bucket.minutes_by_type.break || 0),
         backgroundColor: '#10B981',
       },
     ],
@@ -72,23 +59,10 @@ export function FocusChart({ period }: FocusChartProps) {
     },
   };
 
-  // 생산성 점수 차트
-  const productivityData = sessions
-    .filter(session => session.productivity_rating)
-    .reduce((acc: any, session) => {
-      const date = format(new Date(session.start_time), 'MM/dd');
-      if (!acc[date]) {
-        acc[date] = { total: 0, count: 0 };
-      }
-      acc[date].total += session.productivity_rating;
-      acc[date].count += 1;
-      return acc;
-    }, {});
-  
-  const productivityDates = Object.keys(productivityData).sort();
-  const productivityAverages = productivityDates.map(date =>
-    (productivityData[date].total / productivityData[date].count).toFixed(2)
-  );
+  // 생산성 점수 차트 (평점이 있는 날만)
+  const ratedBuckets = buckets.filter(bucket => bucket.average_productivity > 0);
+  const productivityDates = ratedBuckets.map(bucket => format(parseISO(bucket.bucket), 'MM/dd'));
+  const productivityAverages = ratedBuckets.map(bucket => bucket.average_productivity);
 
   const productivityChartData = {
     labels: productivityDates,
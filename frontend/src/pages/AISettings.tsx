@@ -2,6 +2,7 @@
 import { useState } from "react";
 import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
 import apiClient from "@/lib/api-client";
+import { aiService } from "@/services/ai.service";
 import { AlertCircle, Key, Bot, CheckCircle, XCircle } from "lucide-react";
 
 interface AISettings {
@@ -52,18 +53,18 @@ export function AISettings() {
     },
   });
 
-  // 피드백 생성
+  // 피드백 생성 (SSE 스트림으로 생성되는 대로 표시)
+  const [streamedFeedback, setStreamedFeedback] = useState('');
   const generateFeedbackMutation = useMutation({
-    mutationFn: async () => {
-      const response = await apiClient.post('/v1/ai/generate-feedback');
-      return response.data;
-    },
-    onSuccess: (data) => {
-      alert('피드백이 생성되었습니다!');
-      console.log(data.feedback);
+    mutationFn: async (force: boolean = false) => {
+      setStreamedFeedback('');
+      return aiService.streamFeedback({
+        force,
+        onDelta: (text) => setStreamedFeedback((current) => current + text),
+      });
     },
     onError: (error: any) => {
-      alert(error.response?.data?.detail || '피드백 생성에 실패했습니다');
+      alert(error.message || '피드백 생성에 실패했습니다');
     },
   });
 
@@ -226,7 +227,7 @@ export function AISettings() {
 
           <div>
             <button
-              onClick={() => generateFeedbackMutation.mutate()}
+              onClick={() => generateFeedbackMutation.mutate(false)}
               disabled={!settings?.openai_api_key || generateFeedbackMutation.isPending}
               className="px-6 py-2 bg-green-500 text-white rounded-md hover:bg-green-600 disabled:opacity-50"
             >
@@ -234,6 +235,16 @@ export function AISettings() {
                 ? '생성 중...'
                 : '지금 피드백 생성하기'}
             </button>
+            {streamedFeedback && (
+              <p className="mt-4 whitespace-pre-wrap text-gray-700">
+                {streamedFeedback}
+                {generateFeedbackMutation.data?.cached && (
+                  <span className="block text-xs text-gray-500 mt-2">
+                    변경된 기록이 없어 최근 피드백을 불러왔습니다.
+                  </span>
+                )}
+              </p>
+            )}
             {!settings?.openai_api_key && (
               <p className="text-sm text-red-600 mt-2">
                 피드백을 생성하려면 먼저 OpenAI API 키를 설정해주세요.
@@ -0,0 +1,86 @@
+import { isAxiosError } from "axios";
+import apiClient from "@/lib/api-client";
+
+export interface FeedbackStreamDone {
+  feedback_id: string;
+  generated_at: string;
+  cached: boolean;
+}
+
+export interface FeedbackStreamOptions {
+  feedbackType?: string;
+  force?: boolean;
+  signal?: AbortSignal;
+  onDelta: (text: string) => void;
+}
+
+interface StreamEvent {
+  event?: string;
+  data: Record<string, unknown>;
+}
+
+// SSE 블록 하나 해석 (data가 JSON이 아니면 null — 해당 블록만 건너뜀)
+function parseEvent(block: string): StreamEvent | null {
+  const event = block.match(/^event: (.*)$/m)?.[1];
+  try {
+    const data = JSON.parse(block.match(/^data: (.*)$/m)?.[1] ?? '{}');
+    if (data && typeof data === 'object') return { event, data };
+  } catch {
+    // 아래에서 경고 후 건너뜀
+  }
+  console.warn('Skipping malformed feedback stream event', block);
+  return null;
+}
+
+// stream 응답의 오류 본문에서 detail 추출
+async function streamErrorDetail(error: unknown): Promise<string | undefined> {
+  if (!isAxiosError(error)) return undefined;
+  const data = error.response?.data;
+  if (data instanceof ReadableStream) {
+    const body = await new Response(data).json().catch(() => null);
+    return body?.detail;
+  }
+  return data?.detail;
+}
+
+class AIService {
+  // EventSource는 Authorization 헤더를 보낼 수 없어 axios fetch 어댑터의 스트림으로 SSE를 읽음.
+  // apiClient를 거치므로 토큰 첨부, 401 시 토큰 갱신/재로그인 처리가 다른 요청과 같음.
+  // signal로 중단하면 서버도 OpenAI 요청을 멈추고 저장하지 않음.
+  async streamFeedback({ feedbackType = 'daily_summary', force = false, signal, onDelta }: FeedbackStreamOptions): Promise<FeedbackStreamDone> {
+    let stream: ReadableStream<Uint8Array>;
+    try {
+      const response = await apiClient.get<ReadableStream<Uint8Array>>('/v1/ai/generate-feedback/stream', {
+        params: { feedback_type: feedbackType, force },
+        adapter: 'fetch',
+        responseType: 'stream',
+        signal,
+      });
+      stream = response.data;
+    } catch (error) {
+      if (signal?.aborted) throw error;
+      throw new Error((await streamErrorDetail(error)) || '피드백 생성에 실패했습니다');
+    }
+
+    const reader = stream.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += value;
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const parsed = parseEvent(buffer.slice(0, boundary));
+        buffer = buffer.slice(boundary + 2);
+        if (!parsed) continue;
+        const { event, data } = parsed;
+        if (event === 'delta' && typeof data.text === 'string') onDelta(data.text);
+        else if (event === 'done') return data as unknown as FeedbackStreamDone;
+        else if (event === 'error') throw new Error(String(data.detail ?? '피드백 생성에 실패했습니다'));
+      }
+    }
+    throw new Error('피드백 스트림이 중간에 끊겼습니다');
+  }
+}
+
+export const aiService = new AIService();
@@ -0,0 +1,9 @@
+export interface BulkItemError {
+  index: number;
+  errors: { loc: (string | number)[]; msg: string; type: string }[];
+}
+
+export interface BulkCreateResult {
+  created: { index: number; id: string }[];
+  errors: BulkItemError[];
+}
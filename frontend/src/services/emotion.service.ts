@@ -1,4 +1,5 @@
 import apiClient from "@/lib/api-client";
+import type { BulkCreateResult } from "./bulk";
 
 export type EmotionType = 'happy' | 'sad' | 'anxious' | 'calm' | 'excited' | 'angry' | 'neutral';
 
@@ -34,6 +35,13 @@ class EmotionService {
     return response.data;
   }
 
+  async createEmotionsBulk(items: CreateEmotionRecord[], atomic = false): Promise<BulkCreateResult> {
+    const response = await apiClient.post<BulkCreateResult>('/v1/emotions/bulk', { items }, {
+      params: { atomic }
+    });
+    return response.data;
+  }
+
   async getEmotions(params?: {
     skip?: number;
     limit?: number;
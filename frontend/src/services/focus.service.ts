@@ -32,6 +32,21 @@ export interface FocusStats {
   period_days: number;
 }
 
+export type FocusStatsGroupBy = 'day' | 'week' | 'session_type';
+
+export interface FocusStatsBucket {
+  bucket: string;
+  total_sessions: number;
+  total_minutes: number;
+  average_productivity: number;
+  minutes_by_type: Partial<Record<SessionType, number>>;
+}
+
+export interface GroupedFocusStats extends FocusStats {
+  group_by: FocusStatsGroupBy;
+  buckets: FocusStatsBucket[];
+}
+
 class FocusService {
   async startSession(data?: CreateFocusSession): Promise<FocusSession> {
     const response = await apiClient.post<FocusSession>('/v1/focus', {
@@ -63,6 +78,13 @@ class FocusService {
     });
     return response.data;
   }
+
+  async getGroupedFocusStats(days: number, groupBy: FocusStatsGroupBy): Promise<GroupedFocusStats> {
+    const response = await apiClient.get<GroupedFocusStats>('/v1/focus/stats/summary', {
+      params: { days, group_by: groupBy }
+    });
+    return response.data;
+  }
 }
 
 export const focusService = new FocusService();
\ No newline at end of file
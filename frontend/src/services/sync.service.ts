@@ -0,0 +1,41 @@
+import apiClient from "@/lib/api-client";
+import type { EmotionRecord } from "./emotion.service";
+import type { FocusSession } from "./focus.service";
+import type { TodoItem } from "./todo.service";
+
+export interface AIFeedback {
+  id: string;
+  user_id: string;
+  feedback_text: string;
+  feedback_type: string;
+  sentiment_score?: number;
+  ai_metadata?: string;
+  created_at: string;
+}
+
+export interface DeletedRecord {
+  entity: 'emotion' | 'focus_session' | 'todo' | 'feedback';
+  record_id: string;
+  deleted_at: string;
+}
+
+export interface SyncChanges {
+  watermark: string;
+  emotions: EmotionRecord[];
+  focus_sessions: FocusSession[];
+  todos: TodoItem[];
+  feedbacks: AIFeedback[];
+  deleted: DeletedRecord[];
+}
+
+class SyncService {
+  // since 없이 호출하면 전체 스냅샷, 이후에는 받은 watermark를 그대로 전달
+  async getChanges(since?: string): Promise<SyncChanges> {
+    const response = await apiClient.get<SyncChanges>('/v1/sync', {
+      params: since ? { since } : undefined
+    });
+    return response.data;
+  }
+}
+
+export const syncService = new SyncService();
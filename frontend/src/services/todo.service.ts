@@ -1,4 +1,5 @@
 import apiClient from "@/lib/api-client";
+import type { BulkCreateResult } from "./bulk";
 
 export interface TodoItem {
   id: string;
@@ -41,6 +42,13 @@ class TodoService {
     return response.data;
   }
 
+  async createTodosBulk(items: CreateTodoItem[], atomic = false): Promise<BulkCreateResult> {
+    const response = await apiClient.post<BulkCreateResult>('/v1/todos/bulk', { items }, {
+      params: { atomic }
+    });
+    return response.data;
+  }
+
   async getTodos(params?: { completed?: boolean }): Promise<TodoItem[]> {
     const response = await apiClient.get<TodoItem[]>('/v1/todos', { params });
     return response.data;